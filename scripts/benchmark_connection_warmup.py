@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+"""
+Measure the effect of connection warm-up on the time to a command's first response.
+
+Each trial models a command which requires Transfer: connections are optionally
+warmed when the command is resolved, then the remaining startup work (parsing,
+login checks, building the client) is simulated with a delay, and finally the first
+request is sent. The time from command resolution to the first response is reported
+with and without warm-up.
+
+By default, requests go to a local server which delays each new connection, to
+stand in for DNS resolution and the TCP and TLS handshakes. Use --url to send
+requests to a real service instead.
+
+usage:
+    python scripts/benchmark_connection_warmup.py --trials 20
+    python scripts/benchmark_connection_warmup.py --url https://transfer.api.globus.org/
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import http.server
+import os
+import statistics
+import threading
+import time
+import typing as t
+
+import requests
+
+from globus_cli.login_manager.connection_pool import (
+    SharedConnectionPool,
+    adopt_warm_pool,
+    warm_connections,
+)
+
+
+class _SlowConnectHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connect_delay = 0.0
+
+    def setup(self) -> None:
+        time.sleep(self.connect_delay)
+        super().setup()
+
+    def do_GET(self) -> None:
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: t.Any) -> None:
+        pass
+
+
+@contextlib.contextmanager
+def _local_server(connect_delay: float) -> t.Iterator[str]:
+    handler = type("Handler", (_SlowConnectHandler,), {"connect_delay": connect_delay})
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        host, port = server.server_address[:2]
+        yield f"http://{host!s}:{port}/"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _trial(url: str, warm: bool, startup_delay: float) -> float:
+    start = time.perf_counter()
+    if warm:
+        warm_connections(["transfer"])
+    time.sleep(startup_delay)
+
+    pool = adopt_warm_pool() or SharedConnectionPool()
+    transport = pool.make_transport()
+    transport.session.send(requests.Request("GET", url).prepare(), verify=True)
+    elapsed = time.perf_counter() - start
+    pool.close()
+    return elapsed
+
+
+def run(url: str, trials: int, startup_delay: float) -> None:
+    os.environ["GLOBUS_SDK_SERVICE_URL_TRANSFER"] = url
+    # the first request pays for imports and the like; leave it out of the results
+    _trial(url, False, 0)
+
+    print(f"url={url} startup={startup_delay * 1000:.0f}ms trials={trials}")
+    for warm in (False, True):
+        durations = [_trial(url, warm, startup_delay) for _ in range(trials)]
+        print(
+            f"  warm-up {'on ' if warm else 'off'}: "
+            f"median {statistics.median(durations) * 1000:.1f}ms, "
+            f"min {min(durations) * 1000:.1f}ms, "
+            f"max {max(durations) * 1000:.1f}ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--trials", type=int, default=20)
+    parser.add_argument(
+        "--url", help="send requests to this URL, rather than to a local server"
+    )
+    parser.add_argument(
+        "--connect-delay-ms",
+        type=float,
+        default=60,
+        help="the delay for new connections to the local server (default: 60)",
+    )
+    parser.add_argument(
+        "--startup-ms",
+        type=float,
+        default=40,
+        help="the simulated startup work after resolving the command (default: 40)",
+    )
+    args = parser.parse_args()
+
+    startup_delay = args.startup_ms / 1000
+    if args.url:
+        run(args.url, args.trials, startup_delay)
+    else:
+        with _local_server(args.connect_delay_ms / 1000) as url:
+            run(url, args.trials, startup_delay)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,449 @@
+#!/usr/bin/env python
+"""
+Measure the startup cost of the CLI, and check it against budgets.
+
+Each scenario runs ``globus`` in a fresh process, with an empty home directory.
+Scenarios cover ``globus --help``, the help of every command group, shell
+completion, and some representative commands, which run against a local mock of
+the Globus APIs using a client login.
+
+For each scenario, the wall time is measured over several runs, and one more run
+with ``python -X importtime`` counts the modules imported and the time spent
+importing them. Both are checked against the budgets in this script, and the
+script fails if any budget is exceeded.
+
+Wall times depend on the machine, so their budgets can be scaled with
+``--time-scale`` (e.g. for slow CI runners). Module budgets do not depend on the
+machine, and are the more reliable check. When a change makes startup slower on
+purpose, update the budgets here, in the same change.
+
+usage:
+    python scripts/benchmark_startup.py
+    python scripts/benchmark_startup.py --only 'help:*' --runs 10
+    python scripts/benchmark_startup.py --report startup.json --time-scale 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import dataclasses
+import fnmatch
+import http.server
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import typing as t
+import urllib.parse
+
+from globus_cli.command_manifest import load_manifest
+
+ENDPOINT_ID = "00000000-0000-0000-0000-000000000001"
+CLIENT_ID = "00000000-0000-0000-0000-000000000002"
+
+
+@dataclasses.dataclass(frozen=True)
+class Budget:
+    # the median wall time, in milliseconds, before scaling with --time-scale
+    wall_ms: float
+    # the number of modules imported
+    modules: int
+    # modules which must not be imported
+    forbidden_modules: tuple[str, ...] = ()
+
+
+# completion and help must not import the SDK's transport, for which 'requests' is
+# a proxy (see tests/unit/test_lazy_sdk_import.py), nor the libraries used for
+# logins
+_LIGHT_MODULES = ("requests", "jwt", "cryptography")
+
+# the default budget for each kind of scenario
+KIND_BUDGETS = {
+    "help": Budget(wall_ms=600, modules=420, forbidden_modules=_LIGHT_MODULES),
+    "completion": Budget(wall_ms=600, modules=420, forbidden_modules=_LIGHT_MODULES),
+    "command": Budget(wall_ms=1000, modules=650),
+}
+
+# some groups contain commands which import parts of the SDK when they are loaded
+_SDK_HELP_BUDGET = Budget(wall_ms=750, modules=650)
+_FLOWS_HELP_BUDGET = Budget(wall_ms=600, modules=520, forbidden_modules=("requests",))
+
+# budgets for specific scenarios, which replace the defaults for their kind
+SCENARIO_BUDGETS: dict[str, Budget] = {
+    "help: globus --help": _SDK_HELP_BUDGET,
+    "help: globus collection create --help": _SDK_HELP_BUDGET,
+    "help: globus endpoint user-credential create --help": _SDK_HELP_BUDGET,
+    "help: globus gcs collection create --help": _SDK_HELP_BUDGET,
+    "help: globus gcs user-credential create --help": _SDK_HELP_BUDGET,
+    "help: globus flows --help": _FLOWS_HELP_BUDGET,
+    "help: globus flows registered-api --help": _FLOWS_HELP_BUDGET,
+    "help: globus flows run --help": _FLOWS_HELP_BUDGET,
+    # completing IDs reads the local index of endpoints, which uses sqlite3
+    "completion: 'globus endpoint show '": Budget(
+        wall_ms=600, modules=450, forbidden_modules=_LIGHT_MODULES
+    ),
+}
+
+
+@dataclasses.dataclass(frozen=True)
+class Scenario:
+    name: str
+    kind: str
+    args: tuple[str, ...]
+    env: tuple[tuple[str, str], ...] = ()
+
+    @property
+    def budget(self) -> Budget:
+        return SCENARIO_BUDGETS.get(self.name, KIND_BUDGETS[self.kind])
+
+
+def _help_scenarios() -> list[Scenario]:
+    scenarios = [Scenario("help: globus --help", "help", ("--help",))]
+
+    manifest = load_manifest()
+    if manifest is None:
+        raise RuntimeError("the command manifest is missing")
+
+    def add_groups(entry: dict[str, t.Any], path: tuple[str, ...]) -> None:
+        for name, subentry in entry.get("commands", {}).items():
+            if "commands" not in subentry or subentry["hidden"]:
+                continue
+            group_path = path + (name,)
+            scenarios.append(
+                Scenario(
+                    f"help: globus {' '.join(group_path)} --help",
+                    "help",
+                    group_path + ("--help",),
+                )
+            )
+            add_groups(subentry, group_path)
+
+    add_groups(manifest, ())
+    return scenarios
+
+
+def _completion_scenario(line: str) -> Scenario:
+    words = line.split(" ")
+    return Scenario(
+        f"completion: {line!r}",
+        "completion",
+        (),
+        (
+            ("_GLOBUS_COMPLETE", "bash_complete"),
+            ("COMP_WORDS", line),
+            ("COMP_CWORD", str(len(words) - 1)),
+        ),
+    )
+
+
+def get_scenarios() -> list[Scenario]:
+    return [
+        *_help_scenarios(),
+        _completion_scenario("globus "),
+        _completion_scenario("globus endpoint "),
+        _completion_scenario("globus transfer --"),
+        _completion_scenario("globus endpoint show "),
+        Scenario("command: globus task list", "command", ("task", "list")),
+        Scenario(
+            "command: globus endpoint show",
+            "command",
+            ("endpoint", "show", ENDPOINT_ID),
+        ),
+        Scenario("command: globus bookmark list", "command", ("bookmark", "list")),
+    ]
+
+
+class _MockAPIHandler(http.server.BaseHTTPRequestHandler):
+    """
+    A minimal mock of Globus Auth and Transfer, which serves just enough for the
+    representative commands.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    _GET_RESPONSES: dict[str, dict[str, t.Any]] = {
+        "/v0.10/task_list": {
+            "DATA_TYPE": "task_list",
+            "DATA": [],
+            "length": 0,
+            "limit": 1000,
+            "offset": 0,
+            "total": 0,
+        },
+        f"/v0.10/endpoint/{ENDPOINT_ID}": {
+            "DATA_TYPE": "endpoint",
+            "id": ENDPOINT_ID,
+            "display_name": "Benchmark Endpoint",
+            "canonical_name": None,
+            "entity_type": "GCSv5_endpoint",
+            "gcs_manager_url": "https://abc.def.data.globus.org",
+            "is_globus_connect": False,
+            "owner_string": "user@example.org",
+        },
+        "/v0.10/bookmark_list": {"DATA_TYPE": "bookmark_list", "DATA": []},
+    }
+
+    def _send_json(self, data: dict[str, t.Any], status: int = 200) -> None:
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        form = urllib.parse.parse_qs(self.rfile.read(length).decode())
+        if self.path != "/v2/oauth2/token":
+            self._send_json({"code": "NotFound"}, status=404)
+            return
+        # grant every requested scope, for every service
+        scope = form.get("scope", [""])[0]
+        tokens = [
+            {
+                "access_token": f"{resource_server}-token",
+                "scope": scope,
+                "resource_server": resource_server,
+                "expires_in": 3600,
+                "token_type": "Bearer",
+            }
+            for resource_server in ("transfer.api.globus.org", "auth.globus.org")
+        ]
+        self._send_json({**tokens[0], "other_tokens": tokens[1:]})
+
+    def do_GET(self) -> None:
+        path = urllib.parse.urlparse(self.path).path
+        if path in self._GET_RESPONSES:
+            self._send_json(self._GET_RESPONSES[path])
+        else:
+            self._send_json({"code": "NotFound"}, status=404)
+
+    def log_message(self, *args: t.Any) -> None:
+        pass
+
+
+@contextlib.contextmanager
+def _mock_api() -> t.Iterator[str]:
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _MockAPIHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        host, port = server.server_address[:2]
+        yield f"http://{host!s}:{port}/"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _base_env(home: str, api_url: str) -> dict[str, str]:
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if not key.startswith(("GLOBUS_", "_GLOBUS_", "COMP_"))
+    }
+    env.update(
+        HOME=home,
+        # the data dir is under the home dir, but on Windows it is not
+        LOCALAPPDATA=home,
+        GLOBUS_CLI_DAEMON="0",
+        GLOBUS_CLI_CLIENT_ID=CLIENT_ID,
+        GLOBUS_CLI_CLIENT_SECRET="benchmark-secret",
+        GLOBUS_SDK_SERVICE_URL_AUTH=api_url,
+        GLOBUS_SDK_SERVICE_URL_TRANSFER=api_url,
+    )
+    return env
+
+
+# the equivalent of the 'globus' console script, which is not necessarily installed
+# for the interpreter running this script
+_CONSOLE_SCRIPT = (
+    "import sys; sys.argv[0] = 'globus'; "
+    "from globus_cli.entrypoint import main; main()"
+)
+
+
+def _run(
+    scenario: Scenario, env: dict[str, str], *, importtime: bool = False
+) -> tuple[float, str]:
+    cmd = [sys.executable]
+    if importtime:
+        cmd += ["-X", "importtime"]
+    cmd += ["-c", _CONSOLE_SCRIPT, *scenario.args]
+    start = time.perf_counter()
+    proc = subprocess.run(
+        cmd,
+        env={**env, **dict(scenario.env)},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    elapsed = time.perf_counter() - start
+    if proc.returncode != 0:
+        errors = [
+            line
+            for line in proc.stderr.splitlines()
+            if not line.startswith("import time:")
+        ]
+        raise RuntimeError(
+            f"{scenario.name} failed with exit status {proc.returncode}:\n"
+            + "\n".join(errors)
+        )
+    return elapsed, proc.stderr
+
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, float, float, int]]:
+    """
+    Parse the output of ``python -X importtime``.
+
+    :returns: (module, self time in ms, cumulative time in ms, depth) for each
+        imported module
+    """
+    imports = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            imports.append(
+                (
+                    module,
+                    int(self_us) / 1000,
+                    int(cumulative_us) / 1000,
+                    (len(indent) - 1) // 2,
+                )
+            )
+    return imports
+
+
+def measure(
+    scenario: Scenario, env: dict[str, str], runs: int, time_scale: float
+) -> dict[str, t.Any]:
+    # the first run may pay for filling disk caches and the like
+    _run(scenario, env)
+    wall_ms = [_run(scenario, env)[0] * 1000 for _ in range(runs)]
+    imports = parse_importtime(_run(scenario, env, importtime=True)[1])
+    modules = {module for module, *_ in imports}
+
+    budget = scenario.budget
+    violations = []
+    median_ms = statistics.median(wall_ms)
+    if median_ms > budget.wall_ms * time_scale:
+        violations.append(
+            f"median wall time {median_ms:.0f}ms exceeds "
+            f"{budget.wall_ms * time_scale:.0f}ms"
+        )
+    if len(modules) > budget.modules:
+        violations.append(
+            f"imported {len(modules)} modules, more than {budget.modules}"
+        )
+    for forbidden in budget.forbidden_modules:
+        if forbidden in modules:
+            violations.append(f"imported forbidden module {forbidden!r}")
+
+    # the imports which are directly responsible for the most time
+    top_level = sorted((imp for imp in imports if imp[3] == 0), key=lambda imp: -imp[2])
+    return {
+        "name": scenario.name,
+        "kind": scenario.kind,
+        "args": list(scenario.args),
+        "wall_ms": {
+            "median": round(median_ms, 1),
+            "min": round(min(wall_ms), 1),
+            "max": round(max(wall_ms), 1),
+        },
+        "modules": len(modules),
+        "import_ms": round(sum(imp[1] for imp in imports), 1),
+        "slowest_imports": [
+            {"module": module, "cumulative_ms": round(cumulative_ms, 1)}
+            for module, _, cumulative_ms, _ in top_level[:5]
+        ],
+        "budget": {
+            "wall_ms": budget.wall_ms * time_scale,
+            "modules": budget.modules,
+            "forbidden_modules": list(budget.forbidden_modules),
+        },
+        "violations": violations,
+    }
+
+
+def _print_result(result: dict[str, t.Any]) -> None:
+    status = "FAIL" if result["violations"] else "ok"
+    print(
+        f"{status:4}  {result['wall_ms']['median']:7.1f}ms "
+        f"/ {result['budget']['wall_ms']:5.0f}ms  "
+        f"{result['modules']:5} / {result['budget']['modules']:<5} modules  "
+        f"{result['name']}"
+    )
+    for violation in result["violations"]:
+        print(f"      {violation}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=5,
+        help="the number of timed runs of each scenario (default: 5)",
+    )
+    parser.add_argument(
+        "--only",
+        metavar="PATTERN",
+        action="append",
+        help="run only the scenarios whose names match this glob pattern",
+    )
+    parser.add_argument(
+        "--time-scale",
+        type=float,
+        default=1.0,
+        help="multiply the wall time budgets by this factor (default: 1)",
+    )
+    parser.add_argument("--report", help="write a JSON report to this file")
+    args = parser.parse_args()
+
+    scenarios = get_scenarios()
+    if args.only:
+        scenarios = [
+            s
+            for s in scenarios
+            if any(fnmatch.fnmatch(s.name, pattern) for pattern in args.only)
+        ]
+
+    results = []
+    with tempfile.TemporaryDirectory() as home, _mock_api() as api_url:
+        env = _base_env(home, api_url)
+        for scenario in scenarios:
+            result = measure(scenario, env, args.runs, args.time_scale)
+            _print_result(result)
+            results.append(result)
+
+    failures = [r for r in results if r["violations"]]
+    print(f"\n{len(results) - len(failures)} of {len(results)} scenarios in budget")
+
+    if args.report:
+        report = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "runs": args.runs,
+            "time_scale": args.time_scale,
+            "passed": not failures,
+            "scenarios": results,
+        }
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
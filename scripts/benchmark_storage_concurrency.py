@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+"""
+Stress test the CLI's token storage with many simultaneous processes.
+
+Each process opens the storage the way a CLI command does and reads the tokens and
+config for the current namespace; a fraction of them also write refreshed tokens,
+as commands do after a token refresh. The run is repeated for each storage mode,
+reporting failures (e.g. "database is locked") and timing.
+
+usage:
+    python scripts/benchmark_storage_concurrency.py --processes 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import statistics
+import tempfile
+import time
+import typing as t
+
+RESOURCE_SERVERS = [
+    "auth.globus.org",
+    "transfer.api.globus.org",
+    "groups.api.globus.org",
+    "search.api.globus.org",
+    "flows.globus.org",
+]
+
+
+class _TokenResponse:
+    def __init__(self, by_resource_server: dict[str, dict[str, t.Any]]) -> None:
+        self.by_resource_server = by_resource_server
+
+
+def _token_response(suffix: str) -> _TokenResponse:
+    return _TokenResponse(
+        {
+            rs: {
+                "resource_server": rs,
+                "access_token": f"{rs}-AT-{suffix}",
+                "refresh_token": f"{rs}-RT-{suffix}",
+                "expires_at_seconds": int(time.time()) + 3600,
+                "scope": "",
+                "token_type": "Bearer",
+            }
+            for rs in RESOURCE_SERVERS
+        }
+    )
+
+
+def _setup_storage() -> None:
+    from globus_cli.login_manager.storage import CLIStorage
+
+    storage = CLIStorage()
+    storage.adapter.store_config(
+        "auth_client_data", {"client_id": "bench", "client_secret": "bench"}
+    )
+    storage.adapter.store_config("auth_user_data", {"sub": "bench"})
+    storage.adapter.store(_token_response("initial"))
+    storage.close()
+
+
+def _worker(
+    index: int,
+    write: bool,
+    barrier: t.Any,
+    results: t.Any,
+) -> None:
+    barrier.wait()
+    start = time.perf_counter()
+    error = None
+    try:
+        from globus_cli.login_manager.storage import CLIStorage
+
+        storage = CLIStorage()
+        storage.read_well_known_config("auth_client_data")
+        storage.read_well_known_config("auth_user_data")
+        storage.read_well_known_config("scope_contract_versions")
+        for rs in RESOURCE_SERVERS:
+            storage.adapter.get_token_data(rs)
+        if write:
+            storage.store(_token_response(str(index)))
+        storage.close()
+    except Exception as err:
+        error = f"{type(err).__name__}: {err}"
+    results.put((time.perf_counter() - start, error))
+
+
+def run(mode: str, processes: int, write_fraction: float) -> None:
+    with tempfile.TemporaryDirectory() as home:
+        os.environ["HOME"] = home
+        os.environ["GLOBUS_CLI_STORAGE_MODE"] = mode
+        _setup_storage()
+
+        ctx = multiprocessing.get_context("fork")
+        barrier = ctx.Barrier(processes)
+        results = ctx.Queue()
+        write_every = round(1 / write_fraction) if write_fraction else 0
+        procs = [
+            ctx.Process(
+                target=_worker,
+                args=(i, bool(write_every) and i % write_every == 0, barrier, results),
+            )
+            for i in range(processes)
+        ]
+
+        start = time.perf_counter()
+        for proc in procs:
+            proc.start()
+        collected = [results.get() for _ in procs]
+        wall_time = time.perf_counter() - start
+        for proc in procs:
+            proc.join()
+
+    durations = sorted(duration for duration, _ in collected)
+    errors = [error for _, error in collected if error]
+    print(f"mode={mode}")
+    print(f"  processes:   {processes} ({write_fraction:.0%} writing)")
+    print(f"  wall time:   {wall_time:.2f}s")
+    print(f"  median:      {statistics.median(durations) * 1000:.1f}ms")
+    print(f"  p99:         {durations[int(len(durations) * 0.99) - 1] * 1000:.1f}ms")
+    print(f"  max:         {durations[-1] * 1000:.1f}ms")
+    print(f"  failures:    {len(errors)}")
+    for error in sorted(set(errors)):
+        print(f"    {errors.count(error)} x {error}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--processes", type=int, default=500)
+    parser.add_argument(
+        "--write-fraction",
+        type=float,
+        default=0.05,
+        help="the fraction of processes which write tokens (default: 0.05)",
+    )
+    parser.add_argument(
+        "--mode",
+        action="append",
+        choices=("default", "concurrent"),
+        help="the storage mode(s) to test (default: both)",
+    )
+    args = parser.parse_args()
+
+    for mode in args.mode or ("default", "concurrent"):
+        run(mode, args.processes, args.write_fraction)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,20 @@
-from globus_cli.commands import main
+from __future__ import annotations
+
+import typing as t
+
 from globus_cli.version import __version__
 
+if t.TYPE_CHECKING:
+    from globus_cli.commands import main
+
 __all__ = ["main", "__version__"]
+
+
+# the command tree is loaded on first use, so that lightweight entry points (e.g.
+# forwarding a command to the CLI daemon) can import from this package cheaply
+def __getattr__(name: str) -> t.Any:
+    if name == "main":
+        from globus_cli.commands import main
+
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
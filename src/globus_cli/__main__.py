@@ -1,3 +1,3 @@
-from globus_cli import main
+from globus_cli.entrypoint import main
 
 main()
@@ -0,0 +1,109 @@
+"""
+A precomputed manifest of the command tree.
+
+Listing the subcommands of a group is cheap, because subcommands are loaded lazily,
+but describing them (e.g. with their help summaries) requires importing every one of
+their modules. Shell completion and ``globus list-commands`` use this manifest
+instead, so that they import only the commands which they actually run.
+
+The manifest holds only the command tree: the names, help summaries, and
+visibility of commands. Completing the options of a command imports it anyway.
+
+The manifest is generated from the live command tree and shipped with the package.
+After changing commands, regenerate it with
+
+    python -m globus_cli.command_manifest
+
+The testsuite checks that it matches the live tree.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import typing as t
+
+import click
+
+MANIFEST_FILENAME = os.path.join(os.path.dirname(__file__), "command_manifest.json")
+# incremented on any incompatible change to the structure of the manifest
+MANIFEST_FORMAT = 2
+
+
+def build_manifest(cmd: click.Command, name: str = "globus") -> dict[str, t.Any]:
+    """Build the manifest for a command and, if it is a group, its subcommands."""
+    return {"format": MANIFEST_FORMAT, "tree": _describe_command(cmd, name)}
+
+
+def _describe_command(
+    cmd: click.Command, name: str, parent_ctx: click.Context | None = None
+) -> dict[str, t.Any]:
+    ctx = click.Context(cmd, info_name=name, parent=parent_ctx)
+    entry: dict[str, t.Any] = {
+        "short_help": cmd.get_short_help_str(),
+        "hidden": cmd.hidden,
+    }
+    if isinstance(cmd, click.Group):
+        entry["commands"] = {}
+        for subcmd_name in cmd.list_commands(ctx):
+            subcmd = cmd.get_command(ctx, subcmd_name)
+            if subcmd is not None:
+                entry["commands"][subcmd_name] = _describe_command(
+                    subcmd, subcmd_name, ctx
+                )
+    return entry
+
+
+@functools.lru_cache(maxsize=1)
+def load_manifest() -> dict[str, t.Any] | None:
+    """
+    Load the shipped manifest.
+
+    :returns: the tree of commands, or None if the manifest is missing or unusable
+    """
+    try:
+        with open(MANIFEST_FILENAME, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or manifest.get("format") != MANIFEST_FORMAT:
+        return None
+    return t.cast(t.Dict[str, t.Any], manifest["tree"])
+
+
+def get_manifest_entry(ctx: click.Context) -> dict[str, t.Any] | None:
+    """
+    Get the manifest entry for the command of a context, if the context is part
+    of the ``globus`` command tree and the manifest describes it.
+    """
+    from globus_cli.commands import main
+
+    path = []
+    while ctx.parent is not None:
+        path.append(ctx.info_name)
+        ctx = ctx.parent
+    if ctx.command is not main:
+        return None
+
+    entry = load_manifest()
+    for name in reversed(path):
+        if entry is None:
+            return None
+        entry = entry.get("commands", {}).get(name)
+    return entry
+
+
+def write_manifest(filename: str = MANIFEST_FILENAME) -> None:
+    from globus_cli.commands import main
+
+    manifest = build_manifest(main)
+    with open(filename, "w", encoding="utf-8") as f:
+        # keys are sorted, which also keeps subcommands in the order in which
+        # groups list them, and indented so that changes can be reviewed
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+if __name__ == "__main__":
+    write_manifest()
@@ -0,0 +1,87 @@
+"""
+Helpers for commands which run other commands in the same process, such as
+``globus shell`` and ``globus run``.
+"""
+
+from __future__ import annotations
+
+import shlex
+
+import click
+
+# commands which may not be run by a command which runs other commands: those
+# which run commands themselves, and the daemon, which would block the caller
+_NESTING_COMMANDS = ("daemon", "run", "shell")
+
+
+def split_command_line(line: str) -> list[str]:
+    """
+    Split a line of input into the arguments for ``globus``.
+
+    The line may start with ``globus``, so that lines can be copied from
+    elsewhere, and may contain comments.
+
+    :raises ValueError: if the line cannot be split, e.g. on an unterminated quote
+    """
+    args = shlex.split(line, comments=True)
+    if args[:1] == ["globus"]:
+        args = args[1:]
+    return args
+
+
+def run_args(args: list[str]) -> int:
+    """
+    Run a command in the current process and thread, and report errors as
+    ``globus`` would.
+
+    An interrupt (Ctrl-C) is raised as ``KeyboardInterrupt``, so that the caller
+    can decide whether to stop.
+
+    :returns: the exit code of the command
+    """
+    from globus_cli.commands import main
+
+    cmd_name = _resolve_command_name(args)
+    if cmd_name in _NESTING_COMMANDS:
+        click.echo(f"'globus {cmd_name}' cannot be run here.", err=True)
+        return 2
+
+    try:
+        result = main.main(args=args, prog_name="globus", standalone_mode=False)
+    except click.exceptions.Abort as err:
+        if isinstance(err.__cause__, KeyboardInterrupt):
+            raise err.__cause__
+        click.echo("Aborted!", err=True)
+        return 1
+    except click.ClickException as err:
+        err.show()
+        return err.exit_code
+    except SystemExit as err:
+        if isinstance(err.code, int):
+            return err.code
+        if err.code is not None:
+            click.echo(err.code, err=True)
+            return 1
+        return 0
+    # without standalone mode, an explicit exit returns its code
+    return result if isinstance(result, int) else 0
+
+
+def _resolve_command_name(args: list[str]) -> str | None:
+    """
+    Find the name of the subcommand of ``globus`` which the arguments would run,
+    after any global options, such as ``-F json``, which come before it.
+    """
+    from globus_cli.commands import main
+
+    # parse the options of ``globus`` as shell completion does, without running
+    # callbacks which would print help or exit; the group leaves the arguments for
+    # its subcommand in ctx.args, after the subcommand's name. An argument is
+    # added, so that there are always arguments after the name, if there is one
+    args = list(args) + ["-"]
+    with main.make_context("globus", list(args), resilient_parsing=True) as ctx:
+        name_index = len(args) - len(ctx.args) - 1
+        if name_index == len(args) - 1:
+            return None
+        cmd_name, _, _ = main.resolve_command(ctx, args[name_index:])
+    return cmd_name
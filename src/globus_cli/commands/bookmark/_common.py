@@ -6,6 +6,8 @@ from uuid import UUID
 import click
 import globus_sdk
 
+from globus_cli.local_index import BookmarkIndex
+
 
 def resolve_id_or_name(
     client: globus_sdk.TransferClient, bookmark_id_or_name: str
@@ -28,7 +30,19 @@ def resolve_id_or_name(
     if res:
         return res
 
-    # non-UUID input or UUID not found; fallback to match by name
+    # non-UUID input or UUID not found; try the local index of bookmark names,
+    # and check that the indexed bookmark still has that name
+    indexed = BookmarkIndex().get(bookmark_id_or_name)
+    if indexed is not None:
+        try:
+            res = client.get_bookmark(indexed.id)
+        except globus_sdk.TransferAPIError as err:
+            if err.code != "BookmarkNotFound":
+                raise
+        if res and res["name"] == bookmark_id_or_name:
+            return res
+
+    # fallback to match by name in the full list, which also refreshes the index
     try:
         # n.b. case matters to the Transfer service for bookmark names, so
         # two bookmarks can exist whose names vary only by their case
@@ -27,4 +27,5 @@ def collection_delete(login_manager: LoginManager, *, collection_id: uuid.UUID)
     """
     gcs_client = login_manager.get_gcs_client(collection_id=collection_id)
     res = gcs_client.delete_collection(collection_id)
+    login_manager.get_transfer_client().endpoint_cache.discard(collection_id)
     display(res, text_mode=display.RAW, response_key="code")
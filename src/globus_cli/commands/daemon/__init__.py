@@ -0,0 +1,13 @@
+from globus_cli.parsing import group
+
+
+@group(
+    "daemon",
+    lazy_subcommands={
+        "start": (".start", "daemon_start"),
+        "status": (".status", "daemon_status"),
+        "stop": (".stop", "daemon_stop"),
+    },
+)
+def daemon_command() -> None:
+    """Manage the CLI daemon, which makes commands start faster."""
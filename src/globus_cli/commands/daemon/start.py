@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+
+import click
+
+from globus_cli.parsing import TimedeltaType, command
+
+# how long to wait for a newly started daemon to accept requests
+_START_TIMEOUT = 30.0
+_START_POLL_INTERVAL = 0.05
+
+
+@command(
+    "start",
+    short_help="Start the CLI daemon.",
+    disable_options=["format", "map_http_status"],
+    adoc_examples="""Start the daemon, which will exit after 8 hours without use
+
+[source,bash]
+----
+$ globus daemon start --idle-timeout 8h
+----
+""",
+)
+@click.option(
+    "--idle-timeout",
+    type=TimedeltaType(),
+    default="3h",
+    show_default=True,
+    help=(
+        "Stop the daemon after it has not been used for this amount of time. "
+        "Expressed in weeks, days, hours, minutes, and seconds. Use 'w', 'd', 'h', "
+        "'m', and 's' as suffixes to specify. e.g. '1h30m', '500s'. Use '0s' to "
+        "keep the daemon running until it is stopped."
+    ),
+)
+@click.option(
+    "--foreground",
+    is_flag=True,
+    help="Run the daemon in this process, rather than in the background.",
+)
+def daemon_start(*, idle_timeout: int, foreground: bool) -> None:
+    """
+    Start the CLI daemon, a background process which runs commands on behalf of
+    the 'globus' command.
+
+    Every command normally spends some time loading the CLI before it does any
+    work. While the daemon is running, commands are passed to it and run in an
+    already loaded copy of the CLI, which makes them start much faster. This
+    is most noticeable in scripts which run many commands.
+
+    Commands are only passed to the daemon when they are run with the same
+    version of the CLI, and with the same GLOBUS_* environment variables, as
+    the daemon. Other commands run as usual.
+
+    Set GLOBUS_CLI_DAEMON=0 to run commands without the daemon.
+    """
+    from globus_cli.daemon import client, protocol, server
+
+    if sys.platform == "win32":
+        raise click.ClickException("The CLI daemon is not supported on Windows.")
+
+    socket_path = protocol.get_socket_path()
+    status = client.request_status(socket_path)
+    if status is not None:
+        click.echo(f"The CLI daemon is already running (pid {status['pid']}).")
+        return
+
+    if foreground:
+        server.serve(socket_path, idle_timeout=idle_timeout)
+        return
+
+    subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "globus_cli.daemon.server",
+            "--socket",
+            socket_path,
+            "--idle-timeout",
+            str(idle_timeout),
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + _START_TIMEOUT
+    while time.monotonic() < deadline:
+        status = client.request_status(socket_path)
+        if status is not None:
+            click.echo(f"Started the CLI daemon (pid {status['pid']}).")
+            return
+        time.sleep(_START_POLL_INTERVAL)
+    raise click.ClickException("The CLI daemon did not start.")
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import click
+
+from globus_cli.parsing import command
+
+
+@command(
+    "status",
+    short_help="Show whether the CLI daemon is running.",
+    disable_options=["format", "map_http_status"],
+)
+def daemon_status() -> None:
+    """
+    Show whether the CLI daemon is running.
+
+    Exits with status 1 if the daemon is not running.
+    """
+    from globus_cli.daemon import client, protocol
+
+    socket_path = protocol.get_socket_path()
+    status = client.request_status(socket_path)
+    if status is None:
+        click.echo("The CLI daemon is not running.")
+        click.get_current_context().exit(1)
+
+    identity = status["identity"]
+    click.echo(f"The CLI daemon is running (pid {status['pid']}).")
+    click.echo(f"Socket: {socket_path}")
+    click.echo(f"CLI version: {identity['version']}")
+    click.echo(f"Python: {identity['python']}")
+    # show only the names of variables, whose values may be secrets
+    env_names = ", ".join(sorted(identity["env"])) or "(none)"
+    click.echo(f"GLOBUS_* environment variables: {env_names}")
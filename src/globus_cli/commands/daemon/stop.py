@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import click
+
+from globus_cli.parsing import command
+
+
+@command(
+    "stop",
+    short_help="Stop the CLI daemon.",
+    disable_options=["format", "map_http_status"],
+)
+def daemon_stop() -> None:
+    """
+    Stop the CLI daemon. Commands which are already running are not interrupted.
+    """
+    from globus_cli.daemon import client, protocol
+
+    if client.request_stop(protocol.get_socket_path()):
+        click.echo("Stopped the CLI daemon.")
+    else:
+        click.echo("The CLI daemon is not running.")
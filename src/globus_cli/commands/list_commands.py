@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import typing as t
+
 import click
 
+from globus_cli.command_manifest import get_manifest_entry
 from globus_cli.parsing import command
 from globus_cli.reflect import walk_contexts
 from globus_cli.types import ClickContextTree
@@ -28,6 +31,22 @@ def _print_tree(
         _print_tree(subctx, subsubcommands, subsubgroups)
 
 
+def _print_manifest_tree(command_path: str, entry: dict[str, t.Any]) -> None:
+    click.echo(f"\n=== {command_path} ===\n")
+    visible = {
+        name: subentry
+        for name, subentry in entry["commands"].items()
+        if not subentry["hidden"]
+    }
+    for name, subentry in visible.items():
+        if "commands" not in subentry:
+            click.echo(f"    {command_path} {name}")
+            click.echo(f"        {subentry['short_help']}\n")
+    for name, subentry in visible.items():
+        if "commands" in subentry:
+            _print_manifest_tree(f"{command_path} {name}", subentry)
+
+
 @command(
     "list-commands",
     short_help="List all CLI Commands.",
@@ -45,7 +64,15 @@ def list_commands() -> None:
     # get the root context (the click context for the entire CLI tree)
     root_ctx = click.get_current_context().find_root()
     root_command: click.Group = root_ctx.command  # type: ignore[assignment]
-    ctx, subcmds, subgroups = walk_contexts("globus", root_command)
-    _print_tree(ctx, subcmds, subgroups)
+
+    # use the command manifest if possible, rather than importing every command
+    entry = get_manifest_entry(root_ctx)
+    if entry is not None and list(entry["commands"]) == root_command.list_commands(
+        root_ctx
+    ):
+        _print_manifest_tree("globus", entry)
+    else:
+        ctx, subcmds, subgroups = walk_contexts("globus", root_command)
+        _print_tree(ctx, subcmds, subgroups)
     # get an extra newline at the end
     click.echo("")
@@ -1,6 +1,7 @@
 import click
 import globus_sdk
 
+from globus_cli.local_cache import clear_all_caches
 from globus_cli.login_manager import LoginManager, is_client_login
 from globus_cli.parsing import command
 
@@ -60,6 +61,8 @@ def logout_command(
 
     This command both removes all tokens used for authenticating the user from local
     storage and revokes them so that they cannot be used anymore globally.
+    Any data which the CLI has cached locally, such as identity usernames, is also
+    removed.
 
     If an expected token cannot be found in local storage a warning will be raised
     as it is possible the token still exists and needs to be manually rescinded
@@ -140,6 +143,8 @@ def logout_command(
         login_manager.storage.adapter.remove_tokens_for_resource_server(rs)
 
     login_manager.storage.remove_well_known_config("auth_user_data")
+    # remove any locally cached data (e.g. identities) fetched while logged in
+    clear_all_caches()
 
     if is_client_login():
         click.echo(_CLIENT_LOGOUT_EPILOG)
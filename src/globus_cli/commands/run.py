@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import concurrent.futures
+import contextlib
+import io
+import queue
+import sys
+import threading
+import typing as t
+
+import click
+
+from globus_cli.login_manager import LoginManager
+from globus_cli.login_manager.connection_pool import SharedConnectionPool
+from globus_cli.parsing import command
+from globus_cli.parsing.command_state import fixed_logging_config
+from globus_cli.termio import display, outformat_is_text
+
+from ._inprocess import run_args, split_command_line
+
+
+class CommandLine(t.NamedTuple):
+    line_number: int
+    command_line: str
+    args: list[str]
+
+
+class CommandResult(t.NamedTuple):
+    line_number: int
+    command_line: str
+    exit_code: int
+    # output is None when it was not captured, but written as the command ran
+    stdout: str | None
+    stderr: str | None
+
+
+class _ThreadOutput(io.TextIOBase):
+    """
+    A replacement for a standard stream, which sends writes from each thread to
+    that thread's capture buffer, if there is one, or else to the original stream.
+    """
+
+    def __init__(self, stream: t.TextIO) -> None:
+        self._stream = stream
+        self._local = threading.local()
+
+    @property
+    def encoding(self) -> str:  # type: ignore[override]
+        return self._stream.encoding
+
+    @property
+    def _buffer(self) -> io.StringIO | None:
+        return t.cast(t.Optional[io.StringIO], getattr(self._local, "buffer", None))
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        return (self._buffer or self._stream).write(s)
+
+    def flush(self) -> None:
+        if self._buffer is None:
+            self._stream.flush()
+
+    def isatty(self) -> bool:
+        return self._buffer is None and self._stream.isatty()
+
+    @contextlib.contextmanager
+    def capture(self) -> t.Iterator[io.StringIO]:
+        self._local.buffer = io.StringIO()
+        try:
+            yield self._local.buffer
+        finally:
+            self._local.buffer = None
+
+
+@contextlib.contextmanager
+def _thread_outputs() -> t.Iterator[tuple[_ThreadOutput, _ThreadOutput]]:
+    stdout, stderr = sys.stdout, sys.stderr
+    routed_stdout, routed_stderr = _ThreadOutput(stdout), _ThreadOutput(stderr)
+    sys.stdout, sys.stderr = routed_stdout, routed_stderr
+    try:
+        yield routed_stdout, routed_stderr
+    finally:
+        sys.stdout, sys.stderr = stdout, stderr
+
+
+def read_command_lines(file: t.TextIO) -> list[CommandLine]:
+    """
+    Read the commands in a file, skipping blank lines and comments.
+
+    :raises click.UsageError: if any line cannot be parsed
+    """
+    commands = []
+    for line_number, line in enumerate(file, start=1):
+        try:
+            args = split_command_line(line)
+        except ValueError as err:
+            raise click.UsageError(f"Could not parse line {line_number}: {err}")
+        if args:
+            commands.append(CommandLine(line_number, line.strip(), args))
+    return commands
+
+
+def _run_serially(
+    commands: list[CommandLine],
+    run_one: t.Callable[[CommandLine], CommandResult],
+) -> t.Iterator[CommandResult]:
+    with LoginManager.shared():
+        for cmd in commands:
+            yield run_one(cmd)
+
+
+def _run_concurrently(
+    commands: list[CommandLine],
+    run_one: t.Callable[[CommandLine], CommandResult],
+    jobs: int,
+) -> t.Iterator[CommandResult]:
+    """
+    Run commands on several threads, and yield their results in order.
+
+    Each thread has its own LoginManager, because token storage cannot be shared
+    between threads, but all of them share a connection pool.
+    """
+    connection_pool = SharedConnectionPool()
+    work: queue.SimpleQueue[
+        tuple[CommandLine, concurrent.futures.Future[CommandResult]]
+    ] = queue.SimpleQueue()
+    futures: list[concurrent.futures.Future[CommandResult]] = []
+    for cmd in commands:
+        future: concurrent.futures.Future[CommandResult] = concurrent.futures.Future()
+        work.put((cmd, future))
+        futures.append(future)
+
+    stopping = threading.Event()
+
+    def worker() -> None:
+        with LoginManager.shared(connection_pool=connection_pool):
+            while not stopping.is_set():
+                try:
+                    cmd, future = work.get_nowait()
+                except queue.Empty:
+                    return
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(run_one(cmd))
+                except BaseException as err:
+                    future.set_exception(err)
+
+    threads = [
+        threading.Thread(target=worker, daemon=True)
+        for _ in range(min(jobs, len(commands)))
+    ]
+    for thread in threads:
+        thread.start()
+
+    try:
+        for future in futures:
+            yield future.result()
+    finally:
+        # on an interrupt, don't start any more commands, but don't wait for the
+        # running ones either
+        stopping.set()
+        for future in futures:
+            future.cancel()
+    for thread in threads:
+        thread.join()
+    connection_pool.log_stats()
+    connection_pool.close()
+
+
+def _print_summary(results: list[CommandResult]) -> None:
+    failures = [r for r in results if r.exit_code != 0]
+    if not failures:
+        return
+    click.echo(f"{len(failures)} of {len(results)} commands failed:", err=True)
+    for result in failures:
+        click.echo(
+            f"  line {result.line_number} (exit status {result.exit_code}): "
+            f"{result.command_line}",
+            err=True,
+        )
+
+
+@command(
+    "run",
+    short_help="Run a list of commands in one process.",
+    adoc_output="""
+When text output is requested, the output of each command is printed, in the
+order of the commands, followed by a summary of any commands which failed.
+
+When JSON output is requested, a list with one object per command is printed,
+containing its line number, command line, exit status, and output.
+""",
+    adoc_examples="""Show several tasks, four at a time:
+
+[source,bash]
+----
+$ cat commands.txt
+task show 2a3b06c6-d6c6-11ef-9c08-0affc202d2e9
+task show 3c15b4a2-d6c6-11ef-9c08-0affc202d2e9
+task show 4e8f1e2e-d6c6-11ef-9c08-0affc202d2e9
+$ globus run --jobs 4 commands.txt
+----
+
+Generate the commands with another program:
+
+[source,bash]
+----
+$ globus task list --format unix --jmespath 'DATA[].task_id' \\
+    | sed 's/^/task show /' | globus run --jobs 4
+----
+""",
+)
+@click.argument("file", type=click.File("r"), default="-")
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(1),
+    default=1,
+    show_default=True,
+    help="Run up to this many commands at a time.",
+)
+def run_command(file: t.TextIO, jobs: int) -> None:
+    """
+    Run the Globus CLI commands in FILE, one per line, in a single process.
+    If FILE is omitted or is '-', commands are read from stdin.
+
+    Commands are written without the leading 'globus'. Blank lines and comments,
+    which start with '#', are skipped. If any line cannot be parsed, no commands
+    are run.
+
+    Because all of the commands run in one process, they share connections to
+    Globus services, and only the first command pays the cost of starting up.
+    This is much faster than running 'globus' once per command.
+
+    With '--jobs', commands run concurrently. They should be independent of one
+    another, as they may run in any order. Their output is still printed in the
+    order of the commands. Logging and warnings are configured once for the
+    whole run, by the options given to 'globus run', so '-v', '--debug', and
+    '--quiet' on individual commands do not change them.
+
+    The exit status is 0 if every command succeeded, and 1 otherwise.
+    """
+    commands = read_command_lines(file)
+    # capture output unless it can be written in order as commands run
+    capture = jobs > 1 or not outformat_is_text()
+
+    with contextlib.ExitStack() as stack:
+        if capture:
+            stdout, stderr = stack.enter_context(_thread_outputs())
+
+        def run_one(cmd: CommandLine) -> CommandResult:
+            if not capture:
+                exit_code = run_args(cmd.args)
+                return CommandResult(
+                    cmd.line_number, cmd.command_line, exit_code, None, None
+                )
+            with stdout.capture() as out, stderr.capture() as err:
+                exit_code = run_args(cmd.args)
+            return CommandResult(
+                cmd.line_number,
+                cmd.command_line,
+                exit_code,
+                out.getvalue(),
+                err.getvalue(),
+            )
+
+        if jobs > 1:
+            # logging is configured once, by the options given to 'globus run',
+            # rather than by each command as it starts
+            stack.enter_context(fixed_logging_config())
+            result_iter = _run_concurrently(commands, run_one, jobs)
+        else:
+            result_iter = _run_serially(commands, run_one)
+
+        results = []
+        for result in result_iter:
+            results.append(result)
+            if outformat_is_text() and capture:
+                click.echo(result.stdout, nl=False)
+                click.echo(result.stderr, nl=False, err=True)
+
+    if outformat_is_text():
+        _print_summary(results)
+    else:
+        display([result._asdict() for result in results])
+
+    if any(result.exit_code != 0 for result in results):
+        click.get_current_context().exit(1)
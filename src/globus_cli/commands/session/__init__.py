@@ -5,6 +5,7 @@ from globus_cli.parsing import group
     "session",
     lazy_subcommands={
         "consent": (".consent", "session_consent"),
+        "refresh": (".refresh", "session_refresh"),
         "show": (".show", "session_show"),
         "update": (".update", "session_update"),
     },
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import time
+import typing as t
+
+import click
+import globus_sdk
+
+from globus_cli.login_manager import LoginManager
+from globus_cli.parsing import TimedeltaType, command
+from globus_cli.termio import verbosity
+
+# in --loop mode, the longest time to wait before checking storage again, so that
+# changes such as a new login are noticed
+_MAX_LOOP_DELAY = 3600
+# in --loop mode, the shortest time to wait between refreshes
+_MIN_LOOP_DELAY = 1
+# in --loop mode, the shortest time to wait before refreshing the same tokens
+# again, and before retrying a refresh which failed (doubled on each failure)
+_MIN_REFRESH_INTERVAL = 60
+
+
+@command(
+    "refresh",
+    short_help="Refresh access tokens which will expire soon.",
+    disable_options=["format", "map_http_status"],
+    adoc_examples="""Refresh any tokens which expire within the next 10 minutes
+
+[source,bash]
+----
+$ globus session refresh
+----
+
+Keep tokens fresh in the background, refreshing them 30 minutes before they expire
+
+[source,bash]
+----
+$ globus session refresh --window 30m --loop &
+----
+""",
+)
+@click.option(
+    "--window",
+    type=TimedeltaType(),
+    default="10m",
+    show_default=True,
+    help=(
+        "Refresh tokens which expire within this amount of time. Expressed in "
+        "weeks, days, hours, minutes, and seconds. Use 'w', 'd', 'h', 'm', and 's' "
+        "as suffixes to specify. e.g. '1h30m', '500s'"
+    ),
+)
+@click.option(
+    "--loop",
+    is_flag=True,
+    help=(
+        "Keep running, and refresh each token when it comes within the window of "
+        "its expiration. Failed refreshes are reported and retried, with "
+        "increasing delays."
+    ),
+)
+@LoginManager.requires_login()
+def session_refresh(login_manager: LoginManager, *, window: int, loop: bool) -> None:
+    """
+    Refresh the access tokens stored by the CLI which will expire soon.
+
+    Commands refresh expired access tokens as needed, which adds a request to
+    Globus Auth to the time that the command takes. Running this command
+    beforehand, or running it with '--loop' in the background, means that other
+    commands will almost always find a valid access token.
+    """
+    # in --loop mode, the earliest time at which each resource server's tokens
+    # may be refreshed again
+    not_before: dict[str, float] = {}
+    failures: dict[str, int] = {}
+    while True:
+        next_refresh_at = _refresh_expiring_tokens(
+            login_manager, window, not_before, failures, keep_going=loop
+        )
+        if not loop:
+            return
+
+        if next_refresh_at is None:
+            delay: float = _MAX_LOOP_DELAY
+        else:
+            delay = min(
+                max(next_refresh_at - time.time(), _MIN_LOOP_DELAY), _MAX_LOOP_DELAY
+            )
+        time.sleep(delay)
+
+
+def _refresh_expiring_tokens(
+    login_manager: LoginManager,
+    window: int,
+    not_before: dict[str, float],
+    failures: dict[str, int],
+    *,
+    keep_going: bool,
+) -> float | None:
+    """
+    Refresh the tokens which expire within the window.
+
+    A window which is not shorter than the lifetime of a resource server's new
+    tokens is clamped to half of that lifetime, so that those tokens are not
+    refreshed again immediately.
+
+    :param not_before: the earliest time at which each resource server's tokens
+        may be refreshed, updated as tokens are refreshed
+    :param failures: the number of consecutive failed refreshes for each resource
+        server, used to back off
+    :param keep_going: report errors and back off, rather than raising them
+    :returns: the time at which the next token will need to be refreshed, or None
+        if there are no tokens
+    """
+    token_data = login_manager.storage.adapter.get_by_resource_server()
+    refreshed = []
+    for rs_name, tokens in sorted(token_data.items()):
+        now = time.time()
+        if _refresh_due_at(rs_name, tokens, window, not_before) > now:
+            continue
+
+        try:
+            login_manager.refresh_tokens(rs_name)
+        except globus_sdk.GlobusError as err:
+            if not keep_going:
+                raise
+            failures[rs_name] = failures.get(rs_name, 0) + 1
+            backoff = _MIN_REFRESH_INTERVAL * 2 ** (failures[rs_name] - 1)
+            not_before[rs_name] = now + min(backoff, _MAX_LOOP_DELAY)
+            click.echo(f"Failed to refresh tokens for {rs_name}: {err}", err=True)
+            continue
+
+        refreshed.append(rs_name)
+        failures.pop(rs_name, None)
+        new_tokens = login_manager.storage.adapter.get_token_data(rs_name)
+        if new_tokens is not None:
+            lifetime = new_tokens["expires_at_seconds"] - now
+            not_before[rs_name] = max(
+                new_tokens["expires_at_seconds"] - min(window, lifetime / 2),
+                now + _MIN_REFRESH_INTERVAL,
+            )
+
+    if verbosity() >= 0:
+        if not refreshed and not token_data:
+            click.echo("No tokens are stored. Use 'globus login' to login.", err=True)
+        for rs_name in refreshed:
+            click.echo(f"Refreshed tokens for {rs_name}")
+
+    token_data = login_manager.storage.adapter.get_by_resource_server()
+    if not token_data:
+        return None
+    return min(
+        _refresh_due_at(rs_name, tokens, window, not_before)
+        for rs_name, tokens in token_data.items()
+    )
+
+
+def _refresh_due_at(
+    rs_name: str, tokens: dict[str, t.Any], window: int, not_before: dict[str, float]
+) -> float:
+    due_at = float(tokens["expires_at_seconds"] - window)
+    return max(due_at, not_before.get(rs_name, due_at))
@@ -77,7 +77,9 @@ def session_show(login_manager: LoginManager) -> None:
         authentications = session_info.get("authentications") or {}
 
     # resolve ids to human readable usernames
-    resolved_ids = globus_sdk.IdentityMap(auth_client, list(authentications))
+    resolved_ids = globus_sdk.IdentityMap(
+        auth_client, list(authentications), cache=auth_client.identity_cache
+    )
 
     # put the nested dicts in a format table output can work with
     # while also converting vals into human readable formats
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import sys
+import typing as t
+
+import click
+
+from globus_cli.login_manager import LoginManager
+from globus_cli.parsing import command
+
+from ._inprocess import run_args, split_command_line
+
+_EXIT_COMMANDS = ("exit", "quit")
+
+
+def run_shell_line(line: str) -> int | None:
+    """
+    Run one line of input as a command.
+
+    :returns: the exit code of the command, or None if the line was not a command
+    """
+    try:
+        args = split_command_line(line)
+    except ValueError as err:
+        click.echo(f"Could not parse the line: {err}", err=True)
+        return 2
+    if not args:
+        return None
+    try:
+        return run_args(args)
+    except KeyboardInterrupt:
+        # stop the command, but not the shell
+        return 130
+
+
+def complete_shell_line(line: str) -> list[str]:
+    """
+    Get the completions for the last word of a partial line of input, using the
+    same machinery as shell completion for ``globus``.
+    """
+    from click.shell_completion import ShellComplete
+
+    from globus_cli.commands import main
+
+    try:
+        args = split_command_line(line)
+    except ValueError:
+        return []
+    incomplete = ""
+    if args and not line[-1:].isspace():
+        incomplete = args.pop()
+
+    completer = ShellComplete(main, {}, "globus", "_GLOBUS_COMPLETE")
+    return [
+        item.value
+        for item in completer.get_completions(args, incomplete)
+        if item.type == "plain"
+    ]
+
+
+def _setup_readline() -> None:
+    try:
+        import readline
+    except ImportError:  # e.g. on Windows
+        return
+
+    matches: list[str] = []
+
+    def completer(text: str, state: int) -> str | None:
+        if state == 0:
+            line = readline.get_line_buffer()[: readline.get_endidx()]
+            matches[:] = complete_shell_line(line)
+        return matches[state] if state < len(matches) else None
+
+    # complete whole words, including options and paths
+    readline.set_completer_delims(" \t\n")
+    readline.set_completer(completer)
+    readline.parse_and_bind(
+        "bind ^I rl_complete"
+        if "libedit" in (readline.__doc__ or "")
+        else "tab: complete"
+    )
+
+
+def _read_lines(interactive: bool) -> t.Iterator[str]:
+    prompt = "globus> " if interactive else ""
+    while True:
+        try:
+            yield input(prompt)
+        except EOFError:
+            if interactive:
+                click.echo("")
+            return
+        except KeyboardInterrupt:
+            # discard the current line, as in other shells
+            click.echo("")
+
+
+@command(
+    "shell",
+    short_help="Run commands in an interactive shell.",
+    adoc_output="""
+Each command prints its usual output.
+""",
+    adoc_examples="""Start the shell, and run commands without the 'globus' prefix:
+
+[source,bash]
+----
+$ globus shell
+globus> task list --limit 5
+globus> ls 'ddb59aef-6d04-11e5-ba46-22000b92c6ec:/share/godata/'
+globus> exit
+----
+
+Run a series of commands from a file:
+
+[source,bash]
+----
+$ globus shell < commands.txt
+----
+""",
+)
+def shell_command() -> None:
+    """
+    Run Globus CLI commands, one per line, in an interactive shell.
+
+    Commands are entered without the leading 'globus'. All of the commands run
+    in one process and share connections to Globus services, so after the first
+    command, each one starts almost instantly.
+
+    Tab completion is available when the shell is interactive. Enter 'exit' or
+    'quit', or send an end-of-file (Ctrl-D), to leave the shell.
+
+    When input is not a terminal, commands are read from it until it ends, and
+    the exit status is that of the last command which failed, if any.
+    """
+    interactive = sys.stdin.isatty()
+    if interactive:
+        _setup_readline()
+
+    exit_code = 0
+    with LoginManager.shared():
+        for line in _read_lines(interactive):
+            if line.strip() in _EXIT_COMMANDS:
+                break
+            result = run_shell_line(line)
+            if result:
+                exit_code = result
+    click.get_current_context().exit(0 if interactive else exit_code)
@@ -0,0 +1,16 @@
+"""
+The CLI daemon, a long-lived process which runs commands on behalf of the
+``globus`` entry point.
+
+Starting the CLI involves importing and setting up a lot of code before any command
+runs, which dominates the runtime of scripts calling the CLI many times. The daemon
+does that work once. For each command, it forks a child process, which therefore
+starts with everything already imported, and which runs the command with the
+environment, working directory and standard streams of the ``globus`` process.
+
+The daemon is started with ``globus daemon start``. The ``globus`` entry point
+forwards commands to it whenever it is running, and otherwise runs them in process.
+
+Keep this package lightweight to import: the entry point imports it before
+anything else.
+"""
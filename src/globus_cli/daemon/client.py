@@ -0,0 +1,138 @@
+"""
+Forwarding of commands from the ``globus`` entry point to the CLI daemon.
+"""
+
+from __future__ import annotations
+
+import os
+import signal
+import socket
+import sys
+import typing as t
+
+from . import protocol
+
+# signals which are passed on to the process running the command
+_FORWARDED_SIGNALS = ("SIGINT", "SIGTERM", "SIGHUP", "SIGQUIT")
+
+
+def forward_to_daemon(argv: list[str]) -> int | None:
+    """
+    Run a command in the CLI daemon, if it is running.
+
+    :param argv: the full command line, including the program name
+    :returns: the exit code of the command, or None if the command was not run by
+        the daemon and should be run in process
+    """
+    if protocol.forwarding_disabled():
+        return None
+    socket_path = protocol.get_socket_path()
+    if not os.path.exists(socket_path):
+        return None
+    # the client's environment and terminal are only sent to a daemon run by the
+    # same user: another user could have created the socket directory, if it is
+    # in a shared location like /tmp, or be listening on the socket
+    try:
+        protocol.check_socket_dir(socket_path)
+    except (OSError, RuntimeError):
+        return None
+    try:
+        fds = [stream.fileno() for stream in (sys.stdin, sys.stdout, sys.stderr)]
+    except (AttributeError, ValueError, OSError):
+        # a standard stream is closed or is not a file
+        return None
+
+    try:
+        sock = protocol.connect(socket_path, timeout=5)
+    except OSError:
+        # e.g. a stale socket, left by a daemon which did not exit cleanly
+        return None
+
+    with sock:
+        if not protocol.peer_is_current_user(sock):
+            return None
+        try:
+            protocol.send_message(
+                sock,
+                {
+                    "op": "run",
+                    "argv": argv,
+                    "cwd": os.getcwd(),
+                    "env": protocol.forwarded_environment(os.environ),
+                    "identity": protocol.daemon_identity(),
+                },
+                fds=fds,
+            )
+            reply, _ = protocol.recv_message(sock)
+        except (OSError, ValueError, protocol.ProtocolError):
+            return None
+        if reply is None or "pid" not in reply:
+            return None
+
+        # the command is running; from here on, falling back would run it twice
+        sock.settimeout(None)
+        with _forward_signals(int(reply["pid"])):
+            try:
+                result, _ = protocol.recv_message(sock)
+            except (OSError, protocol.ProtocolError):
+                result = None
+
+    if result is None or "exit_code" not in result:
+        print("globus: lost contact with the CLI daemon", file=sys.stderr)
+        return 1
+    return int(result["exit_code"])
+
+
+class _forward_signals:
+    def __init__(self, pid: int) -> None:
+        self.pid = pid
+        self._previous: dict[signal.Signals, t.Any] = {}
+
+    def _forward(self, signum: int, frame: t.Any) -> None:
+        try:
+            os.kill(self.pid, signum)
+        except OSError:
+            pass
+
+    def __enter__(self) -> None:
+        for name in _FORWARDED_SIGNALS:
+            signum = getattr(signal, name, None)
+            if signum is not None:
+                self._previous[signum] = signal.signal(signum, self._forward)
+
+    def __exit__(self, *args: t.Any) -> None:
+        for signum, handler in self._previous.items():
+            signal.signal(signum, handler)
+
+
+def request_status(socket_path: str) -> dict[str, t.Any] | None:
+    """Get the status of the daemon, or None if it is not running."""
+    return _simple_request(socket_path, "status")
+
+
+def request_stop(socket_path: str) -> bool:
+    """Stop the daemon, returning whether or not it was running."""
+    return _simple_request(socket_path, "stop") is not None
+
+
+def _simple_request(socket_path: str, op: str) -> dict[str, t.Any] | None:
+    try:
+        with protocol.connect(socket_path, timeout=5) as sock:
+            protocol.send_message(sock, {"op": op})
+            reply, _ = protocol.recv_message(sock)
+    except (OSError, protocol.ProtocolError):
+        return None
+    return reply
+
+
+def socket_is_stale(socket_path: str) -> bool:
+    """Check whether a socket file exists without a daemon listening on it."""
+    if not os.path.exists(socket_path):
+        return False
+    try:
+        protocol.connect(socket_path, timeout=1).close()
+    except (ConnectionRefusedError, FileNotFoundError):
+        return True
+    except (OSError, socket.timeout):
+        return False
+    return False
@@ -0,0 +1,260 @@
+"""
+The protocol spoken between the ``globus`` entry point and the CLI daemon.
+
+Messages are JSON objects, each sent with a 4-byte length prefix. A request may
+carry file descriptors (the client's standard streams), which are attached to the
+length prefix.
+
+A client sends one request per connection, with an ``op`` of:
+
+- ``run``: run a command; the daemon replies with the ``pid`` of the process
+  running it, and later with its ``exit_code``, or declines with ``fallback``
+- ``status``: get information about the daemon
+- ``stop``: stop the daemon
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import struct
+import sys
+import tempfile
+import typing as t
+
+from globus_cli.version import __version__
+
+SOCKET_ENV_VAR = "GLOBUS_CLI_DAEMON_SOCKET"
+DAEMON_ENV_VAR = "GLOBUS_CLI_DAEMON"
+
+# the prefix of environment variables which must match between the daemon and a
+# client, because some of them are read when modules are imported
+ENV_VAR_PREFIX = "GLOBUS_"
+
+# the environment variables which are passed to a command run by the daemon, in
+# addition to those with ENV_VAR_PREFIX; anything else in the client's
+# environment is not read by the CLI, and is not sent
+FORWARDED_ENV_VARS = frozenset(
+    (
+        # locations of the user's files, and of the CLI's data
+        "HOME",
+        "USER",
+        "LOGNAME",
+        "TMPDIR",
+        "APPDATA",
+        "LOCALAPPDATA",
+        "PIPX_HOME",
+        # the terminal and shell
+        "PATH",
+        "SHELL",
+        "TERM",
+        "COLUMNS",
+        "LINES",
+        "NO_COLOR",
+        "LANG",
+        "LANGUAGE",
+        "TZ",
+        "EDITOR",
+        "VISUAL",
+        "PAGER",
+        # detection of remote sessions, and opening a browser for login
+        "SSH_TTY",
+        "SSH_CONNECTION",
+        "BROWSER",
+        "DISPLAY",
+        "WAYLAND_DISPLAY",
+        # network configuration
+        "HTTP_PROXY",
+        "HTTPS_PROXY",
+        "ALL_PROXY",
+        "NO_PROXY",
+        "http_proxy",
+        "https_proxy",
+        "all_proxy",
+        "no_proxy",
+        "REQUESTS_CA_BUNDLE",
+        "CURL_CA_BUNDLE",
+        "SSL_CERT_FILE",
+        "SSL_CERT_DIR",
+    )
+)
+# prefixes of other forwarded variables: locale and XDG settings, and those used
+# by shell completion
+FORWARDED_ENV_VAR_PREFIXES = ("LC_", "XDG_", "COMP_", "_GLOBUS_")
+
+_HEADER = struct.Struct("!I")
+_MAX_MESSAGE_SIZE = 16 * 1024 * 1024
+_MAX_FDS = 3
+# credentials of the peer of a socket: 'struct ucred' on Linux, and the start of
+# 'struct xucred' on macOS and BSD
+_PEERCRED = struct.Struct("3i")
+_XUCRED_PREFIX = struct.Struct("2I")
+_SOL_LOCAL = 0
+
+
+class ProtocolError(Exception):
+    pass
+
+
+def forwarding_disabled() -> bool:
+    val = os.getenv(DAEMON_ENV_VAR, "").strip().lower()
+    return val in ("n", "no", "f", "false", "off", "0")
+
+
+def get_socket_path() -> str:
+    explicit_path = os.getenv(SOCKET_ENV_VAR)
+    if explicit_path:
+        return explicit_path
+    return os.path.join(_get_socket_dir(), "daemon.sock")
+
+
+def _get_socket_dir() -> str:
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return os.path.join(runtime_dir, f"globus-cli-{uid}")
+
+
+def ensure_socket_dir(socket_path: str) -> None:
+    """
+    Create the directory for the socket, if needed, and check that it is private
+    to the current user.
+    """
+    os.makedirs(os.path.dirname(socket_path) or ".", mode=0o700, exist_ok=True)
+    check_socket_dir(socket_path)
+
+
+def check_socket_dir(socket_path: str) -> None:
+    """
+    Check that the directory for the socket is private to the current user.
+
+    Otherwise, another user could have created it, and be listening on the socket.
+
+    :raises OSError: if the directory does not exist
+    :raises RuntimeError: if the directory is not private
+    """
+    dirname = os.path.dirname(socket_path) or "."
+    stat = os.stat(dirname)
+    if stat.st_uid != os.getuid() or stat.st_mode & 0o077:
+        raise RuntimeError(
+            f"{dirname} must be owned by the current user and not accessible to "
+            "other users"
+        )
+
+
+def peer_uid(sock: socket.socket) -> int | None:
+    """
+    Get the user ID of the process on the other end of a connected socket, or None
+    if it cannot be found on this platform.
+    """
+    so_peercred = getattr(socket, "SO_PEERCRED", None)
+    if so_peercred is not None:  # Linux
+        creds = sock.getsockopt(socket.SOL_SOCKET, so_peercred, _PEERCRED.size)
+        _, uid, _ = _PEERCRED.unpack(creds)
+        return int(uid)
+    local_peercred = getattr(socket, "LOCAL_PEERCRED", None)
+    if local_peercred is not None:  # macOS and BSD
+        # a 'struct xucred', which starts with a version number and then the uid
+        creds = sock.getsockopt(_SOL_LOCAL, local_peercred, _XUCRED_PREFIX.size)
+        _, uid = _XUCRED_PREFIX.unpack(creds)
+        return int(uid)
+    return None
+
+
+def peer_is_current_user(sock: socket.socket) -> bool:
+    try:
+        return peer_uid(sock) == os.getuid()
+    except OSError:
+        return False
+
+
+def forwarded_environment(env: t.Mapping[str, str]) -> dict[str, str]:
+    """Select the environment variables which a command run by the daemon needs."""
+    return {
+        k: v
+        for k, v in env.items()
+        if k.startswith(ENV_VAR_PREFIX)
+        or k in FORWARDED_ENV_VARS
+        or k.startswith(FORWARDED_ENV_VAR_PREFIXES)
+    }
+
+
+def environment_fingerprint(env: t.Mapping[str, str]) -> dict[str, str]:
+    return {k: v for k, v in env.items() if k.startswith(ENV_VAR_PREFIX)}
+
+
+def daemon_identity() -> dict[str, t.Any]:
+    """Information which must match between the daemon and its clients."""
+    return {
+        "version": __version__,
+        "python": sys.executable,
+        "env": environment_fingerprint(os.environ),
+    }
+
+
+def send_message(
+    sock: socket.socket, message: dict[str, t.Any], fds: t.Sequence[int] = ()
+) -> None:
+    payload = json.dumps(message).encode("utf-8")
+    header = _HEADER.pack(len(payload))
+    if fds:
+        socket.send_fds(sock, [header], list(fds))
+    else:
+        sock.sendall(header)
+    sock.sendall(payload)
+
+
+def recv_message(
+    sock: socket.socket, *, accept_fds: bool = False, max_fds: int = _MAX_FDS
+) -> tuple[dict[str, t.Any] | None, list[int]]:
+    """
+    Receive a message, and any file descriptors sent with it.
+
+    :param max_fds: the most file descriptors which may be received
+
+    :returns: the message, or None if the connection was closed before a message
+        was received, and the received file descriptors
+    """
+    fds: list[int] = []
+    if accept_fds:
+        data, fds, _, _ = socket.recv_fds(sock, _HEADER.size, max_fds)
+    else:
+        data = sock.recv(_HEADER.size)
+    if not data:
+        return None, fds
+
+    try:
+        header = data + _recv_exactly(sock, _HEADER.size - len(data))
+        (size,) = _HEADER.unpack(header)
+        if size > _MAX_MESSAGE_SIZE:
+            raise ProtocolError(f"message too large ({size} bytes)")
+        message = json.loads(_recv_exactly(sock, size))
+        if not isinstance(message, dict):
+            raise ProtocolError("message was not a JSON object")
+    except BaseException:
+        for fd in fds:
+            os.close(fd)
+        raise
+    return message, fds
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size > 0:
+        chunk = sock.recv(min(size, 65536))
+        if not chunk:
+            raise ProtocolError("connection closed mid-message")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def connect(socket_path: str, *, timeout: float | None = None) -> socket.socket:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        sock.connect(socket_path)
+    except BaseException:
+        sock.close()
+        raise
+    return sock
@@ -0,0 +1,373 @@
+"""
+The CLI daemon's server loop.
+
+The daemon imports the CLI, the SDK and the full command tree once, and then forks
+a child process to run each command. Forking keeps commands isolated from one
+another (environment, working directory, process-wide state) while sparing each of
+them the cost of starting up. Network connections and open databases cannot be
+safely shared between forked processes, so the daemon opens none of either.
+
+The daemon handles each connection on its own thread, but a process forked from a
+multithreaded one inherits any locks that other threads held at the time (for
+logging, imports, and so on), which are then never released. So command processes
+are forked by a fork server instead: a process forked from the daemon before it
+starts any threads, which only ever runs on one thread.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import signal
+import socket
+import sys
+import threading
+import traceback
+import typing as t
+
+from . import protocol
+
+log = logging.getLogger(__name__)
+
+# by default, the daemon exits after this many seconds without a request
+DEFAULT_IDLE_TIMEOUT = 3 * 60 * 60
+
+_SDK_CLIENT_CLASSES = (
+    "AuthClient",
+    "AuthLoginClient",
+    "ConfidentialAppAuthClient",
+    "FlowsClient",
+    "GCSClient",
+    "GroupsClient",
+    "SearchClient",
+    "SpecificFlowClient",
+    "TimersClient",
+    "TransferClient",
+)
+
+
+def preload() -> None:
+    """Import everything that a command might need."""
+    import click
+    import globus_sdk
+
+    from globus_cli.commands import main
+
+    for name in _SDK_CLIENT_CLASSES:
+        getattr(globus_sdk, name)
+
+    def load_group(group: click.Group, ctx: click.Context) -> None:
+        for name in group.list_commands(ctx):
+            cmd = group.get_command(ctx, name)
+            if isinstance(cmd, click.Group):
+                load_group(cmd, click.Context(cmd, parent=ctx, info_name=name))
+
+    load_group(main, click.Context(main, info_name="globus"))
+    # a sample of modules which are imported by commands only as they run
+    import globus_cli.login_manager.connection_pool  # noqa: F401
+    import globus_cli.services.auth  # noqa: F401
+    import globus_cli.services.gcs  # noqa: F401
+    import globus_cli.services.transfer  # noqa: F401
+    import globus_cli.termio.printers  # noqa: F401
+
+
+class Daemon:
+    """
+    :param socket_path: the path of the socket on which to listen
+    :param idle_timeout: exit after this many seconds without a request; if 0,
+        never exit
+    """
+
+    def __init__(self, socket_path: str, *, idle_timeout: float) -> None:
+        self.socket_path = socket_path
+        self.idle_timeout = idle_timeout
+        self.identity = protocol.daemon_identity()
+        self._stopping = threading.Event()
+        self._sock: socket.socket | None = None
+        self._fork_server = ForkServer()
+
+    def bind(self) -> None:
+        """
+        Start the fork server, and listen on the socket.
+
+        This must be called before the daemon starts any threads.
+        """
+        self._fork_server.start()
+        protocol.ensure_socket_dir(self.socket_path)
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.bind(self.socket_path)
+        os.chmod(self.socket_path, 0o600)
+        sock.listen(128)
+        self._sock = sock
+
+    def serve_forever(self) -> None:
+        assert self._sock is not None
+        # wake up periodically to check whether the daemon has been stopped
+        self._sock.settimeout(1)
+        idle_for = 0.0
+        try:
+            while not self._stopping.is_set():
+                try:
+                    conn, _ = self._sock.accept()
+                except socket.timeout:
+                    idle_for += 1
+                    if self.idle_timeout and idle_for >= self.idle_timeout:
+                        log.debug("exiting after %ds idle", self.idle_timeout)
+                        break
+                    continue
+                idle_for = 0
+                # a client which is slow to send its request must not hold up
+                # any others, so each connection is handled on its own thread
+                threading.Thread(
+                    target=self._handle_connection, args=(conn,), daemon=True
+                ).start()
+        finally:
+            self.close()
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    def close(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+            try:
+                os.unlink(self.socket_path)
+            except FileNotFoundError:
+                pass
+        self._fork_server.stop()
+
+    def _handle_connection(self, conn: socket.socket) -> None:
+        with conn:
+            self._handle(conn)
+
+    def _handle(self, conn: socket.socket) -> None:
+        if not protocol.peer_is_current_user(conn):
+            log.debug("refused a connection from another user")
+            return
+        conn.settimeout(5)
+        try:
+            request, fds = protocol.recv_message(conn, accept_fds=True)
+        except (OSError, protocol.ProtocolError) as err:
+            log.debug("bad request: %s", err)
+            return
+        if request is None:
+            return
+
+        try:
+            op = request.get("op")
+            if op == "run":
+                self._handle_run(conn, request, fds)
+            elif op == "status":
+                protocol.send_message(
+                    conn, {"pid": os.getpid(), "identity": self.identity}
+                )
+            elif op == "stop":
+                protocol.send_message(conn, {"stopping": True})
+                self.stop()
+            else:
+                protocol.send_message(conn, {"error": f"unknown op: {op}"})
+        except OSError as err:
+            log.debug("could not reply to a client: %s", err)
+        finally:
+            for fd in fds:
+                os.close(fd)
+
+    def _handle_run(
+        self, conn: socket.socket, request: dict[str, t.Any], fds: list[int]
+    ) -> None:
+        if request.get("identity") != self.identity:
+            protocol.send_message(
+                conn, {"fallback": "the client does not match the daemon"}
+            )
+            return
+        if len(fds) != 3:
+            protocol.send_message(conn, {"fallback": "standard streams not received"})
+            return
+
+        self._fork_server.run(conn, request, fds)
+
+
+class ForkServer:
+    """
+    A process which forks a child process to run each command, on behalf of the
+    daemon's connection threads.
+
+    The client's connection and standard streams are passed to the fork server,
+    and the command process replies to the client directly.
+    """
+
+    def __init__(self) -> None:
+        self.pid: int | None = None
+        self._sock: socket.socket | None = None
+        # requests are sent from many connection threads
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Fork the fork server. This must be called before any threads start."""
+        sock, server_sock = socket.socketpair()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover (runs in the fork server)
+            exit_code = 1
+            try:
+                sock.close()
+                # an interrupt is meant for the daemon, which stops the fork server
+                # by closing its socket
+                signal.signal(signal.SIGINT, signal.SIG_IGN)
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                # command processes are never waited on, so have them reaped
+                signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+                _serve_forks(server_sock)
+                exit_code = 0
+            finally:
+                os._exit(exit_code)
+
+        server_sock.close()
+        self.pid = pid
+        self._sock = sock
+
+    def run(
+        self, conn: socket.socket, request: dict[str, t.Any], fds: list[int]
+    ) -> None:
+        """Run a command in a new process, which replies to the client on ``conn``."""
+        if self._sock is None:
+            protocol.send_message(conn, {"fallback": "the daemon is stopping"})
+            return
+        with self._lock:
+            protocol.send_message(self._sock, request, [conn.fileno(), *fds])
+
+    def stop(self) -> None:
+        if self._sock is None:
+            return
+        self._sock.close()
+        self._sock = None
+        # the fork server exits once its socket is closed
+        try:
+            os.waitpid(t.cast(int, self.pid), 0)
+        except ChildProcessError:  # already reaped
+            pass
+
+
+def _serve_forks(sock: socket.socket) -> None:  # pragma: no cover (fork server)
+    while True:
+        try:
+            request, fds = protocol.recv_message(sock, accept_fds=True, max_fds=4)
+        except (OSError, protocol.ProtocolError):
+            return
+        if request is None:  # the daemon has exited
+            return
+
+        conn = socket.socket(fileno=fds[0])
+        try:
+            pid = os.fork()
+        except OSError as err:
+            try:
+                protocol.send_message(conn, {"fallback": f"could not fork: {err}"})
+            except OSError:
+                pass
+            pid = -1
+
+        if pid == 0:
+            exit_code = 1
+            try:
+                sock.close()
+                protocol.send_message(conn, {"pid": os.getpid()})
+                exit_code = run_command(request, fds[1:])
+                protocol.send_message(conn, {"exit_code": exit_code})
+            finally:
+                os._exit(exit_code)
+
+        conn.close()
+        for fd in fds[1:]:
+            os.close(fd)
+
+
+def run_command(request: dict[str, t.Any], fds: list[int]) -> int:
+    """
+    Run a command in the current process, as the client which requested it.
+
+    :returns: the exit code of the command
+    """
+    from globus_cli.commands import main
+
+    for sig in (signal.SIGINT, signal.SIGTERM, signal.SIGCHLD, signal.SIGHUP):
+        signal.signal(sig, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+
+    for target_fd, fd in enumerate(fds):
+        os.dup2(fd, target_fd)
+        os.close(fd)
+    _open_standard_streams()
+    os.environ.clear()
+    os.environ.update(request["env"])
+    os.chdir(request["cwd"])
+
+    argv = request["argv"]
+    sys.argv = argv
+    exit_code = 0
+    try:
+        # in standalone mode, click always exits
+        main.main(args=argv[1:], prog_name=os.path.basename(argv[0]))
+    except SystemExit as err:
+        if err.code is None:
+            exit_code = 0
+        elif isinstance(err.code, int):
+            exit_code = err.code
+        else:
+            print(err.code, file=sys.stderr)
+            exit_code = 1
+    except BaseException:
+        traceback.print_exc()
+        exit_code = 1
+    finally:
+        for stream in (sys.stdout, sys.stderr):
+            try:
+                stream.flush()
+            except (OSError, ValueError):
+                pass
+    return exit_code
+
+
+def _open_standard_streams() -> None:
+    """
+    Replace the standard stream objects inherited from the daemon, which may hold
+    buffered output, with new ones for the client's standard streams.
+    """
+    for fd, name in enumerate(("stdin", "stdout", "stderr")):
+        inherited = getattr(sys, name)
+        stream = open(
+            fd,
+            "r" if fd == 0 else "w",
+            encoding=getattr(inherited, "encoding", None),
+            errors="backslashreplace" if name == "stderr" else None,
+            closefd=False,
+        )
+        if fd != 0:
+            stream.reconfigure(line_buffering=name == "stderr" or os.isatty(fd))
+        setattr(sys, name, stream)
+
+
+def serve(socket_path: str, *, idle_timeout: float = DEFAULT_IDLE_TIMEOUT) -> None:
+    """Run the daemon in the current process until it is stopped."""
+    preload()
+    daemon = Daemon(socket_path, idle_timeout=idle_timeout)
+    daemon.bind()
+
+    signal.signal(signal.SIGTERM, lambda *_: daemon.stop())
+    signal.signal(signal.SIGINT, lambda *_: daemon.stop())
+    daemon.serve_forever()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the Globus CLI daemon.")
+    parser.add_argument("--socket", default=protocol.get_socket_path())
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT)
+    args = parser.parse_args()
+    serve(args.socket, idle_timeout=args.idle_timeout)
+
+
+if __name__ == "__main__":
+    main()
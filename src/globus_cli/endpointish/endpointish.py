@@ -24,14 +24,23 @@ class Endpointish:
         self.endpoint_id = endpoint_id
 
         log.debug("Endpointish getting ep data")
-        res = self._client.get_endpoint(endpoint_id)
-        self.data = res.data
+        self.data = self._get_endpoint_data()
         log.debug("Endpointish.data=%s", self.data)
 
         log.debug("Endpointish determine entity type")
         self.entity_type = EntityType.determine_entity_type(self.data)
         log.debug("Endpointish.entity_type=%s", self.entity_type)
 
+    def _get_endpoint_data(self) -> dict[str, t.Any]:
+        from globus_cli.services.transfer import CustomTransferClient
+
+        # the CLI's own client may serve the document from a cache
+        if isinstance(self._client, CustomTransferClient):
+            return self._client.get_endpoint_data(self.endpoint_id)
+        return t.cast(
+            t.Dict[str, t.Any], self._client.get_endpoint(self.endpoint_id).data
+        )
+
     @property
     def nice_type_name(self) -> str:
         return EntityType.nice_name(self.entity_type)
@@ -0,0 +1,29 @@
+"""
+The ``globus`` console script.
+
+When a CLI daemon is running, commands are forwarded to it. Otherwise, they run in
+this process.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+# imported first, to time the startup of the CLI
+from globus_cli import profiling
+
+
+def main() -> None:
+    if sys.platform != "win32":
+        from globus_cli.daemon.client import forward_to_daemon
+
+        exit_code = forward_to_daemon(sys.argv)
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    imports_started_at = time.perf_counter()
+    from globus_cli.commands import main as cli_main
+
+    profiling.record_startup(imports_started_at)
+    cli_main()
@@ -16,16 +16,16 @@ import typing as t
 
 import click
 import click.exceptions
+import globus_sdk
 
+from globus_cli.login_manager.consent_cache import ConsentForestCache
+from globus_cli.login_manager.token_validation import TokenValidationCache
 from globus_cli.parsing.command_state import CommandState
 
-from .hooks import register_all_hooks
 from .registry import invoke_exception_handler
 
 E = t.TypeVar("E", bound=Exception)
 
-register_all_hooks()
-
 
 def custom_except_hook(exc_info: tuple[type[E], E, types.TracebackType]) -> t.NoReturn:
     """
@@ -44,6 +44,14 @@ def custom_except_hook(exc_info: tuple[type[E], E, types.TracebackType]) -> t.No
 
     # we're not in debug mode, do custom handling
 
+    # if the error indicates that credentials were rejected, any cached token
+    # validation results may be stale
+    if _is_authentication_failure(exception):
+        TokenValidationCache().clear()
+    # similarly, if consents are missing, any cached consent data may be stale
+    if _is_consent_failure(exception):
+        ConsentForestCache().clear()
+
     # look for a relevant registered handler
     invoke_exception_handler(exception)
 
@@ -63,3 +71,18 @@ def custom_except_hook(exc_info: tuple[type[E], E, types.TracebackType]) -> t.No
         err=True,
     )
     click.get_current_context().exit(1)
+
+
+def _is_authentication_failure(exception: Exception) -> bool:
+    if not isinstance(exception, globus_sdk.GlobusAPIError):
+        return False
+    return exception.http_status == 401 or (
+        isinstance(exception, globus_sdk.AuthAPIError)
+        and exception.message == "invalid_grant"
+    )
+
+
+def _is_consent_failure(exception: Exception) -> bool:
+    return isinstance(exception, globus_sdk.GlobusAPIError) and bool(
+        exception.info.consent_required
+    )
@@ -1,70 +1,89 @@
+"""
+The hook modules are loaded lazily, only when an exception is being handled, and
+then only the modules with hooks for that type of exception.
+
+Most commands succeed, and the hook modules import much of globus_sdk, so this
+keeps them out of the startup of every command.
+"""
+
 from __future__ import annotations
 
+import importlib
 import typing as t
 
-from ..registry import DeclaredHook, register_hook
-from .auth_requirements import (
-    consent_required_hook,
-    handle_internal_auth_requirements,
-    missing_login_error_hook,
-    session_hook,
-)
-from .authapi_hooks import (
-    authapi_hook,
-    authapi_unauthenticated_hook,
-    invalidrefresh_hook,
-)
-from .endpoint_types import wrong_endpoint_type_error_hook
-from .flows_hooks import (
-    flows_error_hook,
-    flows_validation_error_hook,
-    handle_flows_gare,
-)
-from .generic_hooks import (
-    globus_error_hook,
-    globusapi_hook,
-    json_error_handler,
-    null_data_error_handler,
+from ..registry import DeclaredHook
+
+
+class _IndexEntry(t.NamedTuple):
+    # the name of the error class which the hook handles; an exception can only
+    # match the hook if it is an instance of a class with this name
+    error_class: str
+    module: str
+    hook: str
+
+
+# all hooks, in priority order
+#
+# the error class of each hook is also declared on the hook itself, and the
+# testsuite checks that the two agree
+_HOOK_INDEX: tuple[_IndexEntry, ...] = (
+    # first, the generic hooks which filter out conditions
+    # running 'null data' first ensures that every other
+    # hook can assume that there is a JSON body
+    # and running json_error_handler at the start means we know (in the
+    # following hooks) that the output format is not JSON
+    _IndexEntry("GlobusAPIError", "generic_hooks", "null_data_error_handler"),
+    _IndexEntry("GlobusAPIError", "generic_hooks", "json_error_handler"),
+    # next, authn and session requirements, from most specific to most general
+    _IndexEntry(
+        "CLIAuthRequirementsError",
+        "auth_requirements",
+        "handle_internal_auth_requirements",
+    ),
+    _IndexEntry("FlowsAPIError", "flows_hooks", "handle_flows_gare"),
+    _IndexEntry("GlobusAPIError", "auth_requirements", "consent_required_hook"),
+    _IndexEntry("GlobusAPIError", "auth_requirements", "session_hook"),
+    # CLI internal error types, which cannot be confused with external causes
+    _IndexEntry("MissingLoginError", "auth_requirements", "missing_login_error_hook"),
+    _IndexEntry(
+        "WrongEntityTypeError", "endpoint_types", "wrong_endpoint_type_error_hook"
+    ),
+    # service-specific hooks uncaptured by earlier checks
+    # each service has internal precedence ordering, but the collections could
+    # probably be put in any order
+    _IndexEntry("AuthAPIError", "authapi_hooks", "authapi_unauthenticated_hook"),
+    _IndexEntry("AuthAPIError", "authapi_hooks", "invalidrefresh_hook"),
+    _IndexEntry("AuthAPIError", "authapi_hooks", "authapi_hook"),
+    _IndexEntry("TransferAPIError", "transfer_hooks", "transfer_unauthenticated_hook"),
+    _IndexEntry("TransferAPIError", "transfer_hooks", "transferapi_hook"),
+    _IndexEntry("FlowsAPIError", "flows_hooks", "flows_validation_error_hook"),
+    _IndexEntry("FlowsAPIError", "flows_hooks", "flows_error_hook"),
+    _IndexEntry("SearchAPIError", "search_hooks", "searchapi_validationerror_hook"),
+    _IndexEntry("SearchAPIError", "search_hooks", "searchapi_hook"),
+    # finally, the catch-all hooks
+    _IndexEntry("GlobusAPIError", "generic_hooks", "globusapi_hook"),
+    _IndexEntry("GlobusError", "generic_hooks", "globus_error_hook"),
 )
-from .search_hooks import searchapi_hook, searchapi_validationerror_hook
-from .transfer_hooks import transfer_unauthenticated_hook, transferapi_hook
 
 
-def register_all_hooks() -> None:
-    """
-    Load and register all hook functions.
-    """
-    for hook in _sort_all_hooks():
-        register_hook(hook)
+def _load_hook(entry: _IndexEntry) -> DeclaredHook[t.Any]:
+    module = importlib.import_module(f"{__name__}.{entry.module}")
+    return t.cast(DeclaredHook[t.Any], getattr(module, entry.hook))
 
 
-def _sort_all_hooks() -> t.Iterable[DeclaredHook[t.Any]]:
-    """
-    Iterate over all hooks in priority order.
+def get_candidate_hooks(
+    *exceptions: BaseException,
+) -> t.Iterator[DeclaredHook[t.Any]]:
     """
-    # format as a list of lists for readability
-    sorted_hook_collections: list[list[DeclaredHook[t.Any]]] = [
-        # first, the generic hooks which filter out conditions
-        # running 'null data' first ensures that every other
-        # hook can assume that there is a JSON body
-        # and running json_error_handler at the start means we know (in the
-        # following hooks) that the output format is not JSON
-        [null_data_error_handler, json_error_handler],
-        # next, authn and session requirements, from most specific to most general
-        [handle_internal_auth_requirements, handle_flows_gare],
-        [consent_required_hook, session_hook],
-        # CLI internal error types, which cannot be confused with external causes
-        [missing_login_error_hook, wrong_endpoint_type_error_hook],
-        # service-specific hooks uncaptured by earlier checks
-        # each service has internal precedence ordering, but the collections could
-        # probably be put in any order
-        [authapi_unauthenticated_hook, invalidrefresh_hook, authapi_hook],
-        [transfer_unauthenticated_hook, transferapi_hook],
-        [flows_validation_error_hook, flows_error_hook],
-        [searchapi_validationerror_hook, searchapi_hook],
-        # finally, the catch-all hooks
-        [globusapi_hook, globus_error_hook],
-    ]
+    Load the hooks which could handle any of the given exceptions, and iterate over
+    them in priority order.
 
-    for hook_collection in sorted_hook_collections:
-        yield from hook_collection
+    Candidates are found by the names of the exceptions' classes, without loading
+    any hook modules, so a hook's condition must still be checked.
+    """
+    class_names = {
+        cls.__name__ for exception in exceptions for cls in type(exception).__mro__
+    }
+    for entry in _HOOK_INDEX:
+        if entry.error_class in class_names:
+            yield _load_hook(entry)
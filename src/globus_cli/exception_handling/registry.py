@@ -19,17 +19,13 @@ _HOOK_SRC_TYPE = t.Union[t.Callable[[E], None], t.Callable[[E], t.Optional[int]]
 
 CONDITION_TYPE = t.Callable[[E], bool]
 
-_REGISTERED_HOOKS: list[DeclaredHook[t.Any]] = []
-
 
 @dataclasses.dataclass
 class DeclaredHook(t.Generic[E]):
     hook_func: HOOK_TYPE[E]
     condition: CONDITION_TYPE[E]
-
-
-def register_hook(hook: DeclaredHook[t.Any]) -> None:
-    _REGISTERED_HOOKS.append(hook)
+    # the error class which the hook handles, or its name in globus_sdk
+    error_class: str | type[Exception]
 
 
 def sdk_error_handler(
@@ -39,7 +35,9 @@ def sdk_error_handler(
     exit_status: int = 1,
 ) -> t.Callable[[_HOOK_SRC_TYPE[E_Globus]], DeclaredHook[E_Globus]]:
     return _error_handler(
-        condition=_build_condition(condition, error_class), exit_status=exit_status
+        condition=_build_condition(condition, error_class),
+        error_class=error_class,
+        exit_status=exit_status,
     )
 
 
@@ -49,21 +47,29 @@ def error_handler(
     exit_status: int = 1,
 ) -> t.Callable[[_HOOK_SRC_TYPE[E]], DeclaredHook[E]]:
     return _error_handler(
-        condition=_build_condition(None, error_class), exit_status=exit_status
+        condition=_build_condition(None, error_class),
+        error_class=error_class,
+        exit_status=exit_status,
     )
 
 
 def invoke_exception_handler(exception: Exception) -> None:
     """
-    Find and invoke a registered exception handler for the given exception.
+    Find and invoke an exception handler for the given exception. Only the hook
+    modules which could handle it are loaded.
 
     The first handler with a matching condition for either the exception or the
     origin exception (if applicable) is invoked and no further handlers are checked.
 
     Has no effect if no handlers match.
     """
+    from .hooks import get_candidate_hooks
+
+    candidates: list[BaseException] = [exception]
+    if isinstance(exception, CLIAuthRequirementsError) and exception.origin:
+        candidates.append(exception.origin)
 
-    for hook in _REGISTERED_HOOKS:
+    for hook in get_candidate_hooks(*candidates):
         if hook.condition(exception):
             hook.hook_func(exception)
 
@@ -77,6 +83,7 @@ def invoke_exception_handler(exception: Exception) -> None:
 def _error_handler(
     *,
     condition: t.Callable[[E], bool],
+    error_class: str | type[Exception],
     exit_status: int = 1,
 ) -> t.Callable[[_HOOK_SRC_TYPE[E]], DeclaredHook[E]]:
     """
@@ -104,7 +111,7 @@ def _error_handler(
 
             ctx.exit(exit_status)
 
-        return DeclaredHook(wrapped, condition)
+        return DeclaredHook(wrapped, condition, error_class)
 
     return inner_decorator
 
@@ -0,0 +1,216 @@
+"""
+Persistent local caches for data fetched from Globus services.
+
+Cached data is stored in a SQLite database in the CLI data dir, separate from the
+token storage. Each cache has its own namespace, which includes the current
+environment, and its own default time-to-live for entries.
+
+Caching is purely an optimization: any failure to read or write a cache is treated
+as a cache miss. Caches can be bypassed by setting ``GLOBUS_CLI_DISABLE_CACHE``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import typing as t
+
+from globus_cli import utils
+
+log = logging.getLogger(__name__)
+
+# env vars used throughout this module
+GLOBUS_ENV = os.environ.get("GLOBUS_SDK_ENVIRONMENT")
+DISABLE_CACHE_ENV_VAR = "GLOBUS_CLI_DISABLE_CACHE"
+
+_SCHEMA = """\
+CREATE TABLE IF NOT EXISTS cache_entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS cache_entries_by_age
+    ON cache_entries (namespace, stored_at);
+"""
+
+_CONNECTIONS: dict[str, sqlite3.Connection] = {}
+_CONNECTION_LOCK = threading.RLock()
+
+
+def caching_disabled() -> bool:
+    val = os.getenv(DISABLE_CACHE_ENV_VAR)
+    return val is not None and bool(utils.str2bool(val))
+
+
+class LocalCache:
+    """
+    A persistent key-value cache with per-entry expiration and a bound on size.
+
+    Values must be JSON-serializable. ``None`` is a valid value, which allows
+    callers to record negative results; use a sentinel ``default`` with ``get`` to
+    distinguish those from cache misses.
+
+    :param name: the name of the cache, used to namespace its entries
+    :param ttl: the default lifetime of entries, in seconds
+    :param max_entries: when more than this many entries are stored, the oldest
+        entries are evicted
+    """
+
+    def __init__(self, name: str, *, ttl: float, max_entries: int = 10_000) -> None:
+        self.namespace = f"{name}/{GLOBUS_ENV or 'production'}"
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+    def get(self, key: str, default: t.Any = None) -> t.Any:
+        return self.get_many((key,)).get(key, default)
+
+    def get_many(self, keys: t.Iterable[str]) -> dict[str, t.Any]:
+        """
+        Look up several keys at once.
+
+        :returns: a dict containing only the keys which were found
+        """
+        keys = list(keys)
+        if not keys or caching_disabled():
+            return {}
+
+        placeholders = ",".join("?" * len(keys))
+        rows = self._execute(
+            "SELECT key, value FROM cache_entries "
+            f"WHERE namespace = ? AND expires_at > ? AND key IN ({placeholders})",
+            (self.namespace, time.time(), *keys),
+        )
+        return {key: json.loads(value) for key, value in rows}
+
+    def items(self) -> list[tuple[str, t.Any]]:
+        """
+        Get all of the entries in the cache.
+
+        :returns: (key, value) pairs, most recently stored first
+        """
+        if caching_disabled():
+            return []
+
+        rows = self._execute(
+            "SELECT key, value FROM cache_entries "
+            "WHERE namespace = ? AND expires_at > ? ORDER BY stored_at DESC",
+            (self.namespace, time.time()),
+        )
+        return [(key, json.loads(value)) for key, value in rows]
+
+    def set(self, key: str, value: t.Any, *, ttl: float | None = None) -> None:
+        self.set_many({key: value}, ttl=ttl)
+
+    def set_many(
+        self, items: t.Mapping[str, t.Any], *, ttl: float | None = None
+    ) -> None:
+        if not items or caching_disabled():
+            return
+
+        now = time.time()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        self._executemany(
+            "INSERT OR REPLACE INTO cache_entries "
+            "(namespace, key, value, stored_at, expires_at) VALUES (?, ?, ?, ?, ?)",
+            [
+                (self.namespace, key, json.dumps(value), now, expires_at)
+                for key, value in items.items()
+            ],
+        )
+        self._evict(now)
+
+    def delete(self, key: str) -> None:
+        self._execute(
+            "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+            (self.namespace, key),
+        )
+
+    def clear(self) -> None:
+        self._execute(
+            "DELETE FROM cache_entries WHERE namespace = ?", (self.namespace,)
+        )
+
+    def _evict(self, now: float) -> None:
+        # counting the entries is cheap, and most writes leave the cache under
+        # its limit, so only then are expired and excess entries removed
+        rows = self._execute(
+            "SELECT COUNT(*) FROM cache_entries WHERE namespace = ?",
+            (self.namespace,),
+        )
+        if not rows or rows[0][0] <= self.max_entries:
+            return
+
+        self._execute(
+            "DELETE FROM cache_entries WHERE namespace = ? AND expires_at <= ?",
+            (self.namespace, now),
+        )
+        # the oldest entries are found by walking the index by age, without sorting
+        self._execute(
+            "DELETE FROM cache_entries WHERE namespace = ? AND key IN ("
+            "  SELECT key FROM cache_entries WHERE namespace = ?"
+            "  ORDER BY stored_at DESC LIMIT -1 OFFSET ?"
+            ")",
+            (self.namespace, self.namespace, self.max_entries),
+        )
+
+    def _execute(
+        self, query: str, params: t.Sequence[t.Any]
+    ) -> list[tuple[t.Any, ...]]:
+        try:
+            with _CONNECTION_LOCK:
+                conn = _get_connection()
+                with conn:
+                    return conn.execute(query, params).fetchall()
+        except sqlite3.Error as err:
+            log.debug("local cache query failed (%s): %s", self.namespace, err)
+            return []
+
+    def _executemany(self, query: str, params: list[tuple[t.Any, ...]]) -> None:
+        try:
+            with _CONNECTION_LOCK:
+                conn = _get_connection()
+                with conn:
+                    conn.executemany(query, params)
+        except sqlite3.Error as err:
+            log.debug("local cache update failed (%s): %s", self.namespace, err)
+
+
+def clear_all_caches() -> None:
+    """Remove all entries from all local caches."""
+    try:
+        with _CONNECTION_LOCK:
+            conn = _get_connection()
+            with conn:
+                conn.execute("DELETE FROM cache_entries")
+    except sqlite3.Error as err:
+        log.debug("failed to clear local caches: %s", err)
+
+
+def close_connections() -> None:
+    with _CONNECTION_LOCK:
+        for conn in _CONNECTIONS.values():
+            conn.close()
+        _CONNECTIONS.clear()
+
+
+def _get_connection() -> sqlite3.Connection:
+    filename = _get_cache_filename()
+    if filename not in _CONNECTIONS:
+        conn = sqlite3.connect(filename, timeout=1.0, check_same_thread=False)
+        with conn:
+            conn.executescript(_SCHEMA)
+        _CONNECTIONS[filename] = conn
+    return _CONNECTIONS[filename]
+
+
+def _get_cache_filename() -> str:
+    from globus_cli.login_manager.storage import _ensure_data_dir
+
+    return os.path.join(_ensure_data_dir(), "cache.db")
@@ -0,0 +1,122 @@
+"""
+Local indexes of recently seen endpoints, collections, and bookmarks.
+
+Typing IDs is tedious, so shell completion offers the IDs of endpoints and
+collections which the CLI has recently fetched, and the locations of bookmarks.
+The indexes are populated passively, by commands which fetch those objects
+anyway, and are read without any network calls.
+
+Like other local caches, the indexes may be stale, and are only used as hints.
+"""
+
+from __future__ import annotations
+
+import typing as t
+import uuid
+
+from globus_cli.local_cache import LocalCache
+
+# entries which have not been seen for this long are forgotten
+INDEX_TTL = 30 * 24 * 3600
+
+
+class IndexedEndpoint(t.NamedTuple):
+    id: str
+    display_name: str
+
+
+class IndexedBookmark(t.NamedTuple):
+    id: str
+    name: str
+    endpoint_id: str
+    path: str
+
+
+class EndpointIndex:
+    """An index of recently seen endpoints and collections, keyed by ID."""
+
+    def __init__(self) -> None:
+        self._local_cache = LocalCache(
+            "endpoint_index", ttl=INDEX_TTL, max_entries=1000
+        )
+
+    def record(self, endpoint_doc: t.Mapping[str, t.Any]) -> None:
+        endpoint_id = endpoint_doc.get("id")
+        if not isinstance(endpoint_id, str):
+            return
+        display_name = (
+            endpoint_doc.get("display_name") or endpoint_doc.get("canonical_name") or ""
+        )
+        self._local_cache.set(endpoint_id.lower(), {"display_name": display_name})
+
+    def discard(self, endpoint_id: uuid.UUID | str) -> None:
+        self._local_cache.delete(str(endpoint_id).lower())
+
+    def entries(self) -> list[IndexedEndpoint]:
+        """Get the indexed endpoints, most recently seen first."""
+        return [
+            IndexedEndpoint(key, str(value.get("display_name") or ""))
+            for key, value in self._local_cache.items()
+            if isinstance(value, dict)
+        ]
+
+
+_BOOKMARK_KEYS = ("id", "name", "endpoint_id", "path")
+
+
+def _bookmark_value(bookmark: t.Mapping[str, t.Any]) -> dict[str, t.Any]:
+    return {
+        "id": bookmark["id"],
+        "endpoint_id": bookmark["endpoint_id"],
+        "path": bookmark["path"],
+    }
+
+
+class BookmarkIndex:
+    """
+    An index of the current user's bookmarks, keyed by name.
+
+    The index is replaced whenever the full list of bookmarks is fetched, and is
+    updated as bookmarks are created, renamed, and deleted. Bookmarks may also be
+    changed elsewhere, so the ID of a bookmark found by name should be checked
+    against the service before use.
+    """
+
+    def __init__(self) -> None:
+        self._local_cache = LocalCache("bookmark_index", ttl=INDEX_TTL)
+
+    def replace_all(self, bookmarks: t.Iterable[t.Mapping[str, t.Any]]) -> None:
+        self._local_cache.clear()
+        self._local_cache.set_many(
+            {bookmark["name"]: _bookmark_value(bookmark) for bookmark in bookmarks}
+        )
+
+    def record(self, bookmark: t.Mapping[str, t.Any]) -> None:
+        """Add or update a bookmark, replacing any entry with the same ID."""
+        if not all(key in bookmark for key in _BOOKMARK_KEYS):
+            return
+        self.discard(bookmark["id"])
+        self._local_cache.set(bookmark["name"], _bookmark_value(bookmark))
+
+    def discard(self, bookmark_id: uuid.UUID | str) -> None:
+        bookmark_id = str(bookmark_id).lower()
+        for bookmark in self.entries():
+            if bookmark.id.lower() == bookmark_id:
+                self._local_cache.delete(bookmark.name)
+
+    def get(self, name: str) -> IndexedBookmark | None:
+        value = self._local_cache.get(name)
+        if not isinstance(value, dict):
+            return None
+        return IndexedBookmark(value["id"], name, value["endpoint_id"], value["path"])
+
+    def entries(self) -> list[IndexedBookmark]:
+        """Get the indexed bookmarks, sorted by name."""
+        return sorted(
+            (
+                IndexedBookmark(value["id"], key, value["endpoint_id"], value["path"])
+                for key, value in self._local_cache.items()
+                if isinstance(value, dict)
+            ),
+            key=lambda bookmark: bookmark.name,
+        )
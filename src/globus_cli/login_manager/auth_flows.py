@@ -8,6 +8,7 @@ import click
 import globus_sdk
 from globus_sdk.scopes import Scope
 
+from .consent_cache import ConsentForestCache
 from .storage import CLIStorage
 
 
@@ -170,6 +171,8 @@ def exchange_code_and_store(
     if not auth_user_data:
         storage.store_well_known_config("auth_user_data", {"sub": sub_new})
     storage.store(tkn)
+    # the user may have granted new consents during the flow
+    ConsentForestCache().clear()
 
 
 def _response_clock_delta(response: globus_sdk.GlobusHTTPResponse) -> float | None:
@@ -0,0 +1,145 @@
+"""
+A token storage adapter tuned for many concurrent CLI processes sharing one
+storage file, as happens when the CLI is invoked from large batches of jobs.
+
+Compared with the SDK's SQLiteAdapter, this adapter
+- uses WAL journaling, so that readers and a writer do not block one another
+- opens the database read-only until something needs to be written, so that
+  commands which only read tokens never take a write lock
+- loads all token and config data for its namespace in a single query, and
+  serves later reads from that data until something is written
+
+WAL journaling relies on shared memory, and therefore should not be used when the
+storage file is on a network filesystem. For that reason this adapter is opt-in.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import pathlib
+import sqlite3
+import typing as t
+
+import globus_sdk
+from globus_sdk.token_storage.legacy import SQLiteAdapter
+
+log = logging.getLogger(__name__)
+
+
+class ConcurrentSQLiteAdapter(SQLiteAdapter):
+    """
+    A SQLiteAdapter for high read concurrency.
+
+    Takes the same arguments as ``SQLiteAdapter``.
+    """
+
+    def __init__(
+        self,
+        dbname: pathlib.Path | str,
+        *,
+        namespace: str = "DEFAULT",
+        connect_params: dict[str, t.Any] | None = None,
+    ) -> None:
+        self._connect_params = connect_params or {}
+        self._read_only = False
+        # serialized token and config data, as read from the database
+        self._rows: dict[tuple[str, str], str] | None = None
+        super().__init__(dbname, namespace=namespace, connect_params=connect_params)
+
+    def _init_and_connect(
+        self, connect_params: dict[str, t.Any] | None
+    ) -> sqlite3.Connection:
+        if not self._is_memory_db() and self.file_exists():
+            try:
+                conn: sqlite3.Connection = sqlite3.connect(
+                    f"{pathlib.Path(self.dbname).resolve().as_uri()}?mode=ro",
+                    uri=True,
+                    **(connect_params or {}),
+                )
+                # opening the connection is lazy; make sure that the file is readable
+                conn.execute("SELECT 1 FROM token_storage LIMIT 1")
+            except sqlite3.Error as err:
+                log.debug("read-only storage connection failed: %s", err)
+            else:
+                self._read_only = True
+                return conn
+        return self._connect_read_write(connect_params)
+
+    def _connect_read_write(
+        self, connect_params: dict[str, t.Any] | None
+    ) -> sqlite3.Connection:
+        conn = super()._init_and_connect(connect_params)
+        if not self._is_memory_db():
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+            except sqlite3.OperationalError as err:
+                # the mode could not be changed, e.g. because another process holds
+                # a lock; this is only an optimization, so carry on without it
+                log.debug("could not enable WAL journaling: %s", err)
+        self._read_only = False
+        return conn
+
+    def _ensure_writable(self) -> None:
+        if self._read_only:
+            self._connection.close()
+            self._connection = self._connect_read_write(self._connect_params)
+
+    def _read(self, kind: str, name: str) -> dict[str, t.Any] | None:
+        """
+        Read token or config data, loading all token and config data for the
+        namespace in a single query on first use.
+
+        Data is kept serialized so that callers always receive a new dict.
+        """
+        if self._rows is None:
+            self._rows = {
+                (row_kind, row_name): data_json
+                for row_kind, row_name, data_json in self._connection.execute(
+                    "SELECT 'token', resource_server, token_data_json "
+                    "FROM token_storage WHERE namespace=? "
+                    "UNION ALL "
+                    "SELECT 'config', config_name, config_data_json "
+                    "FROM config_storage WHERE namespace=?",
+                    (self.namespace, self.namespace),
+                )
+            }
+        data_json = self._rows.get((kind, name))
+        if data_json is None:
+            return None
+        val = json.loads(data_json)
+        if not isinstance(val, dict):
+            raise ValueError(f"data error: {kind} data was not saved as a dict")
+        return val
+
+    def discard_cached_reads(self) -> None:
+        """Make the next read fetch data from the database."""
+        self._rows = None
+
+    def get_token_data(self, resource_server: str) -> dict[str, t.Any] | None:
+        return self._read("token", resource_server)
+
+    def read_config(self, config_name: str) -> dict[str, t.Any] | None:
+        return self._read("config", config_name)
+
+    def store(self, token_response: globus_sdk.OAuthTokenResponse) -> None:
+        self._ensure_writable()
+        self.discard_cached_reads()
+        super().store(token_response)
+
+    def store_config(
+        self, config_name: str, config_dict: t.Mapping[str, t.Any]
+    ) -> None:
+        self._ensure_writable()
+        self.discard_cached_reads()
+        super().store_config(config_name, config_dict)
+
+    def remove_config(self, config_name: str) -> bool:
+        self._ensure_writable()
+        self.discard_cached_reads()
+        return super().remove_config(config_name)
+
+    def remove_tokens_for_resource_server(self, resource_server: str) -> bool:
+        self._ensure_writable()
+        self.discard_cached_reads()
+        return super().remove_tokens_for_resource_server(resource_server)
@@ -0,0 +1,281 @@
+"""
+A connection pool shared by all of the clients handed out by a LoginManager.
+
+The SDK gives each client its own transport and HTTP session, so a command which
+uses several clients opens at least one connection per client, even when those
+clients talk to the same host (e.g. Auth is used both for token refreshes and for
+identity lookups). Instead, the LoginManager gives its clients transports which
+share one session, so that connections to a host are kept alive and reused across
+clients for the rest of the invocation.
+
+Optionally, connections can be opened speculatively, while a command is still
+being parsed, in a pool which the next LoginManager then adopts.
+"""
+
+from __future__ import annotations
+
+import collections
+import logging
+import os
+import pathlib
+import threading
+import typing as t
+
+from globus_sdk.transport import RequestsTransport
+
+from globus_cli import utils
+from globus_cli.profiling import get_profile
+
+if t.TYPE_CHECKING:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.connectionpool import HTTPConnectionPool
+
+log = logging.getLogger(__name__)
+
+# the number of hosts for which connections are kept, and the number of
+# connections kept for each host
+POOL_HOSTS = 10
+POOL_CONNECTIONS_PER_HOST = 4
+
+WARM_CONNECTIONS_ENV_VAR = "GLOBUS_CLI_WARM_CONNECTIONS"
+
+# the SDK's names for services whose CLI names differ
+_SDK_SERVICE_NAMES = {"timers": "timer"}
+
+# a pool holding speculatively opened connections, not yet adopted by a LoginManager
+_WARM_POOL: SharedConnectionPool | None = None
+_WARM_POOL_LOCK = threading.Lock()
+
+
+class PoolStats(t.NamedTuple):
+    host: str
+    requests: int
+    connections: int
+
+
+class SharedSessionTransport(RequestsTransport):
+    """
+    A transport which sends requests with a session it does not own.
+
+    Closing the transport leaves the session open, for use by other transports.
+    """
+
+    def __init__(
+        self,
+        session: requests.Session,
+        verify_ssl: bool | str | pathlib.Path | None = None,
+        http_timeout: float | None = None,
+    ) -> None:
+        super().__init__(verify_ssl=verify_ssl, http_timeout=http_timeout)
+        # discard the session created by the base class in favor of the shared one
+        super().close()
+        self.session = session
+
+        if get_profile().enabled:
+            from .http_timing import TimedJSONProvider
+
+            self.representation_providers["json"] = TimedJSONProvider(
+                self.representation_providers["json"]
+            )
+
+    def request(self, method: str, url: str, **kwargs: t.Any) -> requests.Response:
+        # output which is ready should not wait on the network, e.g. the items of a
+        # listing while its next page is fetched
+        from globus_cli.termio import flush_buffered_output
+
+        flush_buffered_output()
+        return super().request(method, url, **kwargs)
+
+    def close(self) -> None:
+        pass
+
+
+class SharedConnectionPool:
+    """
+    A size-limited pool of keep-alive connections, shared by many transports.
+
+    The underlying session is created on first use, so that invocations which
+    make no requests do not pay for it.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_hosts: int = POOL_HOSTS,
+        max_connections_per_host: int = POOL_CONNECTIONS_PER_HOST,
+    ) -> None:
+        self.max_hosts = max_hosts
+        self.max_connections_per_host = max_connections_per_host
+        self._session: requests.Session | None = None
+        self._adapter: HTTPAdapter | None = None
+        self._lock = threading.Lock()
+        # stats for host pools which have been evicted from the pool manager
+        self._retired_stats: collections.Counter[tuple[str, str]] = (
+            collections.Counter()
+        )
+
+    @property
+    def session(self) -> requests.Session:
+        with self._lock:
+            if self._session is None:
+                self._session = self._make_session()
+            return self._session
+
+    def _make_session(self) -> requests.Session:
+        from requests.adapters import HTTPAdapter
+
+        from .http_timing import TIMED_POOL_CLASSES, TimedSession
+
+        adapter = HTTPAdapter(
+            pool_connections=self.max_hosts, pool_maxsize=self.max_connections_per_host
+        )
+        # time the connections opened by the pool, for --profile-timings
+        adapter.poolmanager.pool_classes_by_scheme = TIMED_POOL_CLASSES
+        # record the stats for each host pool as it is discarded
+        host_pools = adapter.poolmanager.pools
+        dispose = host_pools.dispose_func
+
+        def _dispose(pool: HTTPConnectionPool) -> None:
+            self._retire(pool)
+            if dispose is not None:
+                dispose(pool)
+
+        host_pools.dispose_func = _dispose
+
+        session = TimedSession()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        self._adapter = adapter
+        return session
+
+    def _retire(self, pool: HTTPConnectionPool) -> None:
+        host = _pool_host(pool)
+        self._retired_stats[(host, "requests")] += pool.num_requests
+        self._retired_stats[(host, "connections")] += pool.num_connections
+
+    def make_transport(self) -> SharedSessionTransport:
+        return SharedSessionTransport(self.session)
+
+    def open_connection(self, url: str) -> None:
+        """
+        Open a connection to the host for ``url`` and keep it in the pool, without
+        sending a request.
+        """
+        import requests
+        from globus_sdk.config import get_ssl_verify
+
+        session, adapter = self.session, self._adapter
+        if adapter is None:  # the pool was closed
+            return
+
+        # select the host pool exactly as a request sent by a transport would
+        request = requests.Request("GET", url).prepare()
+        verify = get_ssl_verify(None)
+        proxies = session.rebuild_proxies(  # type: ignore[no-untyped-call]
+            request, session.proxies
+        )
+        try:
+            host_pool = t.cast(
+                "HTTPConnectionPool",
+                adapter.get_connection_with_tls_context(
+                    request, verify, proxies=proxies
+                ),
+            )
+            conn = host_pool._get_conn()
+            try:
+                conn.connect()
+            except BaseException:
+                conn.close()
+                host_pool._put_conn(None)
+                raise
+            host_pool._put_conn(conn)
+        except Exception as err:
+            log.debug("could not open a connection to %s: %s", url, err)
+        else:
+            log.debug("opened a connection to %s", url)
+
+    def stats(self) -> list[PoolStats]:
+        """Get the number of requests sent and connections opened, by host."""
+        counts = self._retired_stats.copy()
+        if self._adapter is not None:
+            host_pools = self._adapter.poolmanager.pools
+            for key in host_pools.keys():
+                pool = host_pools.get(key)
+                if pool is not None:
+                    host = _pool_host(pool)
+                    counts[(host, "requests")] += pool.num_requests
+                    counts[(host, "connections")] += pool.num_connections
+
+        hosts = sorted({host for host, _ in counts})
+        return [
+            PoolStats(host, counts[(host, "requests")], counts[(host, "connections")])
+            for host in hosts
+        ]
+
+    def log_stats(self) -> None:
+        if not log.isEnabledFor(logging.DEBUG):
+            return
+        for host, requests_sent, connections in self.stats():
+            log.debug(
+                "connection pool stats for %s: %d request(s) over %d connection(s)",
+                host,
+                requests_sent,
+                connections,
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            session, self._session = self._session, None
+            self._adapter = None
+        if session is not None:
+            session.close()
+
+
+def warm_connections_enabled() -> bool:
+    val = os.getenv(WARM_CONNECTIONS_ENV_VAR)
+    return val is not None and bool(utils.str2bool(val))
+
+
+def warm_connections(services: t.Iterable[str]) -> list[threading.Thread]:
+    """
+    Start opening connections to the APIs for the named services, in the
+    background, for use by the next LoginManager.
+
+    :param services: CLI service names, as used with ``requires_login``
+    :returns: the threads opening the connections
+    """
+    from globus_sdk.config import get_service_url
+
+    global _WARM_POOL
+
+    with _WARM_POOL_LOCK:
+        if _WARM_POOL is None:
+            _WARM_POOL = SharedConnectionPool()
+        pool = _WARM_POOL
+
+    threads = []
+    for service in services:
+        url = get_service_url(_SDK_SERVICE_NAMES.get(service, service))
+        thread = threading.Thread(target=pool.open_connection, args=(url,), daemon=True)
+        thread.start()
+        threads.append(thread)
+    return threads
+
+
+def adopt_warm_pool() -> SharedConnectionPool | None:
+    """
+    Take the pool of speculatively opened connections, if there is one.
+    Only one caller receives the pool.
+    """
+    global _WARM_POOL
+
+    with _WARM_POOL_LOCK:
+        pool, _WARM_POOL = _WARM_POOL, None
+    return pool
+
+
+def _pool_host(pool: HTTPConnectionPool) -> str:
+    if pool.port is None:
+        return str(pool.host)
+    return f"{pool.host}:{pool.port}"
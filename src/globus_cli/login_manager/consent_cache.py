@@ -0,0 +1,61 @@
+"""
+Local caching of the user's consent forest.
+
+Commands with dependent scope requirements must check the user's consents, which
+requires fetching the full list of consents from Globus Auth. The consent data is
+cached per identity so that those checks can usually be resolved locally.
+The cache is cleared whenever new consents may have been granted, i.e. after a
+login flow completes.
+"""
+
+from __future__ import annotations
+
+import os
+import typing as t
+
+from globus_sdk.scopes.consents import ConsentForest
+
+from globus_cli.local_cache import LocalCache
+
+TTL_ENV_VAR = "GLOBUS_CLI_CONSENT_CACHE_TTL"
+DEFAULT_TTL = 3600
+
+
+def _get_ttl() -> float:
+    val = os.getenv(TTL_ENV_VAR)
+    if val is None:
+        return DEFAULT_TTL
+    try:
+        return max(float(val), 0)
+    except ValueError:
+        return DEFAULT_TTL
+
+
+class ConsentForestCache:
+    """
+    A cache of consent data, keyed by identity ID.
+
+    The lifetime of entries is controlled by ``GLOBUS_CLI_CONSENT_CACHE_TTL``, in
+    seconds. A value of 0 disables the cache.
+    """
+
+    def __init__(self) -> None:
+        self.ttl = _get_ttl()
+        self._cache = LocalCache("consent_forest", ttl=self.ttl)
+
+    def get(self, identity_id: str) -> ConsentForest | None:
+        if not self.ttl:
+            return None
+        consents = self._cache.get(identity_id)
+        if consents is None:
+            return None
+        return ConsentForest(consents)
+
+    def set(
+        self, identity_id: str, consents: t.Iterable[t.Mapping[str, t.Any]]
+    ) -> None:
+        if self.ttl:
+            self._cache.set(identity_id, [dict(consent) for consent in consents])
+
+    def clear(self) -> None:
+        self._cache.clear()
@@ -0,0 +1,157 @@
+"""
+Timing of the HTTP requests sent through a shared connection pool, for
+``--profile-timings``.
+
+Each request sent by the pool's session is recorded in the current profile, while
+profiling is enabled. The time spent opening a new connection is attributed to the
+request for which it was opened, so the connections used by a pool are also timed.
+
+This module imports ``requests`` and ``urllib3``, so it is only imported once a
+connection pool is used.
+"""
+
+from __future__ import annotations
+
+import socket
+import threading
+import time
+import typing as t
+import urllib.parse
+import weakref
+
+import requests
+from globus_sdk.transport.representation_providers import (
+    RequestsRepresentationProvider,
+)
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from globus_cli.profiling import RequestTiming, get_profile
+
+# the request being sent by each thread, to which new connections are attributed
+_CURRENT_REQUEST = threading.local()
+
+# the timing of each response, so that JSON parsing can be attributed to it
+_RESPONSE_TIMINGS: weakref.WeakKeyDictionary[requests.Response, RequestTiming] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _current_request() -> RequestTiming | None:
+    return t.cast("RequestTiming | None", getattr(_CURRENT_REQUEST, "timing", None))
+
+
+class TimedSession(requests.Session):
+    def send(
+        self, request: requests.PreparedRequest, **kwargs: t.Any
+    ) -> requests.Response:
+        profile = get_profile()
+        if not profile.enabled:
+            return super().send(request, **kwargs)
+
+        timing = RequestTiming(
+            method=request.method or "",
+            url=_describe_url(request.url or ""),
+            start=time.perf_counter(),
+        )
+        # redirects are sent by a nested call, and are recorded as separate requests
+        outer_request = _current_request()
+        _CURRENT_REQUEST.timing = timing
+        try:
+            response = super().send(request, **kwargs)
+        finally:
+            _CURRENT_REQUEST.timing = outer_request
+            timing.duration = time.perf_counter() - timing.start
+            profile.add_request(timing)
+
+        # requests measures the time until the response headers are parsed, which
+        # includes opening a connection; for responses which are not streamed, the
+        # rest of the time is spent reading the body
+        elapsed = response.elapsed.total_seconds()
+        timing.status = response.status_code
+        timing.wait = max(elapsed - timing.connect - timing.tls, 0.0)
+        timing.download = max(timing.duration - elapsed, 0.0)
+        _RESPONSE_TIMINGS[response] = timing
+        return response
+
+
+class TimedJSONProvider(RequestsRepresentationProvider):
+    """
+    A JSON representation provider which records the time spent decoding the body
+    of each response, and otherwise defers to another provider.
+    """
+
+    def __init__(self, provider: RequestsRepresentationProvider) -> None:
+        self._provider = provider
+
+    def encode(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, t.Any] | None,
+        data: t.Any,
+        headers: dict[str, str],
+    ) -> requests.Request:
+        return self._provider.encode(method, url, params, data, headers)
+
+    def decode_body(self, response: requests.Response) -> t.Any:
+        start = time.perf_counter()
+        try:
+            return self._provider.decode_body(response)
+        finally:
+            timing = _RESPONSE_TIMINGS.get(response)
+            if timing is not None:
+                timing.json_parse += time.perf_counter() - start
+
+
+class TimedHTTPConnection(HTTPConnection):
+    def _new_conn(self) -> socket.socket:
+        start = time.perf_counter()
+        try:
+            return super()._new_conn()
+        finally:
+            timing = _current_request()
+            if timing is not None:
+                timing.connect += time.perf_counter() - start
+
+
+class TimedHTTPSConnection(HTTPSConnection):
+    def _new_conn(self) -> socket.socket:
+        start = time.perf_counter()
+        try:
+            return super()._new_conn()
+        finally:
+            self._tcp_connect_time = time.perf_counter() - start
+
+    def connect(self) -> None:
+        # opening the socket is timed separately, and the rest of the time spent
+        # connecting is taken by the TLS handshake
+        self._tcp_connect_time = 0.0
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            timing = _current_request()
+            if timing is not None:
+                timing.connect += self._tcp_connect_time
+                timing.tls += time.perf_counter() - start - self._tcp_connect_time
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+TIMED_POOL_CLASSES: dict[str, type[HTTPConnectionPool]] = {
+    "http": TimedHTTPConnectionPool,
+    "https": TimedHTTPSConnectionPool,
+}
+
+
+def _describe_url(url: str) -> str:
+    # query strings can be long, and are left out
+    parsed = urllib.parse.urlsplit(url)
+    return f"{parsed.netloc}{parsed.path}"
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+import concurrent.futures
+import contextlib
+import contextvars
 import functools
+import logging
 import os
 import sys
+import threading
+import time
 import typing as t
 import uuid
 
 import click
 import globus_sdk
+from globus_sdk.authorizers.renewing import EXPIRES_ADJUST_SECONDS
 from globus_sdk.scopes import (
     AuthScopes,
     FlowsScopes,
@@ -24,21 +31,26 @@ from globus_sdk.scopes import (
 from globus_sdk.scopes.consents import ConsentForest
 
 from globus_cli.endpointish import Endpointish, EntityType
+from globus_cli.profiling import get_profile
 from globus_cli.types import ServiceNameLiteral
 
 from .. import version
 from .auth_flows import do_link_auth_flow, do_local_server_auth_flow
 from .client_login import get_client_login, is_client_login
+from .connection_pool import SharedConnectionPool, adopt_warm_pool
+from .consent_cache import ConsentForestCache
 from .context import LoginContext
 from .errors import MissingLoginError
 from .scopes import CLI_SCOPE_REQUIREMENTS
 from .storage import CLIStorage
+from .token_refresh import SingleFlightRefreshTokenAuthorizer
+from .token_validation import TokenValidationCache
 from .utils import is_remote_session
 
 if t.TYPE_CHECKING:
     from ..services.auth import CustomAuthClient
     from ..services.gcs import CustomGCSClient
-    from ..services.transfer import CustomTransferClient
+    from ..services.transfer import CustomTransferClient, EndpointCache
 
 if sys.version_info >= (3, 10):
     from typing import Concatenate, ParamSpec
@@ -51,19 +63,97 @@ R = t.TypeVar("R")
 # string-ized annotation to avoid triggering eager imports
 CLIENT_T = t.TypeVar("CLIENT_T", bound="globus_sdk.BaseClient")
 
+log = logging.getLogger(__name__)
+
+_REQUIRED_SERVICES_ATTR = "__globus_cli_required_services__"
+
 
 class LoginManager:
-    def __init__(self) -> None:
-        self.storage = CLIStorage()
+    """
+    :param connection_pool: a connection pool for clients to use, which is not
+        closed with the manager. By default, the manager has a pool of its own.
+    """
+
+    # the manager used by all commands in a thread, while set (see ``shared``)
+    _shared = threading.local()
+
+    def __init__(self, *, connection_pool: SharedConnectionPool | None = None) -> None:
+        with get_profile().phase("open token storage"):
+            self.storage = CLIStorage()
         self._nonstatic_requirements: dict[str, list[Scope]] = {}
+        self._consent_forest: ConsentForest | None = None
+        self._consent_forest_future: concurrent.futures.Future[ConsentForest] | None = (
+            None
+        )
 
         self._client_pool: set[globus_sdk.BaseClient] = set()
+        # all clients in the client pool send requests through this connection pool
+        self._owns_connection_pool = connection_pool is None
+        self._connection_pool = (
+            connection_pool or adopt_warm_pool() or SharedConnectionPool()
+        )
+        self._fetched_client_credentials_tokens = False
 
     def close(self) -> None:
         self.storage.close()
         for c in self._client_pool:
             c.close()
         self._client_pool.clear()
+        if self._owns_connection_pool:
+            self._connection_pool.log_stats()
+            self._connection_pool.close()
+
+    @classmethod
+    @contextlib.contextmanager
+    def shared(
+        cls, *, connection_pool: SharedConnectionPool | None = None
+    ) -> t.Iterator[LoginManager]:
+        """
+        Use a single manager for all commands run in the current thread within this
+        context, so that they share its connections and storage. Used by
+        ``globus shell`` and ``globus run``.
+
+        Token storage may only be used by the thread which opened it, so each
+        thread needs a manager of its own, but the managers of several threads may
+        share a connection pool.
+        """
+        if cls.is_shared():
+            raise RuntimeError("a shared LoginManager is already in use")
+        manager = cls(connection_pool=connection_pool)
+        LoginManager._shared.manager = manager
+        try:
+            yield manager
+        finally:
+            LoginManager._shared.manager = None
+            manager.close()
+
+    @staticmethod
+    def is_shared() -> bool:
+        """Check whether commands in the current thread use a shared manager."""
+        return LoginManager._get_shared() is not None
+
+    @staticmethod
+    def _get_shared() -> LoginManager | None:
+        return t.cast(
+            t.Optional[LoginManager], getattr(LoginManager._shared, "manager", None)
+        )
+
+    def reset(self) -> None:
+        """
+        Discard the state of the command which used this manager, so that it can be
+        used by another command. Connections and storage are kept.
+        """
+        for c in self._client_pool:
+            c.close()
+        self._client_pool.clear()
+        self._nonstatic_requirements.clear()
+        self._consent_forest = None
+        self._consent_forest_future = None
+        self._fetched_client_credentials_tokens = False
+        # cached documents may be changed by the next command, and some derived
+        # values may be changed by a login or logout
+        self.__dict__.pop("_endpoint_cache", None)
+        self.storage.__dict__.pop("cli_confidential_client", None)
 
     def add_requirement(self, rs_name: str, scopes: t.Sequence[Scope]) -> None:
         self._nonstatic_requirements[rs_name] = list(scopes)
@@ -121,7 +211,21 @@ class LoginManager:
 
         return self._tokens_meet_auth_requirements(
             resource_server, tokens
-        ) and self._validate_token(tokens["refresh_token"])
+        ) and self._validate_refresh_token(tokens["refresh_token"])
+
+    def _validate_refresh_token(self, token: str) -> bool:
+        """
+        Validate a refresh token, skipping the network call if the token was
+        successfully validated recently.
+        """
+        validation_cache = TokenValidationCache()
+        if validation_cache.is_known_valid(token):
+            return True
+
+        is_valid = self._validate_token(token)
+        if is_valid:
+            validation_cache.mark_valid(token)
+        return is_valid
 
     def _tokens_meet_auth_requirements(
         self, resource_server: str, tokens: dict[str, t.Any]
@@ -169,15 +273,7 @@ class LoginManager:
             # By definition, if there are no requirements, those requirements are met.
             return True
 
-        requirements = self._nonstatic_requirements[resource_server]
-
-        # Parse the requirements into a list of Scope objects
-        # This may expand the list of requirements if, for instance, a single scope
-        #   string represents multiple roots (eg "openid profile email")
-        required_scopes: list[Scope] = []
-        for scope in requirements:
-            scope_string = scope if isinstance(scope, str) else str(scope)
-            required_scopes.extend(ScopeParser.parse(scope_string))
+        required_scopes = self._parse_nonstatic_requirements(resource_server)
 
         if not any(scope.dependencies for scope in required_scopes):
             # If there are no dependent scopes, simply verify local scope strings match
@@ -190,12 +286,84 @@ class LoginManager:
             #   user's cached consent forest.
             return self._cached_consent_forest.meets_scope_requirements(required_scopes)
 
+    def _parse_nonstatic_requirements(self, resource_server: str) -> list[Scope]:
+        # Parse the requirements into a list of Scope objects
+        # This may expand the list of requirements if, for instance, a single scope
+        #   string represents multiple roots (eg "openid profile email")
+        required_scopes: list[Scope] = []
+        for scope in self._nonstatic_requirements.get(resource_server, ()):
+            scope_string = scope if isinstance(scope, str) else str(scope)
+            required_scopes.extend(ScopeParser.parse(scope_string))
+        return required_scopes
+
+    def _needs_consent_forest(self, resource_server: str) -> bool:
+        return any(
+            scope.dependencies
+            for scope in self._parse_nonstatic_requirements(resource_server)
+        )
+
     @property
-    @functools.lru_cache(maxsize=1)  # noqa: B019
     def _cached_consent_forest(self) -> ConsentForest:
-        identity_id = self.get_current_identity_id()
+        forest = self._consent_forest
+        if forest is None:
+            if self._consent_forest_future is not None:
+                forest = self._consent_forest_future.result()
+            else:
+                identity_id = self.get_current_identity_id()
+                forest = ConsentForestCache().get(identity_id)
+                if forest is None:
+                    forest = self._fetch_consent_forest(
+                        self.get_auth_client(), identity_id
+                    )
+            self._consent_forest = forest
+        return forest
+
+    def _load_consent_forest_from_cache(self) -> bool:
+        """
+        Load the consent forest from the local cache, if present.
+
+        :returns: whether or not a consent forest is now available
+        """
+        if self._consent_forest is None:
+            self._consent_forest = ConsentForestCache().get(
+                self.get_current_identity_id()
+            )
+        return self._consent_forest is not None
+
+    @staticmethod
+    def _fetch_consent_forest(
+        auth_client: CustomAuthClient, identity_id: str
+    ) -> ConsentForest:
+        consents = list(auth_client.get_consents(identity_id))
+        ConsentForestCache().set(identity_id, consents)
+        return ConsentForest(consents)
+
+    def _prefetch_consent_forest(self, executor: concurrent.futures.Executor) -> None:
+        """
+        Start fetching the consent forest in the background.
+
+        The auth client and identity ID are resolved here, along with any needed
+        token refresh, because those read from and write to token storage, which
+        must only be used from the calling thread.
+        """
+        if self._consent_forest is not None or self._consent_forest_future is not None:
+            return
 
-        return self.get_auth_client().get_consents(identity_id).to_forest()
+        auth_client = self.get_auth_client()
+        identity_id = self.get_current_identity_id()
+        if isinstance(
+            auth_client.authorizer, globus_sdk.authorizers.RenewingAuthorizer
+        ):
+            auth_client.authorizer.ensure_valid_token()
+
+        # run in a copy of the current context, so that requests are timed in the
+        # current invocation's profile
+        self._consent_forest_future = executor.submit(
+            contextvars.copy_context().run,
+            self._fetch_consent_forest,
+            auth_client,
+            identity_id,
+        )
 
     def run_login_flow(
         self,
@@ -273,12 +441,82 @@ class LoginManager:
         login_context = login_context or LoginContext()
 
         # Determine the set of resource servers still requiring logins.
-        missing_servers = {s for s in resource_servers if not self.has_login(s)}
+        missing_servers = self._find_missing_logins(resource_servers)
 
         # If any resource servers do require logins, raise those as a MissingLoginError.
         if missing_servers:
             raise MissingLoginError(list(missing_servers), login_context)
 
+    def _find_missing_logins(self, resource_servers: t.Sequence[str]) -> set[str]:
+        """
+        Determine which of the given resource servers lack a valid login.
+
+        The result is the same as checking ``has_login`` for each server, but when
+        more than one network call is needed -- token validations which are not
+        cached, and the consent lookup for dependent scope requirements -- those
+        calls are made concurrently.
+        """
+        resource_servers = list(dict.fromkeys(resource_servers))
+        if is_client_login():
+            return set()
+
+        missing_servers: set[str] = set()
+        candidates: dict[str, dict[str, t.Any]] = {}
+        for rs_name in resource_servers:
+            tokens = self.storage.adapter.get_token_data(rs_name)
+            if (
+                tokens is None
+                or "refresh_token" not in tokens
+                or not self._tokens_meet_static_requirements(rs_name, tokens)
+            ):
+                missing_servers.add(rs_name)
+            else:
+                candidates[rs_name] = tokens
+
+        validation_cache = TokenValidationCache()
+        unvalidated = {
+            rs_name: tokens["refresh_token"]
+            for rs_name, tokens in candidates.items()
+            if not validation_cache.is_known_valid(tokens["refresh_token"])
+        }
+        needs_consent_forest = (
+            any(self._needs_consent_forest(rs_name) for rs_name in candidates)
+            and not self._load_consent_forest_from_cache()
+        )
+
+        network_calls = len(unvalidated) + int(needs_consent_forest)
+        if network_calls < 2:
+            return missing_servers | {
+                rs_name for rs_name in candidates if not self.has_login(rs_name)
+            }
+
+        # build the client used for validation before starting any threads, as
+        # doing so may need to read from or write to token storage
+        self.storage.cli_confidential_client
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=network_calls
+        ) as executor:
+            validations = {
+                rs_name: executor.submit(
+                    contextvars.copy_context().run, self._validate_token, token
+                )
+                for rs_name, token in unvalidated.items()
+            }
+            if needs_consent_forest:
+                self._prefetch_consent_forest(executor)
+
+            for rs_name, tokens in candidates.items():
+                if not self._tokens_meet_nonstatic_requirements(rs_name, tokens):
+                    missing_servers.add(rs_name)
+            for rs_name, future in validations.items():
+                if future.result():
+                    validation_cache.mark_valid(unvalidated[rs_name])
+                else:
+                    missing_servers.add(rs_name)
+
+        return missing_servers
+
     @classmethod
     def requires_login(
         cls, *services: ServiceNameLiteral
@@ -316,17 +554,33 @@ class LoginManager:
         ) -> t.Callable[P, R]:
             @functools.wraps(func)
             def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-                manager = cls()
                 context = click.get_current_context()
-                context.call_on_close(manager.close)
-
-                manager.assert_logins(*resource_servers)
+                manager = LoginManager._get_shared()
+                if manager is None:
+                    manager = cls()
+                    context.call_on_close(manager.close)
+                else:
+                    context.call_on_close(manager.reset)
+
+                with get_profile().phase("validate logins"):
+                    manager.assert_logins(*resource_servers)
                 return func(manager, *args, **kwargs)
 
+            # record the services, so that they are known before the command runs
+            setattr(wrapper, _REQUIRED_SERVICES_ATTR, services)
             return wrapper
 
         return inner
 
+    @staticmethod
+    def get_required_services(command: click.Command) -> tuple[str, ...]:
+        """
+        Get the services declared with ``requires_login`` for a command, if any.
+        """
+        return t.cast(
+            t.Tuple[str, ...], getattr(command.callback, _REQUIRED_SERVICES_ATTR, ())
+        )
+
     def _get_client_authorizer(
         self, resource_server: str, *, no_tokens_msg: str | None = None
     ) -> globus_sdk.ClientCredentialsAuthorizer | globus_sdk.RefreshTokenAuthorizer:
@@ -344,9 +598,14 @@ class LoginManager:
 
             # if we already have a token use it. This token could be invalid
             # or for another client, but automatic retries will handle that
+            # otherwise, get tokens for all of the requirements at once
+            if not self._client_tokens_are_usable(resource_server, tokens):
+                tokens = self._get_client_credentials_tokens().get(resource_server)
+
             access_token = None
             expires_at = None
-            if tokens and self._tokens_meet_auth_requirements(resource_server, tokens):
+            if self._client_tokens_are_usable(resource_server, tokens):
+                assert tokens is not None
                 access_token = tokens["access_token"]
                 expires_at = tokens["expires_at_seconds"]
 
@@ -369,19 +628,91 @@ class LoginManager:
                     )
                 )
 
-            return globus_sdk.RefreshTokenAuthorizer(
+            return SingleFlightRefreshTokenAuthorizer(
                 tokens["refresh_token"],
                 self.storage.cli_confidential_client,
+                storage=self.storage,
+                resource_server=resource_server,
                 access_token=tokens["access_token"],
                 expires_at=tokens["expires_at_seconds"],
                 on_refresh=self.storage.store,
             )
 
+    def refresh_tokens(self, resource_server: str) -> None:
+        """
+        Get a new access token for a resource server, regardless of whether or
+        not the current one has expired, and store it.
+        """
+        authorizer = self._get_client_authorizer(resource_server)
+        # without an expiration time, the current token is treated as expired
+        authorizer.expires_at = None
+        authorizer.ensure_valid_token()
+
+    def _client_tokens_are_usable(
+        self, resource_server: str, tokens: dict[str, t.Any] | None
+    ) -> bool:
+        return (
+            tokens is not None
+            and tokens["expires_at_seconds"] - EXPIRES_ADJUST_SECONDS > time.time()
+            and self._tokens_meet_auth_requirements(resource_server, tokens)
+        )
+
+    def _get_client_credentials_tokens(self) -> dict[str, dict[str, t.Any]]:
+        """
+        For a client login, get new tokens for every resource server in the login
+        requirements which lacks usable tokens, in a single client credentials
+        grant, and store them.
+
+        This is done at most once per LoginManager. If the grant fails, clients fall
+        back to getting their own tokens.
+
+        :returns: the new token data, by resource server
+        """
+        if self._fetched_client_credentials_tokens:
+            return {}
+        self._fetched_client_credentials_tokens = True
+
+        scopes_by_server: dict[str, list[str | Scope]] = {}
+        for rs_name, rs_scopes in self.login_requirements:
+            scopes_by_server.setdefault(rs_name, []).extend(rs_scopes)
+        scopes = [
+            scope
+            for rs_name, rs_scopes in scopes_by_server.items()
+            if not self._client_tokens_are_usable(
+                rs_name, self.storage.adapter.get_token_data(rs_name)
+            )
+            for scope in rs_scopes
+        ]
+        if not scopes:
+            return {}
+
+        try:
+            token_response = get_client_login().oauth2_client_credentials_tokens(
+                requested_scopes=scopes
+            )
+        except globus_sdk.AuthAPIError as err:
+            log.debug("consolidated client credentials grant failed: %s", err)
+            return {}
+        self.storage.store(token_response)
+        return dict(token_response.by_resource_server)
+
+    @functools.cached_property
+    def _endpoint_cache(self) -> EndpointCache:
+        # shared by all transfer clients, so that endpoints are fetched only once
+        from ..services.transfer import EndpointCache
+
+        return EndpointCache()
+
     def get_transfer_client(self) -> CustomTransferClient:
         from ..services.transfer import CustomTransferClient
 
         authorizer = self._get_client_authorizer(TransferScopes.resource_server)
-        client = CustomTransferClient(authorizer=authorizer, app_name=version.app_name)
+        client = CustomTransferClient(
+            authorizer=authorizer,
+            app_name=version.app_name,
+            transport=self._connection_pool.make_transport(),
+            endpoint_cache=self._endpoint_cache,
+        )
         self._client_pool.add(client)
         return client
 
@@ -389,14 +720,20 @@ class LoginManager:
         from ..services.auth import CustomAuthClient
 
         authorizer = self._get_client_authorizer(AuthScopes.resource_server)
-        client = CustomAuthClient(authorizer=authorizer, app_name=version.app_name)
+        client = CustomAuthClient(
+            authorizer=authorizer,
+            app_name=version.app_name,
+            transport=self._connection_pool.make_transport(),
+        )
         self._client_pool.add(client)
         return client
 
     def get_groups_client(self) -> globus_sdk.GroupsClient:
         authorizer = self._get_client_authorizer(GroupsScopes.resource_server)
         client = globus_sdk.GroupsClient(
-            authorizer=authorizer, app_name=version.app_name
+            authorizer=authorizer,
+            app_name=version.app_name,
+            transport=self._connection_pool.make_transport(),
         )
         self._client_pool.add(client)
         return client
@@ -404,7 +741,9 @@ class LoginManager:
     def get_flows_client(self) -> globus_sdk.FlowsClient:
         authorizer = self._get_client_authorizer(FlowsScopes.resource_server)
         client = globus_sdk.FlowsClient(
-            authorizer=authorizer, app_name=version.app_name
+            authorizer=authorizer,
+            app_name=version.app_name,
+            transport=self._connection_pool.make_transport(),
         )
         self._client_pool.add(client)
         return client
@@ -412,7 +751,9 @@ class LoginManager:
     def get_search_client(self) -> globus_sdk.SearchClient:
         authorizer = self._get_client_authorizer(SearchScopes.resource_server)
         client = globus_sdk.SearchClient(
-            authorizer=authorizer, app_name=version.app_name
+            authorizer=authorizer,
+            app_name=version.app_name,
+            transport=self._connection_pool.make_transport(),
         )
         self._client_pool.add(client)
         return client
@@ -429,7 +770,9 @@ class LoginManager:
 
         authorizer = self._get_client_authorizer(TimersScopes.resource_server)
         client = globus_sdk.TimersClient(
-            authorizer=authorizer, app_name=version.app_name
+            authorizer=authorizer,
+            app_name=version.app_name,
+            transport=self._connection_pool.make_transport(),
         )
         self._client_pool.add(client)
         return client
@@ -473,7 +816,11 @@ class LoginManager:
     ) -> globus_sdk.SpecificFlowClient:
         # Create a SpecificFlowClient without an authorizer
         # to take advantage of its scope creation code.
-        client = globus_sdk.SpecificFlowClient(flow_id, app_name=version.app_name)
+        client = globus_sdk.SpecificFlowClient(
+            flow_id,
+            app_name=version.app_name,
+            transport=self._connection_pool.make_transport(),
+        )
         self._client_pool.add(client)
         assert client.scopes is not None
         self.add_requirement(client.scopes.resource_server, [client.scopes.user])
@@ -565,6 +912,7 @@ class LoginManager:
             source_epish=epish,
             authorizer=authorizer,
             app_name=version.app_name,
+            transport=self._connection_pool.make_transport(),
         )
         self._client_pool.add(client)
         return client
@@ -10,10 +10,17 @@ from globus_sdk.token_storage.legacy import SQLiteAdapter
 
 from ._old_config import invalidate_old_config
 from .client_login import get_client_login, is_client_login
+from .concurrent_adapter import ConcurrentSQLiteAdapter
 from .scopes import CURRENT_SCOPE_CONTRACT_VERSION
+from .token_validation import TokenValidationCache
 
 # env vars used throughout this module
 GLOBUS_ENV = os.environ.get("GLOBUS_SDK_ENVIRONMENT")
+STORAGE_MODE_ENV_VAR = "GLOBUS_CLI_STORAGE_MODE"
+
+# how long to wait, in seconds, for another process to release a lock on the
+# storage file before failing with "database is locked"
+STORAGE_BUSY_TIMEOUT = 30.0
 
 
 class CLIStorage:
@@ -32,7 +39,14 @@ class CLIStorage:
         if not os.path.exists(fname):
             invalidate_old_config(self.cli_native_client)
 
-        return SQLiteAdapter(fname, namespace=_resolve_namespace())
+        adapter_class = SQLiteAdapter
+        if _get_storage_mode() == "concurrent":
+            adapter_class = ConcurrentSQLiteAdapter
+        return adapter_class(
+            fname,
+            namespace=_resolve_namespace(),
+            connect_params={"timeout": STORAGE_BUSY_TIMEOUT},
+        )
 
     def close(self) -> None:
         self.adapter.close()
@@ -159,7 +173,23 @@ class CLIStorage:
     ) -> None:
         self.adapter.remove_config(name)
 
+    def read_latest_token_data(self, resource_server: str) -> dict[str, t.Any] | None:
+        """
+        Read the token data for a resource server, bypassing any reads cached by
+        the adapter, to see tokens which another process may have stored.
+        """
+        if isinstance(self.adapter, ConcurrentSQLiteAdapter):
+            self.adapter.discard_cached_reads()
+        return self.adapter.get_token_data(resource_server)
+
     def store(self, token_response: globus_sdk.OAuthTokenResponse) -> None:
+        # any cached validation of the tokens being replaced is no longer relevant
+        validation_cache = TokenValidationCache()
+        for rs_name in token_response.by_resource_server:
+            old_tokens = self.adapter.get_token_data(rs_name)
+            if old_tokens and old_tokens.get("refresh_token"):
+                validation_cache.invalidate(old_tokens["refresh_token"])
+
         self.adapter.store(token_response)
         # store contract versions for all of the tokens which were acquired
         # this could overwrite data from another CLI version *earlier or later* than
@@ -232,6 +262,22 @@ def _get_storage_filename() -> str:
     return os.path.join(datadir, "storage.db")
 
 
+def _get_storage_mode() -> str:
+    """
+    The storage mode is "default" unless GLOBUS_CLI_STORAGE_MODE is set.
+
+    "concurrent" mode is designed for many simultaneous CLI processes sharing the
+    same storage, e.g. in large batches of jobs. It is not suitable for storage
+    on a network filesystem.
+    """
+    mode = os.environ.get(STORAGE_MODE_ENV_VAR, "default").strip().lower()
+    if mode not in ("default", "concurrent"):
+        raise ValueError(
+            f"{STORAGE_MODE_ENV_VAR} must be 'default' or 'concurrent', not '{mode}'"
+        )
+    return mode
+
+
 def _resolve_namespace() -> str:
     """
     expected user namespaces are:
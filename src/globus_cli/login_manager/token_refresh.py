@@ -0,0 +1,168 @@
+"""
+Coordination of access token refreshes between CLI processes.
+
+When many CLI processes run at once and their access tokens expire, each would
+otherwise refresh the same tokens independently. Instead, refreshes for a resource
+server are serialized with a lock file in the CLI data dir: the first process to
+take the lock refreshes and stores the new tokens, and the others reuse the stored
+result once they acquire the lock.
+
+If the lock cannot be acquired within a timeout, the refresh proceeds without it.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import os
+import sys
+import time
+import typing as t
+
+import globus_sdk
+from globus_sdk.authorizers.renewing import EXPIRES_ADJUST_SECONDS
+
+if t.TYPE_CHECKING:
+    from .storage import CLIStorage
+
+log = logging.getLogger(__name__)
+
+# how long to wait, in seconds, for another process to finish a refresh
+REFRESH_LOCK_TIMEOUT = 10.0
+_LOCK_POLL_INTERVAL = 0.05
+
+
+@contextlib.contextmanager
+def file_lock(filename: str, *, timeout: float) -> t.Iterator[bool]:
+    """
+    Hold an exclusive lock on a file, waiting up to ``timeout`` seconds for it.
+
+    The lock is advisory and only excludes other users of ``file_lock``.
+
+    :returns: a context manager which yields whether or not the lock was acquired
+    """
+    try:
+        fd = os.open(filename, os.O_RDWR | os.O_CREAT, 0o600)
+    except OSError as err:
+        log.debug("could not open lock file %s: %s", filename, err)
+        yield False
+        return
+
+    acquired = False
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                _lock_fd(fd)
+            except OSError:
+                if time.monotonic() >= deadline:
+                    break
+                time.sleep(_LOCK_POLL_INTERVAL)
+            else:
+                acquired = True
+                break
+        yield acquired
+    finally:
+        if acquired:
+            _unlock_fd(fd)
+        os.close(fd)
+
+
+if sys.platform == "win32":
+    import msvcrt
+
+    def _lock_fd(fd: int) -> None:
+        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+
+    def _unlock_fd(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock_fd(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    def _unlock_fd(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def _get_lock_dir() -> str:
+    from .storage import _ensure_data_dir
+
+    return _ensure_data_dir()
+
+
+def _get_lock_filename(namespace: str, resource_server: str) -> str:
+    key = hashlib.sha256(f"{namespace}:{resource_server}".encode()).hexdigest()
+    return os.path.join(_get_lock_dir(), f"refresh-{key[:16]}.lock")
+
+
+class SingleFlightRefreshTokenAuthorizer(globus_sdk.RefreshTokenAuthorizer):
+    """
+    A RefreshTokenAuthorizer which coordinates refreshes with other processes.
+
+    Before refreshing, the authorizer takes the refresh lock for its resource
+    server and then checks storage for a new access token stored by another
+    process, which it uses instead of refreshing when it is still valid.
+
+    :param storage: the storage from which the tokens were read, and in which
+        refreshed tokens are stored by the ``on_refresh`` callback
+    :param resource_server: the resource server for which the tokens were issued
+    """
+
+    def __init__(
+        self,
+        refresh_token: str,
+        auth_client: globus_sdk.AuthLoginClient,
+        *,
+        storage: CLIStorage,
+        resource_server: str,
+        access_token: str | None = None,
+        expires_at: int | None = None,
+        on_refresh: (
+            None | t.Callable[[globus_sdk.OAuthRefreshTokenResponse], t.Any]
+        ) = None,
+    ) -> None:
+        self._storage = storage
+        self._resource_server = resource_server
+        super().__init__(
+            refresh_token,
+            auth_client,
+            access_token=access_token,
+            expires_at=expires_at,
+            on_refresh=on_refresh,
+        )
+
+    def _get_new_access_token(self) -> None:
+        lock_filename = _get_lock_filename(
+            self._storage.adapter.namespace, self._resource_server
+        )
+        with file_lock(lock_filename, timeout=REFRESH_LOCK_TIMEOUT) as acquired:
+            if not acquired:
+                log.debug("could not acquire the refresh lock, refreshing anyway")
+            if not self._use_stored_token():
+                super()._get_new_access_token()
+
+    def _use_stored_token(self) -> bool:
+        """
+        Use an access token refreshed by another process, if there is one.
+
+        :returns: whether or not a stored token was used
+        """
+        tokens = self._storage.read_latest_token_data(self._resource_server)
+        if (
+            tokens is None
+            or tokens.get("refresh_token") != self.refresh_token
+            # the current token may have been rejected, so it must not be reused
+            or tokens.get("access_token") in (None, self.access_token)
+            or tokens["expires_at_seconds"] - EXPIRES_ADJUST_SECONDS < time.time()
+        ):
+            return False
+
+        log.debug("using an access token refreshed by another process")
+        self.access_token = tokens["access_token"]
+        self.expires_at = tokens["expires_at_seconds"]
+        return True
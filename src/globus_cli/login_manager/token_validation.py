@@ -0,0 +1,60 @@
+"""
+Local caching of refresh token validation results.
+
+Validating a refresh token requires a call to Globus Auth, which every command
+requiring login would otherwise make for each resource server it uses.
+Positive results are cached for a short time, keyed by a hash of the token so that
+tokens are never written to the cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+
+from globus_cli.local_cache import LocalCache
+
+TTL_ENV_VAR = "GLOBUS_CLI_TOKEN_VALIDATION_TTL"
+DEFAULT_TTL = 300
+
+
+def _get_ttl() -> float:
+    val = os.getenv(TTL_ENV_VAR)
+    if val is None:
+        return DEFAULT_TTL
+    try:
+        return max(float(val), 0)
+    except ValueError:
+        return DEFAULT_TTL
+
+
+def _token_key(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class TokenValidationCache:
+    """
+    A cache of tokens which have recently been validated.
+
+    The lifetime of entries is controlled by ``GLOBUS_CLI_TOKEN_VALIDATION_TTL``,
+    in seconds. A value of 0 disables the cache.
+    """
+
+    def __init__(self) -> None:
+        self.ttl = _get_ttl()
+        self._cache = LocalCache("token_validation", ttl=self.ttl)
+
+    def is_known_valid(self, token: str) -> bool:
+        if not self.ttl:
+            return False
+        return bool(self._cache.get(_token_key(token)))
+
+    def mark_valid(self, token: str) -> None:
+        if self.ttl:
+            self._cache.set(_token_key(token), True)
+
+    def invalidate(self, token: str) -> None:
+        self._cache.delete(_token_key(token))
+
+    def clear(self) -> None:
+        self._cache.clear()
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import contextlib
 import logging.config
 import typing as t
 
 import click
 
 from globus_cli import _warnings
+from globus_cli.profiling import PROFILE_TIMINGS_ENV_VAR, get_profile
 from globus_cli.types import AnyCommand
 
 # Format Enum for output formatting
@@ -44,6 +46,26 @@ def _setup_logging(level: str = "DEBUG") -> None:
     logging.config.dictConfig(conf)
 
 
+# while set, the logging and warnings configuration of the process is fixed, and
+# verbosity options only change the state of their own command
+_logging_config_is_fixed = False
+
+
+@contextlib.contextmanager
+def fixed_logging_config() -> t.Iterator[None]:
+    """
+    Keep commands from configuring logging and warnings, which are process-wide,
+    while several of them run concurrently in the current process.
+    """
+    global _logging_config_is_fixed
+
+    previous, _logging_config_is_fixed = _logging_config_is_fixed, True
+    try:
+        yield
+    finally:
+        _logging_config_is_fixed = previous
+
+
 class CommandState:
     def __init__(self) -> None:
         # init takes no params and sets everything to defaults
@@ -77,6 +99,8 @@ class CommandState:
             return
 
         self.verbosity = value
+        if _logging_config_is_fixed:
+            return
 
         # min verbosity level: never warn, never log normal events
         # (covers quiet modes, e.g. `--quiet`)
@@ -268,3 +292,19 @@ def show_server_timing_option(f: F) -> F:
         expose_value=False,
         callback=callback,
     )(f)
+
+
+def profile_timings_option(f: F) -> F:
+    def callback(ctx: click.Context, param: click.Parameter, value: t.Any) -> None:
+        if not value:
+            return
+        get_profile().enabled = True
+
+    return click.option(
+        "--profile-timings",
+        is_flag=True,
+        hidden=True,
+        envvar=PROFILE_TIMINGS_ENV_VAR,
+        expose_value=False,
+        callback=callback,
+    )(f)
@@ -11,17 +11,22 @@ from __future__ import annotations
 import importlib
 import logging
 import sys
+import time
 import typing as t
 from shutil import get_terminal_size
 
 import click
 
+from globus_cli import profiling
 from globus_cli.exception_handling import custom_except_hook
 from globus_cli.termio import env_interactive
 
 from .shared_options import common_options
 from .shell_completion import print_completer_option
 
+if t.TYPE_CHECKING:
+    from click.shell_completion import CompletionItem
+
 C = t.TypeVar("C", bound=t.Union[click.Command, t.Callable[..., t.Any]])
 
 log = logging.getLogger(__name__)
@@ -78,6 +83,9 @@ class GlobusCommand(click.Command):
 
     def invoke(self, ctx: click.Context) -> t.Any:
         log.debug("command invoke start")
+        # parsing includes loading the command, and any groups which contain it
+        profile = profiling.get_profile()
+        profile.add_phase("parse arguments", profile.start, time.perf_counter())
         try:
             # this isn't forcing interactive mode, it's just checking to see that
             # the GLOBUS_CLI_INTERACTIVE value is *valid*
@@ -149,6 +157,41 @@ class GlobusCommandGroup(click.Group):
         lazy = sorted(self.lazy_subcommands.keys())
         return base + lazy
 
+    def resolve_command(
+        self, ctx: click.Context, args: list[str]
+    ) -> tuple[str | None, click.Command | None, list[str]]:
+        cmd_name, cmd, args = super().resolve_command(ctx, args)
+        # skip completion, which also resolves commands but will never run them
+        if (
+            cmd is not None
+            and not isinstance(cmd, click.Group)
+            and not ctx.resilient_parsing
+        ):
+            _maybe_warm_connections(cmd)
+        return cmd_name, cmd, args
+
+    def shell_complete(
+        self, ctx: click.Context, incomplete: str
+    ) -> list[CompletionItem]:
+        # describe subcommands from the command manifest if possible, rather than
+        # importing all of them
+        from click.shell_completion import CompletionItem
+
+        from globus_cli.command_manifest import get_manifest_entry
+
+        entry = get_manifest_entry(ctx)
+        if entry is None or list(entry["commands"]) != self.list_commands(ctx):
+            return super().shell_complete(ctx, incomplete)
+
+        results = [
+            CompletionItem(name, help=subcmd["short_help"])
+            for name, subcmd in entry["commands"].items()
+            if name.startswith(incomplete) and not subcmd["hidden"]
+        ]
+        # options of the group itself
+        results.extend(click.Command.shell_complete(self, ctx, incomplete))
+        return results
+
     def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
         if cmd_name in self.lazy_subcommands:
             return self._lazy_load(ctx, cmd_name)
@@ -176,14 +219,49 @@ class GlobusCommandGroup(click.Group):
         return cmd_object
 
 
+def _maybe_warm_connections(cmd: click.Command) -> None:
+    """
+    If connection warm-up is enabled, start connecting to the services which a
+    command requires, while its arguments are still being parsed.
+    """
+    from globus_cli.login_manager import LoginManager
+    from globus_cli.login_manager.connection_pool import (
+        warm_connections,
+        warm_connections_enabled,
+    )
+
+    # a shared manager's connections are already open
+    if not warm_connections_enabled() or LoginManager.is_shared():
+        return
+    services = LoginManager.get_required_services(cmd)
+    if services:
+        log.debug("warming connections for %s", ", ".join(services))
+        warm_connections(services)
+
+
 class TopLevelGroup(GlobusCommandGroup):
     """
     This is a custom command type which is basically a click.Group, but is
     designed specifically for the top level command.
     It's specialization is that it catches all exceptions from subcommands and
     passes them to a custom error handler.
+
+    It also starts the profile of each invocation, and shows it at exit if
+    ``--profile-timings`` was used.
     """
 
+    def main(self, *args: t.Any, **kwargs: t.Any) -> t.Any:
+        with profiling.invocation() as profile:
+            try:
+                return super().main(*args, **kwargs)
+            finally:
+                if profile.enabled:
+                    from globus_cli.termio.profile_timings import (
+                        render_profile_onscreen,
+                    )
+
+                    render_profile_onscreen(profile)
+
     def invoke(self, ctx: click.Context) -> t.Any:
         try:
             return super().invoke(ctx)
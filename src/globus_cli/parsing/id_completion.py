@@ -0,0 +1,60 @@
+"""
+Completion of endpoint and collection IDs, from the local index of recently seen
+endpoints and bookmarks (see ``globus_cli.local_index``).
+
+No network calls are made, so only objects which the CLI has already fetched can
+be completed.
+"""
+
+from __future__ import annotations
+
+import click
+from click.shell_completion import CompletionItem
+
+from globus_cli.local_index import BookmarkIndex, EndpointIndex, IndexedEndpoint
+
+
+def _matching_endpoints(incomplete: str) -> list[IndexedEndpoint]:
+    endpoints = EndpointIndex().entries()
+    by_id = [ep for ep in endpoints if ep.id.startswith(incomplete.lower())]
+    if by_id or not incomplete:
+        return by_id
+    # an endpoint can also be found by the start of its name, which is then
+    # replaced with its ID
+    return [
+        ep
+        for ep in endpoints
+        if ep.display_name.casefold().startswith(incomplete.casefold())
+    ]
+
+
+def complete_endpoint_id(
+    ctx: click.Context, param: click.Parameter, incomplete: str
+) -> list[CompletionItem]:
+    """Complete an endpoint or collection ID, describing each by its name."""
+    return [
+        CompletionItem(ep.id, help=ep.display_name or None)
+        for ep in _matching_endpoints(incomplete)
+    ]
+
+
+def complete_endpoint_plus_path_prefix(incomplete: str) -> list[CompletionItem]:
+    """
+    Complete the start of an ``ENDPOINT_ID:PATH`` value, before the colon.
+
+    Both endpoint IDs and the locations of bookmarks whose names match are
+    offered.
+    """
+    completions = [
+        CompletionItem(f"{ep.id}:", help=ep.display_name or None)
+        for ep in _matching_endpoints(incomplete)
+    ]
+    completions.extend(
+        CompletionItem(
+            f"{bookmark.endpoint_id}:{bookmark.path}",
+            help=f"bookmark: {bookmark.name}",
+        )
+        for bookmark in BookmarkIndex().entries()
+        if incomplete and bookmark.name.startswith(incomplete)
+    )
+    return completions
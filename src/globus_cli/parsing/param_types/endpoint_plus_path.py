@@ -4,6 +4,7 @@ import typing as t
 import uuid
 
 import click
+from click.shell_completion import CompletionItem
 
 
 class EndpointPlusPath(click.ParamType[tuple[uuid.UUID, str | None]]):
@@ -81,6 +82,26 @@ class EndpointPlusPath(click.ParamType[tuple[uuid.UUID, str | None]]):
 
         return (endpoint_id, path)
 
+    def shell_complete(
+        self, ctx: click.Context, param: click.Parameter, incomplete: str
+    ) -> list[CompletionItem]:
+        from ..id_completion import complete_endpoint_plus_path_prefix
+        from ..remote_path_completion import complete_remote_path
+
+        # paths are only completed once the endpoint ID is complete
+        endpoint_str, colon, path = incomplete.partition(":")
+        if not colon:
+            return complete_endpoint_plus_path_prefix(incomplete)
+        try:
+            endpoint_id = uuid.UUID(endpoint_str)
+        except ValueError:
+            return []
+
+        return [
+            CompletionItem(f"{endpoint_str}:{completed_path}")
+            for completed_path in complete_remote_path(endpoint_id, path)
+        ]
+
 
 ENDPOINT_PLUS_OPTPATH = EndpointPlusPath(path_required=False)
 ENDPOINT_PLUS_REQPATH = EndpointPlusPath(path_required=True)
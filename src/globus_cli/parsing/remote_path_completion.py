@@ -0,0 +1,148 @@
+"""
+Completion of paths on Globus collections, as in ``ENDPOINT_ID:PATH``.
+
+Completing a path lists the directory which contains it. Listings are cached
+locally for a short time, so that repeated completions in one directory (e.g. of
+several siblings, or pressing TAB twice) need only one request.
+
+Completion is best-effort: if a directory cannot be listed -- e.g. when offline,
+not logged in, or lacking consent for the collection -- there are no completions.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import typing as t
+import uuid
+
+from globus_cli.local_cache import LocalCache
+
+log = logging.getLogger(__name__)
+
+TTL_ENV_VAR = "GLOBUS_CLI_LISTING_CACHE_TTL"
+DEFAULT_TTL = 60
+# completion is interactive, so give up on a listing quickly
+LISTING_TIMEOUT = 5
+
+
+def _get_ttl() -> float:
+    val = os.getenv(TTL_ENV_VAR)
+    if val is None:
+        return DEFAULT_TTL
+    try:
+        return max(float(val), 0)
+    except ValueError:
+        return DEFAULT_TTL
+
+
+class DirectoryListing(t.NamedTuple):
+    # the absolute path of the directory, as reported by the service
+    path: str
+    # (name, type) pairs, where the type is e.g. "dir" or "file"
+    entries: list[tuple[str, str]]
+
+
+class ListingCache:
+    """
+    A short-lived cache of directory listings, keyed by collection ID and path.
+
+    The lifetime of listings is controlled by ``GLOBUS_CLI_LISTING_CACHE_TTL``, in
+    seconds. A value of 0 disables the cache.
+    """
+
+    def __init__(self) -> None:
+        self.ttl = _get_ttl()
+        self._local_cache = LocalCache("listings", ttl=self.ttl)
+
+    @staticmethod
+    def _key(endpoint_id: uuid.UUID, path: str) -> str:
+        return f"{endpoint_id}:{path}"
+
+    def get(self, endpoint_id: uuid.UUID, path: str) -> DirectoryListing | None:
+        if not self.ttl:
+            return None
+        data = self._local_cache.get(self._key(endpoint_id, path))
+        if not isinstance(data, dict):
+            return None
+        return DirectoryListing(
+            data["path"], [(name, type_) for name, type_ in data["entries"]]
+        )
+
+    def set(self, endpoint_id: uuid.UUID, path: str, listing: DirectoryListing) -> None:
+        if self.ttl:
+            self._local_cache.set(
+                self._key(endpoint_id, path),
+                {"path": listing.path, "entries": listing.entries},
+            )
+
+
+def _fetch_listing(endpoint_id: uuid.UUID, path: str) -> DirectoryListing:
+    from globus_cli.login_manager import LoginManager
+
+    manager = LoginManager()
+    try:
+        transfer_client = manager.get_transfer_client()
+        transfer_client.retry_config.max_retries = 0
+        ls_params: dict[str, t.Any] = {"show_hidden": 1}
+        if path:
+            ls_params["path"] = path
+        with transfer_client.transport.tune(http_timeout=LISTING_TIMEOUT):
+            response = transfer_client.operation_ls(endpoint_id, **ls_params)
+        return DirectoryListing(
+            response["path"], [(entry["name"], entry["type"]) for entry in response]
+        )
+    finally:
+        manager.close()
+
+
+def get_listing(endpoint_id: uuid.UUID, path: str) -> DirectoryListing | None:
+    """
+    Get the listing of a directory, from the cache if possible.
+
+    :param path: the directory to list; if empty, the default directory
+    :returns: the listing, or None if the directory could not be listed
+    """
+    cache = ListingCache()
+    listing = cache.get(endpoint_id, path)
+    if listing is None:
+        try:
+            listing = _fetch_listing(endpoint_id, path)
+        # any failure, including a missing login, just means there is nothing to
+        # offer, and must not break the user's shell
+        except Exception as err:
+            log.debug("could not list %s:%s for completion: %s", endpoint_id, path, err)
+            return None
+        cache.set(endpoint_id, path, listing)
+    return listing
+
+
+def complete_remote_path(endpoint_id: uuid.UUID, path: str) -> list[str]:
+    """
+    Complete a partial path on a collection.
+
+    :param path: the partial path, whose directory is listed. An empty path lists
+        the default directory. A relative path is not completed, as it depends on
+        the collection's default directory.
+    :returns: the completed paths; directories have a trailing slash
+    """
+    prefix = path.rsplit("/", 1)[-1]
+    parent = path[: len(path) - len(prefix)]
+    if not parent and prefix:
+        return []
+
+    listing = get_listing(endpoint_id, parent)
+    if listing is None:
+        return []
+    if not parent:
+        parent = listing.path if listing.path.endswith("/") else listing.path + "/"
+
+    completions = []
+    for name, type_ in sorted(listing.entries):
+        if not name.startswith(prefix):
+            continue
+        # as in other shells, hidden files are only offered when asked for
+        if name.startswith(".") and not prefix.startswith("."):
+            continue
+        completions.append(parent + name + ("/" if type_ == "dir" else ""))
+    return completions
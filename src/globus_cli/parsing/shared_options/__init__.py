@@ -12,6 +12,7 @@ from globus_cli.parsing.command_state import (
     debug_option,
     format_option,
     map_http_status_option,
+    profile_timings_option,
     quiet_option,
     show_server_timing_option,
     verbose_option,
@@ -54,6 +55,7 @@ def common_options(*, disable_options: list[str] | None = None) -> t.Callable[[C
     def decorator(f: C) -> C:
         f = debug_option(f)
         f = show_server_timing_option(f)
+        f = profile_timings_option(f)
         f = verbose_option(f)
         f = quiet_option(f)
         f = click.help_option("-h", "--help")(f)
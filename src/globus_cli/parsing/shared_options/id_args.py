@@ -8,19 +8,43 @@ Basic usage:
 >>>     ...
 """
 
+from __future__ import annotations
+
 import typing as t
 
 import click
 
+if t.TYPE_CHECKING:
+    from click.shell_completion import CompletionItem
+
 C = t.TypeVar("C", bound=t.Union[click.Command, t.Callable[..., t.Any]])
 
 
+def _complete_endpoint_id(
+    ctx: click.Context, param: click.Parameter, incomplete: str
+) -> list[CompletionItem]:
+    # imported only when completing, to keep it out of command startup
+    from globus_cli.parsing.id_completion import complete_endpoint_id
+
+    return complete_endpoint_id(ctx, param, incomplete)
+
+
 def collection_id_arg(f: C) -> C:
-    return click.argument("collection_id", metavar="COLLECTION_ID", type=click.UUID)(f)
+    return click.argument(
+        "collection_id",
+        metavar="COLLECTION_ID",
+        type=click.UUID,
+        shell_complete=_complete_endpoint_id,
+    )(f)
 
 
 def endpoint_id_arg(f: C) -> C:
-    return click.argument("endpoint_id", metavar="ENDPOINT_ID", type=click.UUID)(f)
+    return click.argument(
+        "endpoint_id",
+        metavar="ENDPOINT_ID",
+        type=click.UUID,
+        shell_complete=_complete_endpoint_id,
+    )(f)
 
 
 def flow_id_arg(f: C) -> C:
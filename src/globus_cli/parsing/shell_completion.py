@@ -7,13 +7,33 @@ import click
 
 C = t.TypeVar("C", bound=t.Union[t.Callable[..., t.Any], click.Command])
 
-# pulled by running `_GLOBUS_COMPLETE=source globus` in a bash shell
+# based on the output of `_GLOBUS_COMPLETE=source globus` in a bash shell, with
+# handling for colons, which bash treats as word breaks (as in ENDPOINT_ID:PATH)
 BASH_SHELL_COMPLETER = r"""
 _globus_completion() {
     local IFS=$'\n'
     local response
+    local words=() cword=0 i
+
+    # rejoin words which bash split on colons
+    for ((i = 0; i < ${#COMP_WORDS[@]}; i++)); do
+        if ((i > 0)) && [[ ${COMP_WORDS[i]} == ":" || ${COMP_WORDS[i-1]} == ":" ]]; then
+            words[${#words[@]}-1]+="${COMP_WORDS[i]}"
+        else
+            words+=("${COMP_WORDS[i]}")
+        fi
+        if ((i == COMP_CWORD)); then
+            cword=$((${#words[@]} - 1))
+        fi
+    done
 
-    response=$(env COMP_WORDS="${COMP_WORDS[*]}" COMP_CWORD=$COMP_CWORD _GLOBUS_COMPLETE=bash_complete $1)
+    # bash replaces only the text after the last colon in the current word
+    local cur="${words[cword]}" colon_prefix=""
+    if [[ $cur == *:* && $COMP_WORDBREAKS == *:* ]]; then
+        colon_prefix="${cur%"${cur##*:}"}"
+    fi
+
+    response=$(env COMP_WORDS="${words[*]}" COMP_CWORD=$cword _GLOBUS_COMPLETE=bash_complete $1)
 
     for completion in $response; do
         IFS=',' read type value <<< "$completion"
@@ -25,7 +45,12 @@ _globus_completion() {
             COMREPLY=()
             compopt -o default
         elif [[ $type == 'plain' ]]; then
-            COMPREPLY+=($value)
+            # don't add a space after an endpoint ID or a directory, so that
+            # the path can be continued
+            if [[ $value == *[:/] ]]; then
+                compopt -o nospace
+            fi
+            COMPREPLY+=("${value#"$colon_prefix"}")
         fi
     done
 
@@ -0,0 +1,184 @@
+"""
+Client-side timings for a single invocation, shown with ``--profile-timings``.
+
+The phases of a command -- startup, parsing, opening token storage, validating
+logins, and rendering output -- are recorded for every invocation, as doing so is
+cheap. HTTP requests are only timed once profiling has been enabled, and then only
+those sent through the connection pool shared by a LoginManager's clients.
+
+This module is imported before anything else by the ``globus`` console script, so
+it must only import from the standard library.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import dataclasses
+import functools
+import os
+import threading
+import time
+import typing as t
+
+PROFILE_TIMINGS_ENV_VAR = "GLOBUS_CLI_PROFILE_TIMINGS"
+
+F = t.TypeVar("F", bound=t.Callable[..., t.Any])
+
+# the time at which the CLI started loading
+_LOADED_AT = time.perf_counter()
+
+
+class PhaseTiming(t.NamedTuple):
+    name: str
+    start: float
+    duration: float
+
+
+@dataclasses.dataclass
+class RequestTiming:
+    """
+    The timing of a single HTTP request. All durations are in seconds.
+
+    Connection times are only recorded when a new connection is opened for the
+    request; a connection which is reused costs nothing.
+    """
+
+    method: str
+    url: str
+    start: float
+    status: int | None = None
+    # name resolution and the TCP connection
+    connect: float = 0.0
+    tls: float = 0.0
+    # from sending the request until the response headers are received
+    wait: float = 0.0
+    download: float = 0.0
+    json_parse: float = 0.0
+    duration: float = 0.0
+
+
+class Profile:
+    """The timings recorded for one invocation of the CLI."""
+
+    def __init__(self, phases: t.Iterable[PhaseTiming] = ()) -> None:
+        self.enabled = False
+        self.start = time.perf_counter()
+        self.phases: list[PhaseTiming] = list(phases)
+        self.requests: list[RequestTiming] = []
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> t.Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(name, start, time.perf_counter())
+
+    def add_phase(self, name: str, start: float, end: float) -> None:
+        with self._lock:
+            self.phases.append(PhaseTiming(name, start, end - start))
+
+    def add_request(self, timing: RequestTiming) -> None:
+        with self._lock:
+            self.requests.append(timing)
+
+
+# the profile of the invocation running in the current context, if any
+_CURRENT_PROFILE: contextvars.ContextVar[Profile | None] = contextvars.ContextVar(
+    "_CURRENT_PROFILE", default=None
+)
+# phases recorded by the console script before the first invocation
+_STARTUP_PHASES: list[PhaseTiming] = []
+_STARTUP_PHASES_LOCK = threading.Lock()
+
+
+def get_profile() -> Profile:
+    """
+    Get the profile of the current invocation.
+
+    Outside of an invocation, a new profile is returned, so that timings recorded
+    there are discarded.
+    """
+    profile = _CURRENT_PROFILE.get()
+    return profile if profile is not None else Profile()
+
+
+@contextlib.contextmanager
+def invocation() -> t.Iterator[Profile]:
+    """
+    Profile an invocation which is about to parse its arguments, in the current
+    context.
+
+    Concurrent invocations, run on separate threads, each have their own profile.
+    The new profile includes any startup phases which have not yet been reported.
+    """
+    with _STARTUP_PHASES_LOCK:
+        profile = Profile(_STARTUP_PHASES)
+        _STARTUP_PHASES.clear()
+
+    token = _CURRENT_PROFILE.set(profile)
+    try:
+        yield profile
+    finally:
+        _CURRENT_PROFILE.reset(token)
+
+
+def record_startup(imports_started_at: float) -> None:
+    """
+    Record the startup phases of the console script: starting the interpreter, and
+    importing the CLI.
+
+    :param imports_started_at: the time at which the CLI's commands began to be
+        imported
+    """
+    process_start = _find_process_start()
+    if process_start is not None:
+        _STARTUP_PHASES.append(
+            PhaseTiming(
+                "interpreter startup", process_start, _LOADED_AT - process_start
+            )
+        )
+    _STARTUP_PHASES.append(
+        PhaseTiming(
+            "import commands",
+            imports_started_at,
+            time.perf_counter() - imports_started_at,
+        )
+    )
+
+
+def timed(name: str) -> t.Callable[[F], F]:
+    """A decorator which records each call to a function as a phase."""
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: t.Any, **kwargs: t.Any) -> t.Any:
+            with get_profile().phase(name):
+                return func(*args, **kwargs)
+
+        return t.cast(F, wrapper)
+
+    return decorator
+
+
+def _find_process_start() -> float | None:
+    """
+    Find the time at which this process started, on the ``perf_counter`` clock.
+
+    This is only possible on Linux, and only to the resolution of the kernel clock
+    (usually 10ms).
+    """
+    try:
+        with open("/proc/self/stat", encoding="utf-8") as f:
+            stat = f.read()
+        # fields are counted from the end of the command name, which may contain
+        # spaces; the start time is field 22 and the first after the name is 3
+        start_ticks = int(stat.rpartition(")")[2].split()[19])
+        age = time.clock_gettime(time.CLOCK_BOOTTIME) - start_ticks / os.sysconf(
+            "SC_CLK_TCK"
+        )
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+    return time.perf_counter() - age
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import typing as t
 import uuid
 
@@ -15,6 +16,74 @@ def _is_uuid(s: str) -> bool:
         return False
 
 
+class IdentityCache(t.MutableMapping[str, t.Dict[str, t.Any]]):
+    """
+    A cache of identity documents, keyed by both identity ID and username.
+
+    Lookups are served from memory, then from a persistent local cache, so that
+    identities resolved by one command can be reused by later ones.
+    Identities which were looked up and not found are also recorded, for a
+    shorter time, so that they are not looked up again repeatedly.
+
+    This is suitable for use as the ``cache`` of a ``globus_sdk.IdentityMap``.
+    """
+
+    # identity IDs never change, and usernames and names change very rarely
+    TTL = 24 * 60 * 60
+    # but an unknown username may be provisioned at any time
+    NEGATIVE_TTL = 5 * 60
+
+    def __init__(self) -> None:
+        from globus_cli.local_cache import LocalCache
+
+        self._local_cache = LocalCache("identities", ttl=self.TTL)
+        # values of None record identities which are known not to exist
+        self._memo: dict[str, dict[str, t.Any] | None] = {}
+        # keys which have been checked against the persistent cache
+        self._checked: set[str] = set()
+
+    def prefetch(self, keys: t.Iterable[str]) -> None:
+        """Load any persistently cached data for several keys at once."""
+        unchecked = {k for k in keys if k not in self._checked}
+        self._checked.update(unchecked)
+        self._memo.update(self._local_cache.get_many(unchecked))
+
+    def is_known_missing(self, key: str) -> bool:
+        self.prefetch((key,))
+        return key in self._memo and self._memo[key] is None
+
+    def mark_missing(self, key: str) -> None:
+        self._memo[key] = None
+        self._local_cache.set(key, None, ttl=self.NEGATIVE_TTL)
+
+    def add_identity(self, identity: dict[str, t.Any]) -> None:
+        """Cache an identity document under both its ID and username."""
+        for key in ("id", "username"):
+            if isinstance(identity.get(key), str):
+                self[identity[key]] = identity
+
+    def __getitem__(self, key: str) -> dict[str, t.Any]:
+        self.prefetch((key,))
+        value = self._memo.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: dict[str, t.Any]) -> None:
+        self._memo[key] = value
+        self._local_cache.set(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self._memo.pop(key, None)
+        self._local_cache.delete(key)
+
+    def __iter__(self) -> t.Iterator[str]:
+        return (k for k, v in self._memo.items() if v is not None)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
 class GetIdentitiesKwargs(t.TypedDict, total=False):
     provision: bool
     usernames: str
@@ -22,6 +91,10 @@ class GetIdentitiesKwargs(t.TypedDict, total=False):
 
 
 class CustomAuthClient(globus_sdk.AuthClient):
+    @functools.cached_property
+    def identity_cache(self) -> IdentityCache:
+        return IdentityCache()
+
     def _lookup_identity_field(
         self,
         id_name: str | None = None,
@@ -33,17 +106,29 @@ class CustomAuthClient(globus_sdk.AuthClient):
 
         kw: GetIdentitiesKwargs = {"provision": provision}
         if id_name:
-            kw["usernames"] = id_name
+            kw["usernames"] = cache_key = id_name
         elif id_id:
-            kw["ids"] = id_id
+            kw["ids"] = cache_key = id_id
         else:
             raise NotImplementedError("must provide id or name")
 
+        # provisioning may create an identity which was previously missing
+        if not provision and self.identity_cache.is_known_missing(cache_key):
+            return None
+
+        try:
+            identity = self.identity_cache[cache_key]
+        except KeyError:
+            identities = self.get_identities(**kw)["identities"]
+            if not identities:
+                self.identity_cache.mark_missing(cache_key)
+                return None
+            identity = identities[0]
+            self.identity_cache.add_identity(identity)
+
         try:
-            value = self.get_identities(**kw)["identities"][0][field]
-        # capture any failure to lookup this data, including:
-        # - identity doesn't exist (`identities=[]`)
-        # - field is missing
+            value = identity[field]
+        # capture any failure to lookup this data, including a missing field
         except LookupError:
             return None
 
@@ -8,6 +8,7 @@ from .data import (
     assemble_generic_doc,
     iterable_response_to_dict,
 )
+from .endpoint_cache import EndpointCache
 from .recursive_ls import RecursiveLsResponse
 
 
@@ -59,6 +60,7 @@ __all__ = (
     "ENDPOINT_LIST_FIELDS",
     "DOMAIN_FIELD",
     "CustomTransferClient",
+    "EndpointCache",
     "RecursiveLsResponse",
     "iterable_response_to_dict",
     "assemble_generic_doc",
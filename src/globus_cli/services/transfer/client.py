@@ -6,14 +6,17 @@ import uuid
 
 import globus_sdk
 from globus_sdk.transport import (
+    RequestsTransport,
     RetryCheckFlags,
     RetryCheckResult,
     RetryContext,
     set_retry_check_flags,
 )
 
+from globus_cli.local_index import BookmarkIndex, EndpointIndex
 from globus_cli.login_manager import get_client_login, is_client_login
 
+from .endpoint_cache import EndpointCache
 from .recursive_ls import RecursiveLsResponse
 
 log = logging.getLogger(__name__)
@@ -46,9 +49,105 @@ class CustomTransferClient(globus_sdk.TransferClient):
         *,
         authorizer: globus_sdk.authorizers.GlobusAuthorizer,
         app_name: str,
+        transport: RequestsTransport | None = None,
+        endpoint_cache: EndpointCache | None = None,
     ) -> None:
-        super().__init__(authorizer=authorizer, app_name=app_name)
+        super().__init__(authorizer=authorizer, app_name=app_name, transport=transport)
         self.retry_config.checks.register_check(_retry_client_consent)
+        self.endpoint_cache = endpoint_cache or EndpointCache()
+        # indexes of seen objects, for shell completion
+        self.endpoint_index = EndpointIndex()
+        self.bookmark_index = BookmarkIndex()
+
+    def get_endpoint(
+        self,
+        endpoint_id: uuid.UUID | str,
+        *,
+        query_params: dict[str, t.Any] | None = None,
+    ) -> globus_sdk.GlobusHTTPResponse:
+        if query_params:
+            return super().get_endpoint(endpoint_id, query_params=query_params)
+
+        res = self.endpoint_cache.get_fetched(endpoint_id)
+        if res is None:
+            res = super().get_endpoint(endpoint_id)
+            self.endpoint_cache.record(endpoint_id, res)
+            self.endpoint_index.record(res.data)
+        return res
+
+    def get_endpoint_data(self, endpoint_id: uuid.UUID | str) -> dict[str, t.Any]:
+        """
+        Get an endpoint document for inspection, possibly from the local cache.
+
+        The document may be stale, and should not be displayed.
+        """
+        data = self.endpoint_cache.get_data(endpoint_id)
+        if data is None:
+            data = self.get_endpoint(endpoint_id).data
+        return data
+
+    def update_endpoint(
+        self,
+        endpoint_id: uuid.UUID | str,
+        data: dict[str, t.Any],
+        *,
+        query_params: dict[str, t.Any] | None = None,
+    ) -> globus_sdk.GlobusHTTPResponse:
+        self.endpoint_cache.discard(endpoint_id)
+        return super().update_endpoint(endpoint_id, data, query_params=query_params)
+
+    def delete_endpoint(
+        self, endpoint_id: uuid.UUID | str
+    ) -> globus_sdk.GlobusHTTPResponse:
+        self.endpoint_cache.discard(endpoint_id)
+        self.endpoint_index.discard(endpoint_id)
+        return super().delete_endpoint(endpoint_id)
+
+    def set_subscription_id(
+        self,
+        collection_id: uuid.UUID | str,
+        subscription_id: uuid.UUID | str | t.Literal["DEFAULT"] | None,
+    ) -> globus_sdk.GlobusHTTPResponse:
+        self.endpoint_cache.discard(collection_id)
+        return super().set_subscription_id(collection_id, subscription_id)
+
+    def set_subscription_admin_verified(
+        self, collection_id: uuid.UUID | str, subscription_admin_verified: bool
+    ) -> globus_sdk.GlobusHTTPResponse:
+        self.endpoint_cache.discard(collection_id)
+        return super().set_subscription_admin_verified(
+            collection_id, subscription_admin_verified
+        )
+
+    def bookmark_list(
+        self, *, query_params: dict[str, t.Any] | None = None
+    ) -> globus_sdk.IterableTransferResponse:
+        res = super().bookmark_list(query_params=query_params)
+        self.bookmark_index.replace_all(res)
+        return res
+
+    def create_bookmark(
+        self, bookmark_data: dict[str, t.Any]
+    ) -> globus_sdk.GlobusHTTPResponse:
+        res = super().create_bookmark(bookmark_data)
+        self.bookmark_index.record(res.data)
+        return res
+
+    def update_bookmark(
+        self,
+        bookmark_id: uuid.UUID | str,
+        bookmark_data: dict[str, t.Any],
+    ) -> globus_sdk.GlobusHTTPResponse:
+        self.bookmark_index.discard(bookmark_id)
+        res = super().update_bookmark(bookmark_id, bookmark_data)
+        self.bookmark_index.record(res.data)
+        return res
+
+    def delete_bookmark(
+        self, bookmark_id: uuid.UUID | str
+    ) -> globus_sdk.GlobusHTTPResponse:
+        self.bookmark_index.discard(bookmark_id)
+        return super().delete_bookmark(bookmark_id)
 
     # TODO: Remove this function when endpoints natively support recursive ls
     def recursive_operation_ls(
@@ -11,7 +11,7 @@ from globus_cli.parsing import (
     TaskPath,
     mutex_option_group,
 )
-from globus_cli.utils import shlex_process_stream
+from globus_cli.utils import IterableJsonConverter, shlex_process_stream
 
 
 def add_batch_to_transfer_data(
@@ -64,16 +64,7 @@ def _none_to_missing(
     return value
 
 
-def iterable_response_to_dict(iterator: t.Iterable[t.Any]) -> dict[str, list[t.Any]]:
-    output_dict: dict[str, list[t.Any]] = {"DATA": []}
-    for item in iterator:
-        dat = item
-        try:
-            dat = item.data
-        except AttributeError:
-            pass
-        output_dict["DATA"].append(dat)
-    return output_dict
+iterable_response_to_dict = IterableJsonConverter("DATA", unwrap_responses=True)
 
 
 def assemble_generic_doc(datatype: str, **kwargs: t.Any) -> dict[str, t.Any]:
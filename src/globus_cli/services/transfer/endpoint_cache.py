@@ -0,0 +1,85 @@
+"""
+Caching of endpoint and collection documents.
+
+Many commands inspect an endpoint document (e.g. for its entity type or GCS
+address) before doing their real work, and some then fetch the same document again.
+Documents fetched during an invocation are kept in memory, so that no invocation
+fetches an endpoint twice, and are also cached locally for use by later
+invocations.
+
+Locally cached documents may be stale, so they are only used for inspection
+(see ``Endpointish``). Documents which are displayed always come from the service.
+"""
+
+from __future__ import annotations
+
+import os
+import typing as t
+import uuid
+
+import globus_sdk
+
+from globus_cli.local_cache import LocalCache
+
+TTL_ENV_VAR = "GLOBUS_CLI_ENDPOINT_CACHE_TTL"
+DEFAULT_TTL = 3600
+
+
+def _get_ttl() -> float:
+    val = os.getenv(TTL_ENV_VAR)
+    if val is None:
+        return DEFAULT_TTL
+    try:
+        return max(float(val), 0)
+    except ValueError:
+        return DEFAULT_TTL
+
+
+def _key(endpoint_id: uuid.UUID | str) -> str:
+    return str(endpoint_id).lower()
+
+
+class EndpointCache:
+    """
+    A cache of endpoint documents, keyed by endpoint ID.
+
+    The lifetime of locally cached documents is controlled by
+    ``GLOBUS_CLI_ENDPOINT_CACHE_TTL``, in seconds. A value of 0 disables the local
+    cache, but not the in-memory cache of documents fetched during the invocation.
+    """
+
+    def __init__(self) -> None:
+        self.ttl = _get_ttl()
+        self._local_cache = LocalCache("endpoints", ttl=self.ttl)
+        # responses fetched from the service by this process
+        self._fetched: dict[str, globus_sdk.GlobusHTTPResponse] = {}
+
+    def get_fetched(
+        self, endpoint_id: uuid.UUID | str
+    ) -> globus_sdk.GlobusHTTPResponse | None:
+        """Get a response which was fetched from the service by this process."""
+        return self._fetched.get(_key(endpoint_id))
+
+    def get_data(self, endpoint_id: uuid.UUID | str) -> dict[str, t.Any] | None:
+        """
+        Get an endpoint document, which may have been cached by an earlier
+        invocation.
+        """
+        fetched = self.get_fetched(endpoint_id)
+        if fetched is not None:
+            return t.cast(t.Dict[str, t.Any], fetched.data)
+        if not self.ttl:
+            return None
+        data = self._local_cache.get(_key(endpoint_id))
+        return data if isinstance(data, dict) else None
+
+    def record(
+        self, endpoint_id: uuid.UUID | str, response: globus_sdk.GlobusHTTPResponse
+    ) -> None:
+        self._fetched[_key(endpoint_id)] = response
+        if self.ttl:
+            self._local_cache.set(_key(endpoint_id), response.data)
+
+    def discard(self, endpoint_id: uuid.UUID | str) -> None:
+        self._fetched.pop(_key(endpoint_id), None)
+        self._local_cache.delete(_key(endpoint_id))
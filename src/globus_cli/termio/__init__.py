@@ -1,6 +1,7 @@
 import click
 
 from ._display import display
+from .buffered_output import BufferedEcho, buffered_echo, flush_buffered_output
 from .context import (
     env_interactive,
     err_is_terminal,
@@ -32,6 +33,9 @@ __all__ = [
     "write_error_info",
     "Field",
     "display",
+    "BufferedEcho",
+    "buffered_echo",
+    "flush_buffered_output",
     "out_is_terminal",
     "env_interactive",
     "err_is_terminal",
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import collections.abc
 import enum
 import typing as t
 
 import click
 import globus_sdk
 
+from globus_cli.profiling import timed
+from globus_cli.utils import IterableJsonConverter, PagingWrapper
+
 from .context import (
     fold_tables,
     outformat_is_json,
@@ -25,6 +29,9 @@ from .printers import (
 )
 from .server_timing import maybe_show_server_timing
 
+# the number of rows used to lay out a streamed table
+STREAMING_TABLE_SAMPLE_SIZE = 100
+
 
 class TextMode(enum.Enum):
     silent = enum.auto()
@@ -52,6 +59,7 @@ class Renderer:
     RECORD_LIST = TextMode.text_record_list
     RAW = TextMode.text_raw
 
+    @timed("render output")
     def __call__(
         self,
         response_data: t.Any,
@@ -140,17 +148,52 @@ class Renderer:
         :returns: True if a special format was matched, False otherwise
         """
         if outformat_is_json() or (outformat_is_text() and text_mode == self.JSON):
-            data = json_converter(response_data) if json_converter else response_data
-            JsonPrinter(sort_keys=sort_json_keys).echo(data, stream=stream)
+            json_printer = JsonPrinter(sort_keys=sort_json_keys)
+            items = self._preprocess_items(json_printer, response_data, json_converter)
+            if items is not None:
+                json_printer.echo_items(items, stream=stream)
+            else:
+                data = (
+                    json_converter(response_data) if json_converter else response_data
+                )
+                json_printer.echo(data, stream=stream)
         elif outformat_is_unix():
-            data = json_converter(response_data) if json_converter else response_data
-            UnixPrinter().echo(data, stream=stream)
+            unix_printer = UnixPrinter()
+            items = self._preprocess_items(unix_printer, response_data, json_converter)
+            if items is not None:
+                unix_printer.echo_items(items, stream=stream)
+            else:
+                data = (
+                    json_converter(response_data) if json_converter else response_data
+                )
+                unix_printer.echo(data, stream=stream)
         elif simple_text is not None:
             click.echo(simple_text, file=stream)
         elif text_mode != self.SILENT:
             return False
         return True
 
+    def _preprocess_items(
+        self,
+        printer: Printer[t.Any],
+        response_data: t.Any,
+        json_converter: t.Callable[..., t.Any] | None,
+    ) -> t.Iterator[t.Any] | None:
+        """
+        When the data is an iterable which would be collected into a list under
+        a known key, and the JMESPath expression is a projection over that list,
+        evaluate the expression per-item so that the items can be handled as they
+        arrive rather than after the whole listing has been collected.
+
+        :returns: an iterator over the results, or None if per-item evaluation
+            does not apply
+        """
+        if not isinstance(json_converter, IterableJsonConverter):
+            return None
+        return printer.jmespath_preprocess_items(
+            json_converter.key, json_converter.iter_items(response_data)
+        )
+
     def _index_response_data(
         self,
         response_data: t.Any,
@@ -178,10 +221,19 @@ class Renderer:
 
             _assert_iterable(data)
             if text_mode == self.TABLE:
+                # lazy iterators (e.g. paginated listings) are streamed, rather than
+                # waiting for the entire listing to lay out the table
+                sample_size = (
+                    STREAMING_TABLE_SAMPLE_SIZE if _is_lazy_iterable(data) else None
+                )
                 if (folding_enabled := fold_tables()) is not False:
-                    return FoldedTablePrinter(fields, folding_enabled=folding_enabled)
+                    return FoldedTablePrinter(
+                        fields,
+                        folding_enabled=folding_enabled,
+                        sample_size=sample_size,
+                    )
                 else:
-                    return TablePrinter(fields)
+                    return TablePrinter(fields, sample_size=sample_size)
             if text_mode == self.RECORD_LIST:
                 return RecordListPrinter(fields)
 
@@ -189,6 +241,10 @@ class Renderer:
         return CustomPrinter(custom_print=click.echo)
 
 
+def _is_lazy_iterable(data: t.Any) -> bool:
+    return isinstance(data, (collections.abc.Iterator, PagingWrapper))
+
+
 def _assert_fields(fields: list[Field] | None) -> list[Field]:
     if fields is not None:
         return fields
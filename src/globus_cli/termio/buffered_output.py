@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import contextlib
+import sys
+import threading
+import time
+import typing as t
+
+import click
+
+# flush buffered output once this many characters are pending...
+DEFAULT_MAX_BUFFER_SIZE = 64 * 1024
+# ...or once this many seconds have passed since the last flush
+DEFAULT_MAX_DELAY = 0.1
+
+# the BufferedEcho objects in use by each thread
+_ACTIVE = threading.local()
+
+
+class BufferedEcho:
+    """
+    A replacement for ``click.echo`` which batches many small writes into fewer,
+    larger ones.
+
+    Buffered text is written with a single ``click.echo`` call per flush, so click's
+    stream resolution and ANSI style handling still apply to all output.
+    Output to a terminal is written through on every call, so interactive users
+    see output as it is produced.
+
+    :param stream: the stream to write to. Defaults to stdout.
+    :param max_size: flush when at least this many characters are buffered
+    :param max_delay: flush on a write which comes at least this many seconds
+        after the last flush
+    """
+
+    def __init__(
+        self,
+        stream: t.IO[str] | None = None,
+        *,
+        max_size: int = DEFAULT_MAX_BUFFER_SIZE,
+        max_delay: float = DEFAULT_MAX_DELAY,
+    ) -> None:
+        self._stream = stream
+        self._max_size = max_size
+        self._max_delay = max_delay
+        self._write_through = _is_terminal(stream)
+
+        self._buffer: list[str] = []
+        self._buffered_size = 0
+        self._last_flush = time.monotonic()
+
+    def __call__(self, message: str = "", nl: bool = True) -> None:
+        if self._write_through:
+            click.echo(message, file=self._stream, nl=nl)
+            return
+
+        if nl:
+            message += "\n"
+        self._buffer.append(message)
+        self._buffered_size += len(message)
+
+        if (
+            self._buffered_size >= self._max_size
+            or time.monotonic() - self._last_flush >= self._max_delay
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write out any buffered output."""
+        if self._buffer:
+            click.echo("".join(self._buffer), file=self._stream, nl=False)
+            self._buffer.clear()
+            self._buffered_size = 0
+        self._last_flush = time.monotonic()
+
+
+@contextlib.contextmanager
+def buffered_echo(stream: t.IO[str] | None = None) -> t.Iterator[BufferedEcho]:
+    """
+    Get a ``BufferedEcho`` for a stream, which is flushed on exit.
+
+    Usage:
+
+    >>> with buffered_echo(stream) as echo:
+    ...     for line in lines:
+    ...         echo(line)
+    """
+    echo = BufferedEcho(stream)
+    active: list[BufferedEcho] = _ACTIVE.__dict__.setdefault("echoes", [])
+    active.append(echo)
+    try:
+        yield echo
+    finally:
+        active.remove(echo)
+        echo.flush()
+
+
+def flush_buffered_output() -> None:
+    """
+    Write out any output buffered by ``buffered_echo`` in the current thread.
+
+    Buffered output is otherwise only flushed by the next write, so this is called
+    before the thread waits on something slow, such as a request for the next page
+    of a listing, so that the output which is ready is not held up.
+    """
+    for echo in getattr(_ACTIVE, "echoes", ()):
+        echo.flush()
+
+
+def _is_terminal(stream: t.IO[str] | None) -> bool:
+    stream = stream if stream is not None else sys.stdout
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError):
+        return False
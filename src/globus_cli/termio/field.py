@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import functools
+import re
 import typing as t
 
 from . import formatters
 
+# a jmespath expression which is a plain (unquoted) identifier, or a chain of them
+# separated by dots, e.g. `foo` or `foo.bar_baz`
+_SIMPLE_PATH_PATTERN = re.compile(
+    r"[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)*", re.ASCII
+)
+
 
 class Field:
     """A field which will be shown in record or table output.
@@ -29,12 +37,44 @@ class Field:
         self.formatter = formatter
 
     def get_value(self, data: t.Any) -> t.Any:
-        import jmespath
-
-        return jmespath.search(self.key, data)
+        return _compile_accessor(self.key)(data)
 
     def format(self, value: t.Any) -> str:
         return self.formatter.format(value)
 
     def serialize(self, data: t.Any) -> str:
         return self.format(self.get_value(data))
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_accessor(key: str) -> t.Callable[[t.Any], t.Any]:
+    """
+    Compile a jmespath expression into a function which evaluates it.
+
+    Plain keys and dotted paths of plain keys are handled with direct lookups,
+    which match jmespath's semantics for field access. Any other expression is
+    compiled with jmespath.
+    """
+    if _SIMPLE_PATH_PATTERN.fullmatch(key):
+        if "." not in key:
+            return functools.partial(_get_field, key=key)
+        return functools.partial(_get_path, path=tuple(key.split(".")))
+
+    import jmespath
+
+    return jmespath.compile(key).search
+
+
+def _get_field(data: t.Any, key: str) -> t.Any:
+    # jmespath applies `.get()` to the data, treating anything which does not
+    # support it as having no fields
+    try:
+        return data.get(key)
+    except AttributeError:
+        return None
+
+
+def _get_path(data: t.Any, path: tuple[str, ...]) -> t.Any:
+    for key in path:
+        data = _get_field(data, key)
+    return data
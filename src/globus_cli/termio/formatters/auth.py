@@ -28,13 +28,21 @@ class PrincipalFormatter(FieldFormatter[t.Tuple[str, str]]):
     """
 
     def __init__(self, auth_client: globus_sdk.AuthClient) -> None:
+        from globus_cli.services.auth import IdentityCache
+
         self.auth_client = auth_client
-        self.resolved_ids = globus_sdk.IdentityMap(auth_client)
+        self.identity_cache = IdentityCache()
+        self.resolved_ids = globus_sdk.IdentityMap(
+            auth_client, cache=self.identity_cache
+        )
 
     def render_identity_id(self, identity_id: str) -> str:
+        if self.identity_cache.is_known_missing(identity_id):
+            return identity_id
         try:
             return t.cast(str, self.resolved_ids[identity_id]["username"])
         except LookupError:
+            self.identity_cache.mark_missing(identity_id)
             return identity_id
 
     # TODO: re-assess Group rendering in the CLI
@@ -58,6 +66,7 @@ class PrincipalFormatter(FieldFormatter[t.Tuple[str, str]]):
         :param values: One or more principal value matching the specific subclass's
             parse() expectations.
         """
+        identity_ids = []
         for value in values:
             try:
                 principal, principal_type = self.parse(value)
@@ -65,7 +74,14 @@ class PrincipalFormatter(FieldFormatter[t.Tuple[str, str]]):
                 pass
             else:
                 if principal_type == "identity":
-                    self.resolved_ids.add(principal)
+                    identity_ids.append(principal)
+
+        # check the local cache for all of the identities at once, and only add
+        # those which are not already known (or known to be missing) for lookup
+        self.identity_cache.prefetch(identity_ids)
+        for identity_id in identity_ids:
+            if not self.identity_cache.is_known_missing(identity_id):
+                self.resolved_ids.add(identity_id)
 
     def render(self, value: tuple[str, str]) -> str:
         principal, principal_type = value
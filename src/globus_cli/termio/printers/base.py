@@ -32,3 +32,82 @@ class Printer(abc.ABC, t.Generic[DataType]):
                 res = jmespath_expr.search(res)
 
         return res
+
+    @classmethod
+    def jmespath_preprocess_items(
+        cls, key: str, items: t.Iterable[t.Any]
+    ) -> t.Iterator[t.Any] | None:
+        """
+        Apply the current JMESPath expression to a document of the form
+        ``{key: items}`` one item at a time, if the expression allows it.
+
+        :param key: the key under which ``items`` would be collected
+        :param items: the items of the document
+        :returns: an iterator over the results, or None if the expression cannot
+            be evaluated per-item
+        """
+        expression = PerItemExpression.from_compiled(get_jmespath_expression(), key)
+        if expression is None:
+            return None
+        return expression.search_items(items)
+
+
+class PerItemExpression:
+    """
+    A JMESPath expression of the form ``KEY[*].<expr>`` or ``KEY[?<filter>].<expr>``.
+
+    Such an expression is a projection over the ``KEY`` list, so it can be
+    evaluated against each item of that list independently. Items which project
+    to null (including those removed by the filter) are dropped.
+
+    :param node: the parsed projection node, with its left-hand side replaced by
+        an identity node
+    """
+
+    _PROJECTION_TYPES = ("projection", "filter_projection")
+
+    def __init__(self, node: dict[str, t.Any]) -> None:
+        from jmespath.visitor import TreeInterpreter
+
+        self._node: t.Any = node
+        self._interpreter = TreeInterpreter()
+
+    @classmethod
+    def from_compiled(cls, expression: t.Any, key: str) -> PerItemExpression | None:
+        """
+        Build a per-item expression from a compiled JMESPath expression.
+
+        :param expression: a compiled JMESPath expression, or None
+        :param key: the key which the projection must apply to
+        :returns: the per-item expression, or None if the expression is not a
+            projection over ``key``
+        """
+        parsed = getattr(expression, "parsed", None)
+        if not isinstance(parsed, dict) or parsed["type"] not in cls._PROJECTION_TYPES:
+            return None
+
+        lhs, *rest = parsed["children"]
+        if lhs != {"type": "field", "children": [], "value": key}:
+            return None
+
+        return cls(
+            {**parsed, "children": [{"type": "identity", "children": []}, *rest]}
+        )
+
+    def search_items(self, items: t.Iterable[t.Any]) -> t.Iterator[t.Any]:
+        # evaluating the projection on a single-element list yields zero or one
+        # results, preserving the exact semantics of the original expression
+        for item in items:
+            yield from self._interpreter.visit(self._node, [item])
+
+
+def truncate_cell(value: str, width: int) -> str:
+    """
+    Truncate a table cell value to fit in a column of the given width, marking any
+    truncation with a trailing ellipsis.
+    """
+    if len(value) <= width:
+        return value
+    if width < 3:
+        return value[:width]
+    return value[: width - 3] + "..."
@@ -4,14 +4,14 @@ import collections
 import dataclasses
 import enum
 import functools
+import itertools
 import shutil
 import typing as t
 
-import click
-
+from ..buffered_output import BufferedEcho, buffered_echo
 from ..context import out_is_terminal, term_is_interactive
 from ..field import Field
-from .base import Printer
+from .base import Printer, truncate_cell
 
 
 # the separator rows, including the top and bottom
@@ -85,6 +85,9 @@ class FoldedTablePrinter(Printer[t.Iterable[t.Any]]):
     :param width: the width to use for display (defaults to terminal width)
     :param folding_enabled: explicitly force output to be folded or un-folded (defaults
         to interactive terminal detection)
+    :param sample_size: if given, stream the table: folding and column widths are
+        decided from only the first ``sample_size`` rows, and later rows are printed
+        as they arrive, with any overlong cells truncated to fit.
     """
 
     def __init__(
@@ -92,8 +95,10 @@ class FoldedTablePrinter(Printer[t.Iterable[t.Any]]):
         fields: t.Iterable[Field],
         width: int | None = None,
         folding_enabled: bool | None = None,
+        sample_size: int | None = None,
     ) -> None:
         self._fields = tuple(fields)
+        self._sample_size = sample_size
         self._width = width or _get_terminal_content_width()
         self._folding_enabled: bool = (
             folding_enabled
@@ -108,9 +113,16 @@ class FoldedTablePrinter(Printer[t.Iterable[t.Any]]):
         :param data: an iterable of data objects.
         :param stream: an optional IO stream to write to. Defaults to stdout.
         """
-        echo = functools.partial(click.echo, file=stream)
-
-        table = self._fold_table(RowTable.from_data(self._fields, data))
+        with buffered_echo(stream) as echo:
+            self._echo_table(echo, data)
+
+    def _echo_table(self, echo: BufferedEcho, data: t.Iterable[t.Any]) -> None:
+        iterator = iter(data)
+        table = self._fold_table(
+            RowTable.from_data(
+                self._fields, itertools.islice(iterator, self._sample_size)
+            )
+        )
         col_widths = table.calculate_column_widths()
 
         # if folded, print a leading separator line
@@ -129,22 +141,35 @@ class FoldedTablePrinter(Printer[t.Iterable[t.Any]]):
             )
         )
 
-        for row in table.content_rows[:-1]:
-            echo(row.serialize(col_widths))
-            if table.folded:
+        # when streaming, any data beyond the sample is printed as it arrives
+        rows = itertools.chain(
+            table.content_rows, self._stream_rows(table, col_widths, iterator)
+        )
+        for idx, row in enumerate(rows):
+            if idx > 0 and table.folded:
                 echo(
                     _separator_line(
                         col_widths,
                         row_type=SeparatorRowType.box_row_separator,
                     )
                 )
-        # it is possible for a table to be empty, so check before attempting to
-        # serialize the last row
-        if table.content_rows:
-            echo(table.content_rows[-1].serialize(col_widths))
+            echo(row.serialize(col_widths))
         if table.folded:
             echo(_separator_line(col_widths, row_type=SeparatorRowType.box_bottom))
 
+    def _stream_rows(
+        self, table: RowTable, col_widths: tuple[int, ...], data: t.Iterator[t.Any]
+    ) -> t.Iterator[Row]:
+        """
+        Lay out rows of data to match an existing table, folding them in the same
+        way and truncating them to the table's column widths.
+        """
+        for data_obj in data:
+            row = Row.from_source_data(self._fields, data_obj)
+            if table.folded:
+                row = row.fold(len(table.header_row.grid))
+            yield row.truncate(col_widths)
+
     def _fold_table(self, table: RowTable) -> RowTable:
         if not self._folding_enabled:
             return table
@@ -260,6 +285,18 @@ class Row:
             )
         return Row(tuple(self._split_level(self.grid[0], n)))
 
+    def truncate(self, col_widths: tuple[int, ...]) -> Row:
+        """Truncate all elements to fit the given column widths. Produces a new Row."""
+        return Row(
+            tuple(
+                tuple(
+                    truncate_cell(element, col_widths[idx])
+                    for idx, element in enumerate(subrow)
+                )
+                for subrow in self.grid
+            )
+        )
+
     def _split_level(
         self, level: tuple[str, ...], modulus: int
     ) -> t.Iterator[tuple[str, ...]]:
@@ -8,6 +8,7 @@ import globus_sdk
 
 from globus_cli.types import JsonValue
 
+from ..buffered_output import buffered_echo
 from .base import Printer
 
 DataObject = t.Union[JsonValue, globus_sdk.GlobusHTTPResponse]
@@ -36,3 +37,23 @@ class JsonPrinter(Printer[DataObject]):
         res = JsonPrinter.jmespath_preprocess(data)
         res = json.dumps(res, indent=2, sort_keys=self._sort_keys)
         click.echo(res, file=stream)
+
+    def echo_items(
+        self, items: t.Iterable[JsonValue], stream: t.IO[str] | None = None
+    ) -> None:
+        """
+        Print an iterable of data objects as a json array, writing each item as
+        soon as it is produced.
+
+        The output is identical to that of ``echo`` on the equivalent list.
+
+        :param items: the data objects to print
+        :param stream: an optional IO stream to write to. Defaults to stdout.
+        """
+        with buffered_echo(stream) as echo:
+            opener = "["
+            for item in items:
+                rendered = json.dumps(item, indent=2, sort_keys=self._sort_keys)
+                echo(opener + "\n  " + rendered.replace("\n", "\n  "), nl=False)
+                opener = ","
+            echo("[]" if opener == "[" else "\n]")
@@ -5,11 +5,11 @@ import shutil
 import typing as t
 from textwrap import TextWrapper
 
-import click
 import globus_sdk
 
 from globus_cli.types import JsonValue
 
+from ..buffered_output import BufferedEcho, buffered_echo
 from ..field import Field
 from .base import Printer
 
@@ -43,9 +43,13 @@ class RecordPrinter(Printer[DataObject]):
         )
 
     def echo(self, data: DataObject, stream: t.IO[str] | None = None) -> None:
+        with buffered_echo(stream) as echo:
+            self.echo_record(echo, data)
+
+    def echo_record(self, echo: BufferedEcho, data: DataObject) -> None:
+        """Print a record through an existing ``BufferedEcho``."""
         for field in self._fields:
-            item = self._format_item(data, field)
-            click.echo(item, file=stream)
+            echo(self._format_item(data, field))
 
     def _format_item(self, data: DataObject, field: Field) -> str:
         """Format a single key-value pair into a string."""
@@ -119,13 +123,14 @@ class RecordListPrinter(Printer[t.Iterable[DataObject]]):
         data: t.Iterable[DataObject],
         stream: t.IO[str] | None = None,
     ) -> None:
-        prepend_newline = False
-        for item in data:
-            if prepend_newline:
-                click.echo("", file=stream)
-            prepend_newline = True
-
-            self._record_printer.echo(item, stream)
+        with buffered_echo(stream) as echo:
+            prepend_newline = False
+            for item in data:
+                if prepend_newline:
+                    echo("")
+                prepend_newline = True
+
+                self._record_printer.echo_record(echo, item)
 
 
 def _get_terminal_content_width() -> int:
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import functools
+import itertools
 import typing as t
 
-import click
-
+from ..buffered_output import BufferedEcho, buffered_echo
 from ..field import Field
-from .base import Printer
+from .base import Printer, truncate_cell
 
 
 class TablePrinter(Printer[t.Iterable[t.Any]]):
@@ -19,13 +19,21 @@ class TablePrinter(Printer[t.Iterable[t.Any]]):
 
     :param fields: a list of Fields with load and render instructions; one per column.
     :param print_headers: if False, omit the header row & separator row.
+    :param sample_size: if given, stream the table: column widths are computed from
+        only the first ``sample_size`` rows, and later rows are printed as they
+        arrive, with any overlong cells truncated to fit.
     """
 
     def __init__(
-        self, fields: t.Iterable[Field], *, print_headers: bool = True
+        self,
+        fields: t.Iterable[Field],
+        *,
+        print_headers: bool = True,
+        sample_size: int | None = None,
     ) -> None:
         self._fields = tuple(fields)
         self._print_headers = print_headers
+        self._sample_size = sample_size
 
     def echo(self, data: t.Iterable[t.Any], stream: t.IO[str] | None = None) -> None:
         """
@@ -34,10 +42,15 @@ class TablePrinter(Printer[t.Iterable[t.Any]]):
         :param data: an iterable of data objects.
         :param stream: an optional IO stream to write to. Defaults to stdout.
         """
-        echo = functools.partial(click.echo, file=stream)
+        with buffered_echo(stream) as echo:
+            self._echo_table(echo, data)
 
+    def _echo_table(self, echo: BufferedEcho, data: t.Iterable[t.Any]) -> None:
+        iterator = iter(data)
         try:
-            table = DataTable.from_data(self._fields, data)
+            table = DataTable.from_data(
+                self._fields, itertools.islice(iterator, self._sample_size)
+            )
 
             if self._print_headers:
                 echo(self._serialize_row(table, self._headers))
@@ -46,6 +59,16 @@ class TablePrinter(Printer[t.Iterable[t.Any]]):
             for y in range(table.num_rows):
                 values = [table[x, y] for x in range(table.num_columns)]
                 echo(self._serialize_row(table, values))
+
+            # when streaming, any data beyond the sample is printed as it arrives
+            for data_obj in iterator:
+                values = [
+                    truncate_cell(
+                        field.serialize(data_obj), self._column_width(table, x)
+                    )
+                    for x, field in enumerate(self._fields)
+                ]
+                echo(self._serialize_row(table, values))
         except EmptyTableError:
             if self._print_headers:
                 header_table = DataTable((self._headers,))
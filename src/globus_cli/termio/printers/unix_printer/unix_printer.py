@@ -7,6 +7,7 @@ import globus_sdk
 
 from globus_cli.types import JsonValue
 
+from ...buffered_output import buffered_echo
 from ..base import Printer
 from ._formatter import UnixFormattingError, emit_any_value
 
@@ -22,11 +23,24 @@ class UnixPrinter(Printer[DataObject]):
     """
 
     def echo(self, data: DataObject, stream: t.IO[str] | None = None) -> None:
-        res = UnixPrinter.jmespath_preprocess(data)
+        self._emit(UnixPrinter.jmespath_preprocess(data), stream)
 
+    def echo_items(
+        self, items: t.Iterable[JsonValue], stream: t.IO[str] | None = None
+    ) -> None:
+        """
+        Print an iterable of data objects as though it were a list.
+
+        UNIX formatting of a list depends on all of its elements, so the items are
+        collected before printing.
+        """
+        self._emit(list(items), stream)
+
+    def _emit(self, res: t.Any, stream: t.IO[str] | None) -> None:
         try:
-            for line in emit_any_value(res):
-                click.echo(line, file=stream)
+            with buffered_echo(stream) as echo:
+                for line in emit_any_value(res):
+                    echo(line)
 
         # Attr errors indicate that we got data which cannot be unix formatted
         # likely a scalar + non-scalar in an array, though there may be other cases
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import shutil
+import time
+
+import click
+
+from globus_cli.profiling import PhaseTiming, Profile, RequestTiming
+
+_BORDER_COLOR = "blue"
+_FILL_COLOR = "yellow"
+_REQUEST_COLUMNS = ("connect", "tls", "wait", "download", "json", "total")
+
+
+def render_profile_onscreen(profile: Profile) -> None:
+    """
+    Show the phases of an invocation, and its HTTP requests, on stderr.
+
+    All times are in milliseconds. Phases may overlap: for example, the requests
+    made while validating logins are included in that phase.
+    """
+    end = time.perf_counter()
+    phases = sorted(profile.phases, key=lambda phase: phase.start)
+    start = min([profile.start] + [phase.start for phase in phases])
+    phases.append(PhaseTiming("total", start, end - start))
+
+    term_width = shutil.get_terminal_size((80, 20)).columns
+    use_width = term_width - 4
+
+    click.echo("Profile Timings (ms)", err=True)
+    _echo_border(use_width)
+    _echo_phases(phases, use_width)
+    _echo_border(use_width)
+
+    if profile.requests:
+        click.echo("HTTP Requests (ms)", err=True)
+        _echo_border(use_width)
+        header = " ".join(f"{name:>8}" for name in _REQUEST_COLUMNS)
+        _echo_row(f"{header} request", use_width)
+        for request in sorted(profile.requests, key=lambda r: r.start):
+            _echo_row(_format_request(request), use_width)
+        _echo_border(use_width)
+
+
+def _echo_phases(phases: list[PhaseTiming], use_width: int) -> None:
+    # offsets are from the start of the first phase, and bars are scaled to the
+    # longest phase, which is always the total
+    first_start = phases[0].start
+    offsets = [_ms(phase.start - first_start) for phase in phases]
+    durations = [_ms(phase.duration) for phase in phases]
+    name_width = max(len(phase.name) for phase in phases) + 1
+    offset_width = max(len(offset) for offset in offsets)
+    duration_width = max(len(duration) for duration in durations)
+    items = [
+        (
+            f"{phase.name} ",
+            f" {offset:>{offset_width}} +{duration:>{duration_width}} ",
+            phase.duration,
+        )
+        for phase, offset, duration in zip(phases, offsets, durations)
+    ]
+    times_width = offset_width + duration_width + 4
+    bar_space = max(use_width - name_width - times_width, 1)
+    factor = max(phase.duration for phase in phases) or 1.0
+
+    for name, times, duration in items:
+        bar = "#" * max(int(bar_space * duration / factor), 1)
+        _echo_row(
+            name.ljust(name_width, ".") + times + click.style(bar, fg=_FILL_COLOR),
+            use_width,
+        )
+
+
+def _format_request(request: RequestTiming) -> str:
+    durations = (
+        request.connect,
+        request.tls,
+        request.wait,
+        request.download,
+        request.json_parse,
+        request.duration,
+    )
+    columns = " ".join(f"{_ms(duration):>8}" for duration in durations)
+    status = request.status if request.status is not None else "ERR"
+    return f"{columns} {request.method} {status} {request.url}"
+
+
+def _echo_border(use_width: int) -> None:
+    click.echo(click.style(f"+{'-' * (use_width + 2)}+", fg=_BORDER_COLOR), err=True)
+
+
+def _echo_row(msg: str, use_width: int) -> None:
+    vborder = click.style("|", fg=_BORDER_COLOR)
+    style_char_length = len(msg) - len(click.unstyle(msg))
+    msg = msg.ljust(use_width + style_char_length, " ")
+    click.echo(f"{vborder} {msg} {vborder}", err=True)
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.1f}"
@@ -164,17 +164,38 @@ class PagingWrapper:
             yielded += 1
 
     @property
-    def json_converter(
-        self,
-    ) -> t.Callable[[t.Iterator[t.Any]], dict[str, list[t.Any]]]:
+    def json_converter(self) -> IterableJsonConverter:
         if self.json_conversion_key is None:
             raise NotImplementedError("does not support json_converter")
-        key: str = self.json_conversion_key
+        return IterableJsonConverter(self.json_conversion_key)
+
+
+class IterableJsonConverter:
+    """
+    A ``json_converter`` which collects an iterable of items into a document of the
+    form ``{key: [item, ...]}``.
+
+    Because the shape of the resulting document is known ahead of time, printers
+    may use ``iter_items`` to handle the items one at a time instead of collecting
+    them all into a list first.
+
+    :param key: the key under which the items are collected
+    :param unwrap_responses: if True, items which are responses are converted to
+        their ``data``
+    """
+
+    def __init__(self, key: str, *, unwrap_responses: bool = False) -> None:
+        self.key = key
+        self.unwrap_responses = unwrap_responses
 
-        def converter(it: t.Iterator[t.Any]) -> dict[str, list[t.Any]]:
-            return {key: list(it)}
+    def iter_items(self, iterable: t.Iterable[t.Any]) -> t.Iterator[t.Any]:
+        for item in iterable:
+            if self.unwrap_responses:
+                item = getattr(item, "data", item)
+            yield item
 
-        return converter
+    def __call__(self, iterable: t.Iterable[t.Any]) -> dict[str, list[t.Any]]:
+        return {self.key: list(self.iter_items(iterable))}
 
 
 def shlex_process_stream(
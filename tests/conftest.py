@@ -19,7 +19,9 @@ from globus_sdk.testing import register_response_set
 from globus_sdk.token_storage.legacy import SQLiteAdapter
 from ruamel.yaml import YAML
 
-import globus_cli
+import globus_cli._warnings
+import globus_cli.local_cache
+import globus_cli.login_manager.token_refresh
 from globus_cli.login_manager.scopes import CURRENT_SCOPE_CONTRACT_VERSION
 
 yaml = YAML()
@@ -195,6 +197,27 @@ def patch_tokenstorage(monkeypatch, test_token_storage):
     )
 
 
+@pytest.fixture(autouse=True)
+def isolated_local_cache(monkeypatch, tmp_path):
+    """Put an empty local cache in place for each test."""
+    cache_filename = str(tmp_path / "cache.db")
+    monkeypatch.setattr(
+        globus_cli.local_cache, "_get_cache_filename", lambda: cache_filename
+    )
+    yield cache_filename
+    globus_cli.local_cache.close_connections()
+
+
+@pytest.fixture(autouse=True)
+def isolated_lock_dir(monkeypatch, tmp_path):
+    """Keep lock files created by tests out of the real CLI data dir."""
+    lock_dir = tmp_path / "locks"
+    lock_dir.mkdir()
+    monkeypatch.setattr(
+        globus_cli.login_manager.token_refresh, "_get_lock_dir", lambda: str(lock_dir)
+    )
+
+
 @pytest.fixture
 def add_gcs_login(test_token_storage):
     def func(gcs_id):
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import json
 import random
 import re
+import sys
 import typing as t
 import urllib.parse
 import uuid
 
 import pytest
+import responses
 from globus_sdk.testing import RegisteredResponse, get_last_request
 
 
@@ -257,3 +260,47 @@ def test_search_sends_normalized_case_entity_type_param(
     assert "filter_entity_type" in parsed_qs
     sent_filter_entity_type = parsed_qs["filter_entity_type"]
     assert sent_filter_entity_type == [normalized_entity_type]
+
+
+def test_search_output_is_written_before_the_next_page_is_fetched(run_line):
+    def make_page(names, has_next_page):
+        return {
+            "DATA": [
+                _make_mapped_collection_search_result(
+                    str(uuid.uuid4()),
+                    str(uuid.uuid4()),
+                    name,
+                    "globus@globus.org",
+                    "a0bc1.23de.data.globus.org",
+                    f"m-{name}.a0bc1.23de.data.globus.org",
+                )
+                for name in names
+            ],
+            "DATA_TYPE": "endpoint_list",
+            "has_next_page": has_next_page,
+            "limit": 2,
+            "offset": 0,
+        }
+
+    pages = [make_page(["foo1", "foo2"], True), make_page(["foo3"], False)]
+    output_before_page = []
+
+    def callback(request):
+        # the output written so far, to a stream which is not a terminal
+        sys.stdout.flush()
+        output_before_page.append(sys.stdout.buffer.getvalue().decode())
+        return (200, {}, json.dumps(pages[len(output_before_page) - 1]))
+
+    responses.add_callback(
+        responses.GET,
+        "https://transfer.api.globus.org/v0.10/endpoint_search",
+        callback=callback,
+    )
+
+    # a per-item projection is printed as the items arrive; the next item is
+    # fetched before each item is printed
+    result = run_line(
+        ["globus", "endpoint", "search", "foo", "--jq", "DATA[*].display_name"]
+    )
+    assert output_before_page == ["", '[\n  "foo1"']
+    assert json.loads(result.stdout) == ["foo1", "foo2", "foo3"]
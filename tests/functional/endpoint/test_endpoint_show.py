@@ -1,6 +1,7 @@
 import uuid
 
 import pytest
+import responses
 from globus_sdk.testing import RegisteredResponse, load_response_set
 
 
@@ -130,3 +131,23 @@ def test_show_on_gcsv5_collection_skip_check(run_line):
     result = run_line(f"globus endpoint show --skip-endpoint-type-check {epid}")
     assert "Display Name:" in result.output
     assert epid in result.output
+
+
+def test_show_fetches_the_endpoint_once_per_invocation(run_line):
+    meta = load_response_set("cli.endpoint_operations").metadata
+    epid = meta["endpoint_id"]
+
+    def count_gets():
+        return sum(
+            1
+            for call in responses.calls
+            if call.request.url.endswith(f"/endpoint/{epid}")
+        )
+
+    run_line(f"globus endpoint show {epid}")
+    assert count_gets() == 1
+
+    # the type check is served from the local cache, but the displayed document
+    # is always fetched
+    run_line(f"globus endpoint show {epid}")
+    assert count_gets() == 2
@@ -4,6 +4,7 @@ invalidated and are treated as invalid by the services
 """
 
 import uuid
+from unittest import mock
 
 import pytest
 from globus_sdk.testing import RegisteredResponse
@@ -124,3 +125,26 @@ def test_unauthorized_auth_call_with_client_creds(
         assert bad_client_secret_message not in result.stderr
     else:
         assert bad_client_secret_message in result.stderr
+
+
+def test_unauthorized_error_clears_cached_token_validation(
+    run_line, disable_login_manager_validate_token
+):
+    import globus_cli.login_manager
+
+    validate = mock.Mock(return_value=True)
+    disable_login_manager_validate_token.setattr(
+        globus_cli.login_manager.LoginManager, "_validate_token", validate
+    )
+    RegisteredResponse(
+        service="auth",
+        path="/v2/api/identities",
+        status=401,
+        json={"code": "UNAUTHORIZED", "message": "foo bar"},
+    ).add()
+
+    run_line("globus get-identities foo@globusid.org", assert_exit_code=1)
+    assert validate.call_count == 1
+    # the failure invalidated the cached validation, so it is checked again
+    run_line("globus get-identities foo@globusid.org", assert_exit_code=1)
+    assert validate.call_count == 2
@@ -1,8 +1,15 @@
 import json
 import uuid
 
+import responses
 from globus_sdk.testing import RegisteredResponse, load_response_set
 
+from globus_cli.local_index import BookmarkIndex
+
+
+def _bookmark_list_calls():
+    return [c for c in responses.calls if c.request.url.endswith("/bookmark_list")]
+
 
 def test_bookmark_create(run_line, go_ep1_id):
     """
@@ -93,6 +100,57 @@ def test_bookmark_delete_by_name(run_line):
     assert "deleted successfully" in result.output
 
 
+def test_bookmark_names_are_resolved_from_the_index(run_line, go_ep1_id):
+    meta = load_response_set("cli.bookmark_operations").metadata
+    bookmark_name = meta["bookmark_name"]
+
+    # the first lookup by name lists all bookmarks, and indexes them
+    run_line(f'globus bookmark show "{bookmark_name}"')
+    assert len(_bookmark_list_calls()) == 1
+
+    responses.calls.reset()
+    result = run_line(f'globus bookmark show "{bookmark_name}"')
+    assert f"{go_ep1_id}:/share/\n" == result.output
+    assert _bookmark_list_calls() == []
+    assert len(responses.calls) == 1
+
+
+def test_stale_bookmark_index_entries_are_refreshed(run_line):
+    meta = load_response_set("cli.bookmark_operations").metadata
+    # the indexed bookmark has since been renamed to "sharebm"
+    BookmarkIndex().record(
+        {
+            "id": meta["bookmark_id"],
+            "name": "stalebm",
+            "endpoint_id": str(uuid.uuid4()),
+            "path": "/",
+        }
+    )
+
+    result = run_line('globus bookmark show "stalebm"', assert_exit_code=1)
+    assert 'No bookmark found for "stalebm"' in result.stderr
+    assert len(_bookmark_list_calls()) == 1
+    assert BookmarkIndex().get("stalebm") is None
+    assert BookmarkIndex().get("sharebm").id == meta["bookmark_id"]
+
+
+def test_bookmark_commands_update_the_index(run_line, go_ep1_id):
+    meta = load_response_set("cli.bookmark_operations").metadata
+    bookmark_id = meta["bookmark_id"]
+    index = BookmarkIndex()
+
+    run_line(f"globus bookmark create {go_ep1_id}:/share/ sharebm")
+    assert index.get("sharebm").id == bookmark_id
+
+    run_line(f"globus bookmark rename sharebm {meta['bookmark_name_after_update']}")
+    assert index.get("sharebm") is None
+    assert index.get(meta["bookmark_name_after_update"]).id == bookmark_id
+    assert _bookmark_list_calls() == []
+
+    run_line(f"globus bookmark delete {bookmark_id}")
+    assert index.entries() == []
+
+
 def test_bookmark_list(run_line):
     meta = load_response_set("cli.bookmark_list").metadata
     bookmarks = meta["bookmarks"]
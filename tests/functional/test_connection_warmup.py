@@ -0,0 +1,36 @@
+from unittest import mock
+
+import pytest
+from globus_sdk.testing import load_response_set
+
+
+@pytest.fixture
+def mock_warm_connections():
+    with mock.patch("globus_cli.login_manager.connection_pool.warm_connections") as m:
+        yield m
+
+
+def test_warm_up_starts_for_required_services(
+    run_line, monkeypatch, mock_warm_connections
+):
+    monkeypatch.setenv("GLOBUS_CLI_WARM_CONNECTIONS", "1")
+    meta = load_response_set("cli.bookmark_operations").metadata
+
+    run_line(f"globus bookmark show {meta['bookmark_id']}")
+    mock_warm_connections.assert_called_once_with(("transfer",))
+
+
+def test_warm_up_is_opt_in(run_line, mock_warm_connections):
+    meta = load_response_set("cli.bookmark_operations").metadata
+
+    run_line(f"globus bookmark show {meta['bookmark_id']}")
+    mock_warm_connections.assert_not_called()
+
+
+def test_no_warm_up_for_commands_without_logins(
+    run_line, monkeypatch, mock_warm_connections
+):
+    monkeypatch.setenv("GLOBUS_CLI_WARM_CONNECTIONS", "1")
+
+    run_line("globus version")
+    mock_warm_connections.assert_not_called()
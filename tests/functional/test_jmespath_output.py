@@ -1,5 +1,6 @@
 import json
 
+import pytest
 from globus_sdk.testing import load_response_set
 
 
@@ -65,3 +66,29 @@ def test_jmespath_invalid_expression_error(run_line):
         "globus endpoint search 'Tutorial' --jmespath '{}'", assert_exit_code=1
     )
     assert "ParseError:" in result.stderr
+
+
+@pytest.mark.parametrize("output_format", ("json", "unix"))
+@pytest.mark.parametrize(
+    "expression",
+    ("DATA[*].display_name", "DATA[?contains(display_name, 'ep2')].id", "DATA[*]"),
+)
+def test_jmespath_on_listing_matches_collected_output(
+    run_line, output_format, expression
+):
+    """
+    Projections over a listing are evaluated item-by-item; confirm that the results
+    match applying the expression to the collected listing.
+    (`@.DATA` is not detected as a projection over DATA, so it is not evaluated
+    per-item.)
+    """
+    load_response_set("cli.endpoint_operations")
+    collected_result = run_line(
+        f"globus endpoint search 'Tutorial' -F{output_format} "
+        f'--jmespath "@.{expression}"'
+    )
+    result = run_line(
+        f"globus endpoint search 'Tutorial' -F{output_format} "
+        f'--jmespath "{expression}"'
+    )
+    assert result.output == collected_result.output
@@ -223,3 +223,57 @@ def test_permission_show(run_line, get_identities_mocker):
             ("Expiration Date", "2025-01-01T00:00:00+00:00"),
         ],
     )
+
+
+def _count_identity_lookups():
+    return sum(
+        1 for call in responses.calls if "/v2/api/identities" in call.request.url
+    )
+
+
+def test_permission_show_caches_identity_lookups(run_line, get_identities_mocker):
+    meta = load_response_set("cli.endpoint_acl_operations").metadata
+    user_id = meta["user_id"]
+    user_metadata = get_identities_mocker.configure_one(id=user_id).metadata
+    cmd = [
+        "globus",
+        "endpoint",
+        "permission",
+        "show",
+        meta["endpoint_id"],
+        meta["permission_id"],
+    ]
+
+    run_line(cmd, search_stdout=[("Shared With", user_metadata["username"])])
+    assert _count_identity_lookups() == 1
+
+    # the second invocation resolves the identity from the local cache
+    run_line(cmd, search_stdout=[("Shared With", user_metadata["username"])])
+    assert _count_identity_lookups() == 1
+
+
+def test_permission_create_caches_failed_username_lookup(
+    run_line, get_identities_mocker, monkeypatch
+):
+    meta = load_response_set("cli.endpoint_acl_operations").metadata
+    get_identities_mocker.configure_empty()
+    cmd = [
+        "globus",
+        "endpoint",
+        "permission",
+        "create",
+        f"{meta['endpoint_id']}:/",
+        "--permissions",
+        "rw",
+        "--identity",
+        "nosuchuser@example.com",
+    ]
+
+    run_line(cmd, assert_exit_code=2)
+    run_line(cmd, assert_exit_code=2)
+    assert _count_identity_lookups() == 1
+
+    # with caching disabled, the lookup is repeated
+    monkeypatch.setenv("GLOBUS_CLI_DISABLE_CACHE", "1")
+    run_line(cmd, assert_exit_code=2)
+    assert _count_identity_lookups() == 2
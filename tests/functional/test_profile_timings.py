@@ -0,0 +1,35 @@
+import pytest
+from globus_sdk.testing import load_response
+
+
+@pytest.mark.parametrize("use_env", (False, True))
+def test_profile_timings_shows_phases_and_requests(run_line, monkeypatch, use_env):
+    meta = load_response("transfer.get_endpoint").metadata
+    if use_env:
+        monkeypatch.setenv("GLOBUS_CLI_PROFILE_TIMINGS", "1")
+        line = f"globus endpoint show {meta['endpoint_id']}"
+    else:
+        line = f"globus endpoint show --profile-timings {meta['endpoint_id']}"
+
+    result = run_line(line)
+
+    assert "Profile Timings (ms)" not in result.stdout
+    for phase in (
+        "parse arguments",
+        "open token storage",
+        "validate logins",
+        "render output",
+        "total",
+    ):
+        assert phase in result.stderr
+    assert "HTTP Requests (ms)" in result.stderr
+    assert f"GET 200 transfer.api.globus.org/v0.10/endpoint/{meta['endpoint_id']}" in (
+        result.stderr
+    )
+
+
+def test_profile_timings_are_not_shown_by_default(run_line):
+    meta = load_response("transfer.get_endpoint").metadata
+
+    result = run_line(f"globus endpoint show {meta['endpoint_id']}")
+    assert "Profile Timings" not in result.stderr
@@ -0,0 +1,123 @@
+import json
+import sqlite3
+import threading
+from unittest import mock
+
+import pytest
+from globus_sdk.testing import load_response_set
+
+
+@pytest.fixture(autouse=True)
+def thread_safe_token_storage(monkeypatch, test_token_storage):
+    # outside of tests, each thread opens token storage for itself, but the
+    # in-memory storage used in tests is shared, so allow any thread to use it
+    connection = sqlite3.connect(":memory:", check_same_thread=False)
+    test_token_storage._connection.backup(connection)
+    monkeypatch.setattr(test_token_storage, "_connection", connection)
+
+
+@pytest.fixture
+def username(userinfo_mocker):
+    return userinfo_mocker.configure_unlinked().metadata["username"]
+
+
+def test_run_commands_from_stdin(run_line, username):
+    result = run_line("globus run", stdin="whoami\n\n# a comment\nglobus whoami\n")
+    assert result.stdout == f"{username}\n" * 2
+    assert result.stderr == ""
+
+
+def test_run_commands_from_file(run_line, username, tmp_path):
+    commands_file = tmp_path / "commands.txt"
+    commands_file.write_text("whoami\nwhoami\n")
+
+    result = run_line(f"globus run {commands_file}")
+    assert result.stdout == f"{username}\n" * 2
+
+
+def test_run_reports_failures(run_line, username):
+    result = run_line(
+        "globus run", stdin="not-a-command\nwhoami\nshell\n", assert_exit_code=1
+    )
+    assert result.stdout == f"{username}\n"
+    assert "No such command 'not-a-command'" in result.stderr
+    assert "'globus shell' cannot be run here." in result.stderr
+    assert result.stderr.endswith(
+        "2 of 3 commands failed:\n"
+        "  line 1 (exit status 2): not-a-command\n"
+        "  line 3 (exit status 2): shell\n"
+    )
+
+
+def test_run_nothing_if_a_line_cannot_be_parsed(run_line, username):
+    result = run_line("globus run", stdin="whoami\nwhoami 'oops\n", assert_exit_code=2)
+    assert result.stdout == ""
+    assert "Could not parse line 2" in result.stderr
+
+
+@pytest.mark.parametrize("jobs", (1, 3))
+def test_run_output_is_in_order(run_line, username, jobs):
+    meta = load_response_set("cli.bookmark_operations").metadata
+    bookmark_show = f"bookmark show {meta['bookmark_id']} -F json"
+    lines = [bookmark_show, "whoami"] * 3
+
+    result = run_line(f"globus run --jobs {jobs}", stdin="\n".join(lines))
+
+    expect_bookmark = run_line(f"globus {bookmark_show}").stdout
+    assert result.stdout == (expect_bookmark + f"{username}\n") * 3
+
+
+@pytest.mark.parametrize("jobs", (1, 3))
+def test_run_json_output(run_line, username, jobs):
+    result = run_line(
+        f"globus run -F json --jobs {jobs}",
+        stdin="whoami\nnot-a-command\nwhoami\n",
+        assert_exit_code=1,
+    )
+    data = json.loads(result.stdout)
+    assert [r["line_number"] for r in data] == [1, 2, 3]
+    assert [r["exit_code"] for r in data] == [0, 2, 0]
+    assert [r["stdout"] for r in data] == [f"{username}\n", "", f"{username}\n"]
+    assert "No such command 'not-a-command'" in data[1]["stderr"]
+
+
+def test_concurrent_commands_do_not_configure_logging(run_line, username):
+    configured_by = []
+
+    def record_thread(level):
+        configured_by.append(threading.current_thread())
+
+    with mock.patch(
+        "globus_cli.parsing.command_state._setup_logging", side_effect=record_thread
+    ):
+        run_line(
+            "globus run -v --jobs 2", stdin="-vvv whoami\n--debug whoami\nwhoami\n"
+        )
+    # only 'globus run' itself configured logging, not the commands it ran
+    assert configured_by
+    assert set(configured_by) == {threading.main_thread()}
+
+
+def test_concurrent_commands_have_their_own_profile_timings(run_line, username):
+    def phase_counts(jobs):
+        result = run_line(
+            f"globus run --jobs {jobs}", stdin="whoami --profile-timings\n" * 8
+        )
+        reports = result.stderr.split("Profile Timings (ms)")[1:]
+        assert len(reports) == 8
+        return [
+            {
+                phase: report.count(phase)
+                for phase in (
+                    "parse arguments",
+                    "open token storage",
+                    "validate logins",
+                    "render output",
+                )
+            }
+            for report in reports
+        ]
+
+    serial = phase_counts(1)
+    assert serial == [serial[0]] * 8
+    assert phase_counts(8) == serial
@@ -0,0 +1,183 @@
+import time
+import urllib.parse
+from unittest import mock
+
+import globus_sdk
+import pytest
+import responses
+from globus_sdk.testing import RegisteredResponse
+
+from globus_cli.login_manager import LoginManager
+
+
+@pytest.fixture
+def mock_refresh_tokens(monkeypatch):
+    refreshed = []
+    monkeypatch.setattr(
+        LoginManager, "refresh_tokens", lambda self, rs_name: refreshed.append(rs_name)
+    )
+    return refreshed
+
+
+def _set_expiration(storage, expires_in, *resource_servers):
+    for rs_name in resource_servers:
+        tokens = storage.get_token_data(rs_name)
+        tokens["expires_at_seconds"] = int(time.time()) + expires_in
+        storage.store(mock.Mock(by_resource_server={rs_name: tokens}))
+
+
+def test_session_refresh_refreshes_tokens_within_window(
+    run_line, test_token_storage, mock_refresh_tokens
+):
+    rs_names = list(test_token_storage.get_by_resource_server())
+    _set_expiration(test_token_storage, 3600, *rs_names)
+    _set_expiration(test_token_storage, 300, "transfer.api.globus.org")
+
+    result = run_line("globus session refresh")
+    assert result.output == "Refreshed tokens for transfer.api.globus.org\n"
+    assert mock_refresh_tokens == ["transfer.api.globus.org"]
+
+    mock_refresh_tokens.clear()
+    run_line("globus session refresh --window 2h")
+    assert set(mock_refresh_tokens) == set(test_token_storage.get_by_resource_server())
+
+
+def test_session_refresh_does_nothing_if_no_tokens_expire(
+    run_line, test_token_storage, mock_refresh_tokens
+):
+    result = run_line("globus session refresh --window 5s")
+    assert result.output == ""
+    assert mock_refresh_tokens == []
+
+
+def test_session_refresh_loop_waits_for_next_expiration(
+    run_line, test_token_storage, mock_refresh_tokens, mocksleep
+):
+    rs_names = list(test_token_storage.get_by_resource_server())
+    _set_expiration(test_token_storage, 7200, *rs_names)
+    _set_expiration(test_token_storage, 1800, "transfer.api.globus.org")
+
+    mocksleep.side_effect = [None, KeyboardInterrupt()]
+    run_line("globus session refresh --window 10m --loop", assert_exit_code=1)
+
+    assert mock_refresh_tokens == []
+    assert mocksleep.call_count == 2
+    # the first wait lasts until the transfer token is within the window
+    delay = mocksleep.call_args_list[0][0][0]
+    assert 1190 <= delay <= 1200
+
+
+def test_session_refresh_stores_new_tokens(run_line, test_token_storage):
+    rs_names = list(test_token_storage.get_by_resource_server())
+    _set_expiration(test_token_storage, 7200, *rs_names)
+    _set_expiration(test_token_storage, 60, "transfer.api.globus.org")
+    RegisteredResponse(
+        service="auth",
+        path="/v2/oauth2/token",
+        method="POST",
+        json={
+            "access_token": "newTransferAT",
+            "expires_in": 172800,
+            "resource_server": "transfer.api.globus.org",
+            "refresh_token": "transferRT",
+            "scope": "urn:globus:auth:scope:transfer.api.globus.org:all",
+            "token_type": "Bearer",
+            "other_tokens": [],
+        },
+    ).add()
+
+    run_line("globus session refresh")
+
+    token_requests = [
+        call.request for call in responses.calls if call.request.url.endswith("/token")
+    ]
+    assert len(token_requests) == 1
+    body = urllib.parse.parse_qs(token_requests[0].body)
+    assert body["grant_type"] == ["refresh_token"]
+    assert body["refresh_token"] == ["transferRT"]
+
+    tokens = test_token_storage.get_token_data("transfer.api.globus.org")
+    assert tokens["access_token"] == "newTransferAT"
+    assert tokens["expires_at_seconds"] > time.time() + 3600
+
+
+class _FakeClock:
+    """A replacement for the time module, whose sleeps advance the clock."""
+
+    def __init__(self, max_sleeps):
+        self.now = time.time()
+        self.sleeps = []
+        self._max_sleeps = max_sleeps
+
+    def time(self):
+        return self.now
+
+    def sleep(self, delay):
+        if len(self.sleeps) == self._max_sleeps:
+            raise KeyboardInterrupt
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    clock = _FakeClock(max_sleeps=72)
+    monkeypatch.setattr("globus_cli.commands.session.refresh.time", clock)
+    return clock
+
+
+def test_session_refresh_loop_with_window_longer_than_token_lifetime(
+    run_line, test_token_storage, fake_clock, monkeypatch
+):
+    lifetime = 48 * 3600
+    refreshed_at = {}
+
+    def fake_refresh_tokens(self, rs_name):
+        refreshed_at.setdefault(rs_name, []).append(fake_clock.now)
+        tokens = test_token_storage.get_token_data(rs_name)
+        tokens["expires_at_seconds"] = int(fake_clock.now) + lifetime
+        test_token_storage.store(mock.Mock(by_resource_server={rs_name: tokens}))
+
+    monkeypatch.setattr(LoginManager, "refresh_tokens", fake_refresh_tokens)
+    rs_names = list(test_token_storage.get_by_resource_server())
+    _set_expiration(test_token_storage, lifetime, *rs_names)
+
+    run_line("globus session refresh --window 2d --loop", assert_exit_code=1)
+
+    # the window is clamped to half of the lifetime, so over about three days each
+    # token is refreshed once a day, rather than on every iteration
+    assert len(fake_clock.sleeps) == 72
+    assert sum(fake_clock.sleeps) > lifetime
+    assert set(refreshed_at) == set(rs_names)
+    for times in refreshed_at.values():
+        assert len(times) <= 4
+        # expiration times are whole seconds
+        assert all(
+            later - earlier >= lifetime / 2 - 1
+            for earlier, later in zip(times, times[1:])
+        )
+
+
+def test_session_refresh_loop_backs_off_after_errors(
+    run_line, test_token_storage, fake_clock, monkeypatch
+):
+    attempts = []
+
+    def fake_refresh_tokens(self, rs_name):
+        attempts.append(fake_clock.now)
+        raise globus_sdk.GlobusError("network unreachable")
+
+    monkeypatch.setattr(LoginManager, "refresh_tokens", fake_refresh_tokens)
+    rs_names = list(test_token_storage.get_by_resource_server())
+    _set_expiration(test_token_storage, 7200, *rs_names)
+    _set_expiration(test_token_storage, 60, "transfer.api.globus.org")
+
+    result = run_line("globus session refresh --loop", assert_exit_code=1)
+
+    assert (
+        "Failed to refresh tokens for transfer.api.globus.org: network unreachable"
+        in result.stderr
+    )
+    # retries follow each failure by 1, 2, 4, ... minutes
+    intervals = [later - earlier for earlier, later in zip(attempts, attempts[1:])]
+    assert intervals[:4] == [60, 120, 240, 480]
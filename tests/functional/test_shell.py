@@ -0,0 +1,90 @@
+from unittest import mock
+
+import pytest
+from globus_sdk.testing import load_response_set
+
+from globus_cli.commands.shell import complete_shell_line
+from globus_cli.login_manager import LoginManager
+
+
+@pytest.fixture
+def count_login_managers(monkeypatch):
+    original_init = LoginManager.__init__
+    counter = mock.Mock()
+
+    def counting_init(self, **kwargs):
+        counter()
+        original_init(self, **kwargs)
+
+    monkeypatch.setattr(LoginManager, "__init__", counting_init)
+    return counter
+
+
+def test_shell_runs_each_line(run_line, userinfo_mocker):
+    meta = userinfo_mocker.configure_unlinked().metadata
+
+    result = run_line(
+        "globus shell", stdin="whoami\n\n# a comment\nglobus whoami\nexit\nwhoami\n"
+    )
+    assert result.output == f"{meta['username']}\n" * 2
+
+
+def test_shell_shares_one_login_manager(run_line, count_login_managers):
+    meta = load_response_set("cli.bookmark_operations").metadata
+    bookmark_id = meta["bookmark_id"]
+
+    run_line(
+        "globus shell",
+        stdin=f"bookmark show {bookmark_id}\nbookmark show {bookmark_id}\n",
+    )
+    assert count_login_managers.call_count == 1
+    assert not LoginManager.is_shared()
+
+
+def test_shell_continues_after_errors(run_line, userinfo_mocker):
+    meta = userinfo_mocker.configure_unlinked().metadata
+
+    result = run_line(
+        "globus shell",
+        stdin="not-a-command\nwhoami 'unterminated\nshell\nwhoami\n",
+        assert_exit_code=2,
+    )
+    assert result.stdout == f"{meta['username']}\n"
+    assert "No such command 'not-a-command'" in result.stderr
+    assert "Could not parse the line" in result.stderr
+    assert "'globus shell' cannot be run here" in result.stderr
+
+
+@pytest.mark.parametrize(
+    "line, name",
+    (
+        ("shell", "shell"),
+        ("-F json shell", "shell"),
+        ("--format json run commands.txt", "run"),
+        ("-v -- run", "run"),
+        ("daemon start --foreground", "daemon"),
+    ),
+)
+def test_shell_does_not_run_nesting_commands(run_line, line, name):
+    result = run_line("globus shell", stdin=f"{line}\n", assert_exit_code=2)
+    assert f"'globus {name}' cannot be run here." in result.stderr
+
+
+@pytest.mark.parametrize("line", ("-F json", "--jq shell"))
+def test_shell_reports_a_missing_command(run_line, line):
+    result = run_line("globus shell", stdin=f"{line}\n", assert_exit_code=2)
+    assert "cannot be run here" not in result.stderr
+    assert "Missing command." in result.stderr
+
+
+@pytest.mark.parametrize(
+    "line, expect",
+    (
+        ("task sh", ["show"]),
+        ("globus task sh", ["show"]),
+        ("bookmark ", ["create", "delete", "list", "rename", "show"]),
+        ("whoami --linked", ["--linked-identities"]),
+    ),
+)
+def test_shell_completion(line, expect):
+    assert complete_shell_line(line) == expect
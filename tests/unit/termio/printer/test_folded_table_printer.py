@@ -254,8 +254,9 @@ def test_folded_table_printer_bolds_headers(monkeypatch, folding_enabled):
 
     capture = []
 
-    def echo_capture(s, file=None):
-        capture.append(s)
+    def echo_capture(s, file=None, nl=True):
+        # output may be buffered, so capture it line by line
+        capture.extend(s.splitlines())
 
     monkeypatch.setattr("click.echo", echo_capture)
     printer.echo(data, None)
@@ -274,3 +275,67 @@ def test_folded_table_printer_bolds_headers(monkeypatch, folding_enabled):
         "---------+----------+---------",
         "1        | 2        | 3       ",
     ]
+
+
+@pytest.mark.parametrize("folding_enabled", (True, False))
+def test_folded_table_printer_streaming_output_matches_when_data_fits_in_sample(
+    folding_enabled,
+):
+    fields = (
+        Field("Column A", "a"),
+        Field("Column B", "b"),
+        Field("Column C", "c"),
+        Field("Column D", "d"),
+    )
+    data = [{"a": i, "b": i * 2, "c": "x" * i, "d": "y"} for i in range(5)]
+
+    with StringIO() as stream:
+        printer = FoldedTablePrinter(fields=fields, width=25)
+        printer._folding_enabled = folding_enabled
+        printer.echo(data, stream)
+        expected = stream.getvalue()
+    with StringIO() as stream:
+        printer = FoldedTablePrinter(fields=fields, width=25, sample_size=2)
+        printer._folding_enabled = folding_enabled
+        printer.echo(iter(data), stream)
+        printed_table = stream.getvalue()
+
+    assert printed_table == expected
+
+
+def test_folded_table_printer_streams_folded_rows_beyond_sample():
+    fields = (
+        Field("Column A", "a"),
+        Field("Column B", "b"),
+        Field("Column C", "c"),
+        Field("Column D", "d"),
+    )
+    data = (
+        {"a": 1, "b": 4, "c": 7, "d": "alpha"},
+        {"a": 2, "b": 5, "c": 8, "d": "a-very-long-value"},
+    )
+
+    printer = FoldedTablePrinter(fields=fields, width=25, sample_size=1)
+    printer._folding_enabled = True
+
+    with StringIO() as stream:
+        printer.echo(iter(data), stream)
+        printed_table = stream.getvalue()
+
+    # fmt: off
+    assert printed_table == (
+        "╒══════════╤══════════╕\n"
+        "│ Column A ╎ Column C │\n"
+        "├─ ─ ─ ─  ─┼─ ─ ─ ─  ─┤\n"
+        "│ Column B ╎ Column D │\n"
+        "╞══════════╪══════════╡\n"
+        "│ 1        ╎ 7        │\n"
+        "├─ ─ ─ ─  ─┼─ ─ ─ ─  ─┤\n"
+        "│ 4        ╎ alpha    │\n"
+        "├──────────┼──────────┤\n"
+        "│ 2        ╎ 8        │\n"
+        "├─ ─ ─ ─  ─┼─ ─ ─ ─  ─┤\n"
+        "│ 5        ╎ a-ver... │\n"
+        "└──────────┴──────────┘\n"
+    )
+    # fmt: on
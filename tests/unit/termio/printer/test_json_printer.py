@@ -1,6 +1,10 @@
 from io import StringIO
 
+import jmespath
+import pytest
+
 from globus_cli.termio.printers import JsonPrinter
+from globus_cli.termio.printers.base import PerItemExpression
 
 
 def test_json_printer_prints_with_sorted_keys(click_context):
@@ -41,3 +45,84 @@ def test_json_printer_prints_without_sorted_keys(click_context):
         "}\n"
     )
     # fmt: on
+
+
+@pytest.mark.parametrize(
+    "items",
+    (
+        [],
+        [1],
+        [{"b": 1, "a": [1, 2]}, "x", None],
+        [{"a": {"b": {"c": "multi\nline"}}}, {}],
+    ),
+)
+def test_json_printer_echo_items_matches_echo(click_context, items):
+    printer = JsonPrinter()
+
+    with StringIO() as stream:
+        with click_context():
+            printer.echo(items, stream)
+            expected = stream.getvalue()
+
+    with StringIO() as stream:
+        with click_context():
+            printer.echo_items(iter(items), stream)
+            printed_json = stream.getvalue()
+
+    assert printed_json == expected
+
+
+@pytest.mark.parametrize(
+    "expression",
+    (
+        "DATA[*]",
+        "DATA[*].a",
+        "DATA[*].[a, b]",
+        "DATA[*].c[*].d",
+        "DATA[?a > `1`]",
+        "DATA[?a > `1`].b",
+        "DATA[?c].c[0]",
+    ),
+)
+def test_per_item_expression_matches_full_search(expression):
+    data = [
+        {"a": 1, "b": "x"},
+        {"a": 2, "c": [{"d": 1}, {"e": 2}]},
+        {"a": 3, "b": None, "c": []},
+        {"b": "y"},
+    ]
+    compiled = jmespath.compile(expression)
+    per_item = PerItemExpression.from_compiled(compiled, "DATA")
+    assert per_item is not None
+
+    assert list(per_item.search_items(iter(data))) == compiled.search({"DATA": data})
+
+
+@pytest.mark.parametrize(
+    "expression",
+    (
+        "DATA",
+        "DATA[0]",
+        "DATA[].a",
+        "DATA[*].a | [0]",
+        "OTHER[*].a",
+        "length(DATA)",
+    ),
+)
+def test_per_item_expression_rejects_other_expressions(expression):
+    compiled = jmespath.compile(expression)
+    assert PerItemExpression.from_compiled(compiled, "DATA") is None
+
+
+def test_per_item_expression_consumes_items_lazily():
+    consumed = []
+
+    def gen():
+        for i in range(3):
+            consumed.append(i)
+            yield {"i": i}
+
+    per_item = PerItemExpression.from_compiled(jmespath.compile("DATA[*].i"), "DATA")
+    results = per_item.search_items(gen())
+    assert next(results) == 0
+    assert consumed == [0]
@@ -139,3 +139,57 @@ def test_data_table_raises_index_error_when_out_of_bounds_access():
 
     with pytest.raises(IndexError, match="Table row index out of range"):
         table[0, 2]
+
+
+def test_table_printer_streams_rows_beyond_sample():
+    fields = (Field("A", "a"), Field("B", "b"))
+    consumed = []
+
+    def gen():
+        for a, b in ((1, "x"), (2, "yy"), (3, "a-long-value"), (4, "zzz")):
+            consumed.append(a)
+            yield {"a": a, "b": b}
+
+    printer = TablePrinter(fields=fields, sample_size=2)
+
+    with StringIO() as stream:
+        printer.echo(gen(), stream)
+        printed_table = stream.getvalue()
+
+    # the column widths are set by the sample, so the long value is truncated
+    # fmt: off
+    assert printed_table == (
+        "A | B \n"
+        "- | --\n"
+        "1 | x \n"
+        "2 | yy\n"
+        "3 | a-\n"
+        "4 | zz\n"
+    )
+    # fmt: on
+    assert consumed == [1, 2, 3, 4]
+
+
+def test_table_printer_streaming_output_matches_when_data_fits_in_sample():
+    fields = (Field("Column A", "a"), Field("Column B", "b"))
+    data = [{"a": i, "b": "x" * i} for i in range(10)]
+
+    with StringIO() as stream:
+        TablePrinter(fields=fields).echo(data, stream)
+        expected = stream.getvalue()
+    with StringIO() as stream:
+        TablePrinter(fields=fields, sample_size=10).echo(iter(data), stream)
+        printed_table = stream.getvalue()
+
+    assert printed_table == expected
+
+
+def test_table_printer_streaming_truncates_with_ellipsis():
+    fields = (Field("Column A", "a"),)
+    data = iter([{"a": "short"}, {"a": "much longer value"}])
+
+    with StringIO() as stream:
+        TablePrinter(fields=fields, sample_size=1).echo(data, stream)
+        printed_table = stream.getvalue()
+
+    assert printed_table.splitlines()[-1] == "much ..."
@@ -0,0 +1,107 @@
+import threading
+from io import StringIO
+
+import click
+import pytest
+
+from globus_cli.termio import BufferedEcho, buffered_echo, flush_buffered_output
+
+
+class _TTYStringIO(StringIO):
+    def isatty(self):
+        return True
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _FakeClock()
+    monkeypatch.setattr("globus_cli.termio.buffered_output.time", clock)
+    return clock
+
+
+def test_buffered_echo_batches_writes_until_flush():
+    stream = StringIO()
+    echo = BufferedEcho(stream, max_delay=3600)
+
+    echo("foo")
+    echo("bar", nl=False)
+    assert stream.getvalue() == ""
+
+    echo.flush()
+    assert stream.getvalue() == "foo\nbar"
+
+
+def test_buffered_echo_flushes_on_size():
+    stream = StringIO()
+    echo = BufferedEcho(stream, max_size=8, max_delay=3600)
+
+    echo("abc")
+    assert stream.getvalue() == ""
+    echo("defg")
+    assert stream.getvalue() == "abc\ndefg\n"
+
+
+def test_buffered_echo_flushes_on_time(clock):
+    stream = StringIO()
+    echo = BufferedEcho(stream, max_delay=5)
+
+    clock.now += 4
+    echo("abc")
+    assert stream.getvalue() == ""
+    clock.now += 1
+    echo("def")
+    assert stream.getvalue() == "abc\ndef\n"
+
+
+def test_buffered_echo_writes_through_to_terminals():
+    stream = _TTYStringIO()
+    echo = BufferedEcho(stream, max_delay=3600)
+
+    echo("abc")
+    assert stream.getvalue() == "abc\n"
+
+
+def test_buffered_echo_context_manager_flushes_on_exit(clock):
+    stream = StringIO()
+    with buffered_echo(stream) as echo:
+        echo("abc")
+        assert stream.getvalue() == ""
+    assert stream.getvalue() == "abc\n"
+
+
+def test_buffered_echo_strips_styles_for_non_terminals():
+    stream = StringIO()
+    with buffered_echo(stream) as echo:
+        echo(click.style("abc", bold=True))
+    assert stream.getvalue() == "abc\n"
+
+
+def test_flush_buffered_output_flushes_only_the_current_thread(clock):
+    stream, other_stream = StringIO(), StringIO()
+    entered, done = threading.Event(), threading.Event()
+
+    def other_thread():
+        with buffered_echo(other_stream) as echo:
+            echo("def")
+            entered.set()
+            done.wait(timeout=5)
+
+    thread = threading.Thread(target=other_thread)
+    thread.start()
+    assert entered.wait(timeout=5)
+    with buffered_echo(stream) as echo:
+        echo("abc")
+        flush_buffered_output()
+        assert stream.getvalue() == "abc\n"
+        assert other_stream.getvalue() == ""
+    done.set()
+    thread.join()
+    assert other_stream.getvalue() == "def\n"
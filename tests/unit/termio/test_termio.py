@@ -100,3 +100,26 @@ def test_format_record_with_text_wrapping(capsys, monkeypatch):
 
     for i, line in enumerate(wrapped_description_lines[1:]):
         assert output_lines[i + 2].endswith(line)
+
+
+@pytest.mark.parametrize(
+    "key",
+    ("a", "a.b", "a.b.c", "null", "_x1", "a[0]", "[a, b]", "a.b[?c]", "@"),
+)
+@pytest.mark.parametrize(
+    "data",
+    (
+        {"a": {"b": {"c": 3}}, "null": 1, "_x1": 2},
+        {"a": {"b": 1}, "b": 2},
+        {"a": None},
+        {"a": [1]},
+        {"a": "str"},
+        [1],
+        "x",
+        None,
+    ),
+)
+def test_field_get_value_matches_jmespath(key, data):
+    import jmespath
+
+    assert Field("Name", key).get_value(data) == jmespath.search(key, data)
@@ -0,0 +1,82 @@
+import json
+
+import click
+import pytest
+from click.shell_completion import ShellComplete
+
+from globus_cli import command_manifest
+from globus_cli.commands import main
+from globus_cli.parsing.commands import GlobusCommandGroup
+
+
+def test_manifest_matches_live_tree():
+    with open(command_manifest.MANIFEST_FILENAME, encoding="utf-8") as f:
+        shipped = json.load(f)
+    assert shipped == command_manifest.build_manifest(main), (
+        "the command manifest is out of date; "
+        "regenerate it with 'python -m globus_cli.command_manifest'"
+    )
+
+
+def test_manifest_lists_subcommands_in_live_order():
+    with open(command_manifest.MANIFEST_FILENAME, encoding="utf-8") as f:
+        shipped = json.load(f)["tree"]
+
+    def check(entry, group, ctx):
+        assert list(entry["commands"]) == group.list_commands(ctx)
+        for name, subentry in entry["commands"].items():
+            if "commands" in subentry:
+                subgroup = group.get_command(ctx, name)
+                check(subentry, subgroup, click.Context(subgroup, parent=ctx))
+
+    check(shipped, main, click.Context(main, info_name="globus"))
+
+
+@pytest.fixture
+def lazy_loads(monkeypatch):
+    loaded = []
+    original = GlobusCommandGroup._lazy_load
+
+    def recording_lazy_load(self, ctx, cmd_name):
+        loaded.append(cmd_name)
+        return original(self, ctx, cmd_name)
+
+    monkeypatch.setattr(GlobusCommandGroup, "_lazy_load", recording_lazy_load)
+    return loaded
+
+
+def _complete(args, incomplete):
+    completer = ShellComplete(main, {}, "globus", "_GLOBUS_COMPLETE")
+    return [(c.value, c.help) for c in completer.get_completions(args, incomplete)]
+
+
+def test_completion_uses_manifest(lazy_loads):
+    completions = _complete(["endpoint"], "s")
+
+    assert ("show", "Display a detailed endpoint definition.") in completions
+    assert all(name.startswith("s") for name, _ in completions)
+    # only the group on the command line was loaded, not its subcommands
+    assert lazy_loads == ["endpoint"]
+
+
+def test_completion_without_manifest_matches(monkeypatch):
+    with_manifest = _complete(["gcs", "collection"], "")
+
+    monkeypatch.setattr(command_manifest, "load_manifest", lambda: None)
+    assert _complete(["gcs", "collection"], "") == with_manifest
+
+
+def test_manifest_is_not_used_for_other_trees():
+    @click.group(cls=GlobusCommandGroup, lazy_subcommands={"ls": ("ls", "ls_command")})
+    def other():
+        pass
+
+    ctx = click.Context(other, info_name="globus")
+    assert command_manifest.get_manifest_entry(ctx) is None
+
+
+def test_list_commands_without_manifest_matches(run_line, monkeypatch):
+    with_manifest = run_line("globus list-commands").output
+
+    monkeypatch.setattr(command_manifest, "load_manifest", lambda: None)
+    assert run_line("globus list-commands").output == with_manifest
@@ -0,0 +1,146 @@
+import http.server
+import logging
+import threading
+
+import pytest
+import requests
+import responses
+
+from globus_cli.login_manager import LoginManager
+from globus_cli.login_manager.connection_pool import (
+    PoolStats,
+    SharedConnectionPool,
+    adopt_warm_pool,
+    warm_connections,
+)
+
+
+class _KeepAliveHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address
+    base_url = f"http://{host}:{port}"
+    responses.add_passthru(base_url)
+    yield base_url
+    server.shutdown()
+    server.server_close()
+
+
+def _send(session, url):
+    # send the request as an SDK transport does, without environment settings
+    response = session.send(requests.Request("GET", url).prepare(), verify=True)
+    response.raise_for_status()
+
+
+def test_login_manager_clients_share_one_session():
+    manager = LoginManager()
+    transfer_client = manager.get_transfer_client()
+    auth_client = manager.get_auth_client()
+    groups_client = manager.get_groups_client()
+
+    session = transfer_client.transport.session
+    assert auth_client.transport.session is session
+    assert groups_client.transport.session is session
+    manager.close()
+
+
+def test_closing_a_client_leaves_the_shared_session_open(local_server):
+    pool = SharedConnectionPool()
+    first, second = pool.make_transport(), pool.make_transport()
+    first.close()
+
+    _send(second.session, local_server)
+    assert pool.stats()[0].requests == 1
+    pool.close()
+
+
+def test_connections_are_reused_across_transports(local_server):
+    pool = SharedConnectionPool()
+    for _ in range(3):
+        transport = pool.make_transport()
+        _send(transport.session, local_server)
+        transport.close()
+
+    host = local_server.partition("://")[2]
+    assert pool.stats() == [PoolStats(host, requests=3, connections=1)]
+    pool.close()
+
+
+def test_stats_include_evicted_hosts(local_server):
+    pool = SharedConnectionPool(max_hosts=1)
+    session = pool.make_transport().session
+    _send(session, local_server)
+    # a second host name for the same server evicts the first from the pool
+    other_url = local_server.replace("127.0.0.1", "localhost")
+    responses.add_passthru(other_url)
+    _send(session, other_url)
+
+    assert [(s.requests, s.connections) for s in pool.stats()] == [(1, 1), (1, 1)]
+    pool.close()
+
+
+def test_stats_are_logged_on_close_at_debug_level(local_server, caplog):
+    manager = LoginManager()
+    client = manager.get_transfer_client()
+    _send(client.transport.session, local_server)
+
+    with caplog.at_level(logging.DEBUG, logger="globus_cli"):
+        manager.close()
+
+    host = local_server.partition("://")[2]
+    assert (
+        f"connection pool stats for {host}: 1 request(s) over 1 connection(s)"
+        in caplog.text
+    )
+
+
+def test_opened_connection_is_used_by_the_next_request(local_server):
+    pool = SharedConnectionPool()
+    pool.open_connection(local_server)
+    _send(pool.make_transport().session, local_server)
+
+    host = local_server.partition("://")[2]
+    assert pool.stats() == [PoolStats(host, requests=1, connections=1)]
+    pool.close()
+
+
+def test_open_connection_failure_is_not_raised():
+    pool = SharedConnectionPool()
+    # nothing listens on port 9 (discard) of localhost in the test environment
+    pool.open_connection("http://127.0.0.1:9")
+    assert pool.stats()[0].connections == 1
+    pool.close()
+
+
+def test_login_manager_adopts_warmed_connections(local_server, monkeypatch):
+    monkeypatch.setenv("GLOBUS_SDK_SERVICE_URL_TRANSFER", local_server)
+    for thread in warm_connections(["transfer"]):
+        thread.join(timeout=5)
+
+    manager = LoginManager()
+    manager.get_transfer_client().get("/")
+
+    host = local_server.partition("://")[2]
+    assert manager._connection_pool.stats() == [
+        PoolStats(host, requests=1, connections=1)
+    ]
+    # the warmed pool is only adopted once
+    assert adopt_warm_pool() is None
+    manager.close()
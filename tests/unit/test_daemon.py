@@ -0,0 +1,183 @@
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+
+import pytest
+
+from globus_cli.daemon import client, protocol
+from globus_cli.daemon.server import Daemon
+
+
+@pytest.fixture
+def socket_path(tmp_path, monkeypatch):
+    socket_dir = tmp_path / "daemon"
+    socket_dir.mkdir(mode=0o700)
+    path = str(socket_dir / "daemon.sock")
+    monkeypatch.setenv("GLOBUS_CLI_DAEMON_SOCKET", path)
+    return path
+
+
+@pytest.fixture
+def running_daemon(socket_path, monkeypatch):
+    # pytest replaces stdin with an object which has no file descriptor
+    devnull = open(os.devnull)
+    monkeypatch.setattr(sys, "stdin", devnull)
+
+    daemon = Daemon(socket_path, idle_timeout=0)
+    daemon.bind()
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    yield daemon
+
+    daemon.stop()
+    thread.join(timeout=5)
+    devnull.close()
+    # reap any command processes
+    try:
+        while os.waitpid(-1, os.WNOHANG)[0]:
+            pass
+    except ChildProcessError:
+        pass
+
+
+def test_no_forwarding_without_a_daemon(socket_path):
+    assert client.forward_to_daemon(["globus", "version"]) is None
+
+
+def test_no_forwarding_to_a_stale_socket(socket_path):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(socket_path)
+    sock.close()
+
+    assert client.socket_is_stale(socket_path)
+    assert client.forward_to_daemon(["globus", "version"]) is None
+
+
+def test_forwarding_can_be_disabled(running_daemon, monkeypatch):
+    monkeypatch.setenv("GLOBUS_CLI_DAEMON", "0")
+    assert client.forward_to_daemon(["globus", "version"]) is None
+
+
+def test_command_runs_in_the_daemon(running_daemon, capfd):
+    exit_code = client.forward_to_daemon(["globus", "daemon", "status"])
+    assert exit_code == 0
+
+    out, _ = capfd.readouterr()
+    assert f"The CLI daemon is running (pid {os.getpid()})." in out
+
+
+def test_exit_code_is_returned(running_daemon, capfd):
+    assert client.forward_to_daemon(["globus", "not-a-command"]) == 2
+
+    _, err = capfd.readouterr()
+    assert "No such command 'not-a-command'" in err
+
+
+def test_command_runs_in_the_client_working_directory(
+    running_daemon, capfd, tmp_path, monkeypatch
+):
+    monkeypatch.chdir(tmp_path)
+    command = ["globus", "api", "transfer", "GET", "/", "--body-file"]
+
+    assert client.forward_to_daemon(command + ["missing.json"]) == 2
+    assert "'missing.json': No such file or directory" in capfd.readouterr()[1]
+
+    (tmp_path / "present.json").write_text("{}")
+    client.forward_to_daemon(command + ["present.json"])
+    assert "No such file or directory" not in capfd.readouterr()[1]
+
+
+def test_no_forwarding_when_the_socket_dir_is_not_private(running_daemon, socket_path):
+    os.chmod(os.path.dirname(socket_path), 0o755)
+    assert client.forward_to_daemon(["globus", "version"]) is None
+
+
+def test_no_forwarding_to_another_user(running_daemon, monkeypatch):
+    monkeypatch.setattr(protocol, "peer_uid", lambda sock: os.getuid() + 1)
+    assert client.forward_to_daemon(["globus", "version"]) is None
+
+
+def test_peer_uid_is_the_current_user():
+    left, right = socket.socketpair(socket.AF_UNIX)
+    with left, right:
+        assert protocol.peer_uid(left) in (os.getuid(), None)
+
+
+def test_only_needed_environment_variables_are_forwarded():
+    env = {
+        "GLOBUS_CLI_CLIENT_ID": "abc",
+        "HOME": "/home/user",
+        "LC_ALL": "C",
+        "COMP_WORDS": "globus ",
+        "AWS_SECRET_ACCESS_KEY": "hunter2",
+        "GITHUB_TOKEN": "hunter2",
+    }
+    assert protocol.forwarded_environment(env) == {
+        "GLOBUS_CLI_CLIENT_ID": "abc",
+        "HOME": "/home/user",
+        "LC_ALL": "C",
+        "COMP_WORDS": "globus ",
+    }
+
+
+def test_no_forwarding_when_globus_environment_differs(running_daemon, monkeypatch):
+    monkeypatch.setenv("GLOBUS_SDK_ENVIRONMENT", "sandbox")
+    assert client.forward_to_daemon(["globus", "version"]) is None
+
+
+def test_status_and_stop(running_daemon, socket_path):
+    status = client.request_status(socket_path)
+    assert status["pid"] == os.getpid()
+    assert status["identity"] == protocol.daemon_identity()
+
+    assert client.request_stop(socket_path)
+    assert running_daemon._stopping.wait(timeout=5)
+
+
+def test_a_stalled_client_does_not_block_others(running_daemon, socket_path):
+    # connect, but never send a request
+    with protocol.connect(socket_path, timeout=5):
+        start = time.monotonic()
+        assert client.request_status(socket_path) is not None
+        assert time.monotonic() - start < 2
+
+
+def test_daemon_commands_without_a_daemon(run_line, socket_path):
+    result = run_line("globus daemon status", assert_exit_code=1)
+    assert result.output == "The CLI daemon is not running.\n"
+
+    result = run_line("globus daemon stop")
+    assert result.output == "The CLI daemon is not running.\n"
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/stat"), reason="needs procfs")
+def test_commands_are_forked_by_a_single_threaded_process(running_daemon, socket_path):
+    # a command which waits to read its body from stdin, until the pipe is closed
+    read_fd, write_fd = os.pipe()
+    with protocol.connect(socket_path, timeout=5) as sock:
+        protocol.send_message(
+            sock,
+            {
+                "op": "run",
+                "argv": ["globus", "api", "transfer", "POST", "/", "--body-file", "-"],
+                "cwd": os.getcwd(),
+                "env": protocol.forwarded_environment(os.environ),
+                "identity": protocol.daemon_identity(),
+            },
+            fds=[read_fd, sys.stdout.fileno(), sys.stderr.fileno()],
+        )
+        os.close(read_fd)
+        reply, _ = protocol.recv_message(sock)
+        pid = reply["pid"]
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                parent_pid = int(f.read().rpartition(")")[2].split()[1])
+            assert parent_pid == running_daemon._fork_server.pid != os.getpid()
+            with open(f"/proc/{parent_pid}/status") as f:
+                assert "Threads:\t1\n" in f.read()
+        finally:
+            os.kill(pid, signal.SIGKILL)
+            os.close(write_fd)
@@ -0,0 +1,93 @@
+import uuid
+
+import globus_sdk
+import pytest
+import responses
+from globus_sdk.testing import load_response
+
+from globus_cli.endpointish import Endpointish, EntityType
+from globus_cli.services.transfer import CustomTransferClient, EndpointCache
+
+
+def _make_client(endpoint_cache=None):
+    return CustomTransferClient(
+        authorizer=globus_sdk.NullAuthorizer(),
+        app_name="test",
+        endpoint_cache=endpoint_cache,
+    )
+
+
+def _endpoint_gets(endpoint_id):
+    return [
+        call
+        for call in responses.calls
+        if call.request.method == "GET"
+        and call.request.url.endswith(f"/endpoint/{endpoint_id}")
+    ]
+
+
+@pytest.fixture
+def endpoint_id():
+    return load_response("transfer.get_endpoint").metadata["endpoint_id"]
+
+
+def test_clients_sharing_a_cache_fetch_an_endpoint_once(endpoint_id):
+    cache = EndpointCache()
+    first = _make_client(cache).get_endpoint(endpoint_id)
+    second = _make_client(cache).get_endpoint(endpoint_id.upper())
+
+    assert first is second
+    assert len(_endpoint_gets(endpoint_id)) == 1
+
+
+def test_get_endpoint_refetches_in_a_new_invocation(endpoint_id):
+    _make_client().get_endpoint(endpoint_id)
+    # documents which may be displayed are never served from the local cache
+    _make_client().get_endpoint(endpoint_id)
+
+    assert len(_endpoint_gets(endpoint_id)) == 2
+
+
+def test_endpoint_data_is_served_from_the_local_cache(endpoint_id):
+    data = _make_client().get_endpoint_data(endpoint_id)
+    assert _make_client().get_endpoint_data(endpoint_id) == data
+
+    assert len(_endpoint_gets(endpoint_id)) == 1
+
+
+def test_local_cache_can_be_disabled(endpoint_id, monkeypatch):
+    monkeypatch.setenv("GLOBUS_CLI_ENDPOINT_CACHE_TTL", "0")
+    client = _make_client()
+    client.get_endpoint_data(endpoint_id)
+    # the in-memory cache is still used
+    client.get_endpoint_data(endpoint_id)
+    _make_client().get_endpoint_data(endpoint_id)
+
+    assert len(_endpoint_gets(endpoint_id)) == 2
+
+
+def test_query_params_bypass_the_cache(endpoint_id):
+    client = _make_client()
+    client.get_endpoint(endpoint_id)
+    client.get_endpoint(endpoint_id, query_params={"fields": "id"})
+
+    assert len(_endpoint_gets(endpoint_id)) == 1
+    assert len(responses.calls) == 2
+
+
+def test_updating_an_endpoint_discards_the_cached_document(endpoint_id):
+    load_response("transfer.update_endpoint", case="default")
+    client = _make_client()
+    client.get_endpoint_data(endpoint_id)
+    client.update_endpoint(endpoint_id, {"display_name": "new name"})
+    _make_client().get_endpoint_data(endpoint_id)
+
+    assert len(_endpoint_gets(endpoint_id)) == 2
+
+
+def test_endpointish_uses_the_cached_document(endpoint_id):
+    Endpointish(endpoint_id, transfer_client=_make_client())
+    epish = Endpointish(uuid.UUID(endpoint_id), transfer_client=_make_client())
+
+    assert epish.entity_type is EntityType.GCSV4_HOST
+    assert len(_endpoint_gets(endpoint_id)) == 1
@@ -0,0 +1,83 @@
+import importlib
+import pkgutil
+import subprocess
+import sys
+
+import pytest
+
+# the exception handling package can only be imported after the parsing package
+import globus_cli.commands  # noqa: F401
+import globus_cli.exception_handling.hooks as hooks_package
+from globus_cli.exception_handling.hooks import _HOOK_INDEX, get_candidate_hooks
+from globus_cli.exception_handling.registry import DeclaredHook
+
+
+def _error_class_name(hook):
+    error_class = hook.error_class
+    return error_class if isinstance(error_class, str) else error_class.__name__
+
+
+@pytest.mark.parametrize("entry", _HOOK_INDEX, ids=lambda entry: entry.hook)
+def test_hook_index_matches_declared_error_classes(entry):
+    module = importlib.import_module(f"{hooks_package.__name__}.{entry.module}")
+    hook = getattr(module, entry.hook)
+
+    assert isinstance(hook, DeclaredHook)
+    assert _error_class_name(hook) == entry.error_class
+
+
+def test_every_hook_is_indexed():
+    indexed = {(entry.module, entry.hook) for entry in _HOOK_INDEX}
+    for module_info in pkgutil.iter_modules(hooks_package.__path__):
+        module = importlib.import_module(f"{hooks_package.__name__}.{module_info.name}")
+        for name, value in vars(module).items():
+            if isinstance(value, DeclaredHook) and value.hook_func.__module__ == (
+                module.__name__
+            ):
+                assert (module_info.name, name) in indexed
+
+
+def test_candidate_hooks_are_found_by_class_name():
+    # hooks are matched by the names of classes, and not the classes themselves
+    class GlobusError(Exception):
+        pass
+
+    class GlobusAPIError(GlobusError):
+        pass
+
+    class TransferAPIError(GlobusAPIError):
+        pass
+
+    assert [
+        hook.hook_func.__name__ for hook in get_candidate_hooks(TransferAPIError())
+    ] == [
+        "null_data_error_handler",
+        "json_error_handler",
+        "consent_required_hook",
+        "session_hook",
+        "transfer_unauthenticated_hook",
+        "transferapi_hook",
+        "globusapi_hook",
+        "globus_error_hook",
+    ]
+    assert list(get_candidate_hooks(ValueError())) == []
+
+
+def test_help_does_not_load_hooks():
+    # click exits from '--help' by raising an exception, which is passed to the
+    # exception handler
+    to_run = "; ".join(
+        [
+            "import sys",
+            "from globus_cli.commands import main",
+            "main.main(['bookmark', '--help'], standalone_mode=False)",
+            "hooks = [m for m in sys.modules if m.startswith("
+            "'globus_cli.exception_handling.hooks.')]",
+            "assert not hooks, hooks",
+            "assert 'requests' not in sys.modules",
+        ]
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", to_run], capture_output=True, text=True
+    )
+    assert proc.returncode == 0, proc.stderr
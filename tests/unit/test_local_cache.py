@@ -0,0 +1,131 @@
+import sqlite3
+from unittest import mock
+
+import pytest
+
+from globus_cli import local_cache
+from globus_cli.local_cache import LocalCache, clear_all_caches
+
+_MISSING = object()
+
+
+def test_local_cache_round_trip():
+    cache = LocalCache("test", ttl=60)
+    assert cache.get("foo") is None
+
+    cache.set("foo", {"a": [1, 2]})
+    assert cache.get("foo") == {"a": [1, 2]}
+    assert LocalCache("test", ttl=60).get("foo") == {"a": [1, 2]}
+
+
+def test_local_cache_distinguishes_null_values_from_misses():
+    cache = LocalCache("test", ttl=60)
+    cache.set("foo", None)
+
+    assert cache.get("foo", _MISSING) is None
+    assert cache.get("bar", _MISSING) is _MISSING
+    assert cache.get_many(["foo", "bar"]) == {"foo": None}
+
+
+def test_local_cache_namespaces_are_separate():
+    LocalCache("test1", ttl=60).set("foo", 1)
+    LocalCache("test2", ttl=60).set("foo", 2)
+
+    assert LocalCache("test1", ttl=60).get("foo") == 1
+    assert LocalCache("test2", ttl=60).get("foo") == 2
+
+    LocalCache("test1", ttl=60).clear()
+    assert LocalCache("test1", ttl=60).get("foo") is None
+    assert LocalCache("test2", ttl=60).get("foo") == 2
+
+
+def test_local_cache_entries_expire():
+    cache = LocalCache("test", ttl=60)
+    with mock.patch("time.time", return_value=1000.0):
+        cache.set("foo", 1)
+        cache.set("bar", 2, ttl=5)
+    with mock.patch("time.time", return_value=1010.0):
+        assert cache.get_many(["foo", "bar"]) == {"foo": 1}
+    with mock.patch("time.time", return_value=1100.0):
+        assert cache.get_many(["foo", "bar"]) == {}
+
+
+def test_local_cache_items_are_most_recent_first():
+    cache = LocalCache("test", ttl=60)
+    with mock.patch("time.time", return_value=1000.0):
+        cache.set("old", 1)
+        cache.set("expiring", 2, ttl=5)
+    with mock.patch("time.time", return_value=1001.0):
+        cache.set("new", 3)
+    LocalCache("other", ttl=60).set("elsewhere", 4)
+
+    with mock.patch("time.time", return_value=1010.0):
+        assert cache.items() == [("new", 3), ("old", 1)]
+
+
+def test_local_cache_evicts_oldest_entries():
+    cache = LocalCache("test", ttl=60, max_entries=2)
+    for i, key in enumerate(("a", "b", "c")):
+        with mock.patch("time.time", return_value=1000.0 + i):
+            cache.set(key, i)
+
+    with mock.patch("time.time", return_value=1010.0):
+        assert cache.get_many(["a", "b", "c"]) == {"b": 1, "c": 2}
+
+
+def test_local_cache_evicts_expired_entries_before_live_ones():
+    cache = LocalCache("test", ttl=60, max_entries=2)
+    with mock.patch("time.time", return_value=1000.0):
+        cache.set("a", 0)
+    with mock.patch("time.time", return_value=1001.0):
+        cache.set("expiring", 1, ttl=5)
+    with mock.patch("time.time", return_value=1010.0):
+        cache.set("c", 2)
+        assert cache.items() == [("c", 2), ("a", 0)]
+
+
+def test_local_cache_eviction_uses_the_age_index():
+    cache = LocalCache("test", ttl=60)
+    cache.set("a", 0)
+
+    plan = local_cache._get_connection().execute(
+        "EXPLAIN QUERY PLAN SELECT key FROM cache_entries WHERE namespace = ? "
+        "ORDER BY stored_at DESC LIMIT -1 OFFSET 1",
+        (cache.namespace,),
+    )
+    assert any("cache_entries_by_age" in row[-1] for row in plan)
+
+
+def test_local_cache_can_be_disabled(monkeypatch):
+    cache = LocalCache("test", ttl=60)
+    cache.set("foo", 1)
+
+    monkeypatch.setenv("GLOBUS_CLI_DISABLE_CACHE", "1")
+    assert cache.get("foo") is None
+    cache.set("bar", 2)
+
+    monkeypatch.delenv("GLOBUS_CLI_DISABLE_CACHE")
+    assert cache.get("foo") == 1
+    assert cache.get("bar") is None
+
+
+def test_clear_all_caches():
+    LocalCache("test1", ttl=60).set("foo", 1)
+    LocalCache("test2", ttl=60).set("foo", 2)
+
+    clear_all_caches()
+    assert LocalCache("test1", ttl=60).get("foo") is None
+    assert LocalCache("test2", ttl=60).get("foo") is None
+
+
+@pytest.mark.parametrize("method", ("get", "set", "delete"))
+def test_local_cache_errors_are_treated_as_misses(monkeypatch, method):
+    def broken_connection():
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr("globus_cli.local_cache._get_connection", broken_connection)
+    cache = LocalCache("test", ttl=60)
+    if method == "set":
+        cache.set("foo", 1)
+    else:
+        assert getattr(cache, method)("foo") is None
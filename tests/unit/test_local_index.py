@@ -0,0 +1,103 @@
+import pytest
+import responses
+from click.shell_completion import ShellComplete
+from globus_sdk.testing import load_response, load_response_set
+
+from globus_cli.commands import main
+from globus_cli.local_index import BookmarkIndex, EndpointIndex
+
+
+def _complete(args, incomplete):
+    completer = ShellComplete(main, {}, "globus", "_GLOBUS_COMPLETE")
+    return [
+        (item.value, item.help) for item in completer.get_completions(args, incomplete)
+    ]
+
+
+@pytest.fixture
+def endpoint_id():
+    return load_response("transfer.get_endpoint").metadata["endpoint_id"]
+
+
+def test_endpoint_index_records_names():
+    index = EndpointIndex()
+    index.record({"id": "AAAA", "display_name": None, "canonical_name": "u#ep"})
+    index.record({"id": "bbbb", "display_name": "Other"})
+    # documents without an ID are ignored
+    index.record({"display_name": "Nameless"})
+
+    assert [(ep.id, ep.display_name) for ep in index.entries()] == [
+        ("bbbb", "Other"),
+        ("aaaa", "u#ep"),
+    ]
+
+    index.discard("AAAA")
+    assert [ep.id for ep in index.entries()] == ["bbbb"]
+
+
+def test_bookmark_index_is_replaced_by_a_full_listing():
+    index = BookmarkIndex()
+    index.replace_all(
+        [{"id": "1", "name": "old", "endpoint_id": "ep1", "path": "/old/"}]
+    )
+    index.replace_all(
+        [
+            {"id": "3", "name": "b", "endpoint_id": "ep2", "path": "/b/"},
+            {"id": "2", "name": "a", "endpoint_id": "ep1", "path": "/a/"},
+        ]
+    )
+    assert [(bm.name, bm.endpoint_id, bm.path) for bm in index.entries()] == [
+        ("a", "ep1", "/a/"),
+        ("b", "ep2", "/b/"),
+    ]
+
+
+def test_endpoint_ids_are_completed_after_endpoint_show(run_line, endpoint_id):
+    assert _complete(["endpoint", "show"], "") == []
+
+    run_line(f"globus endpoint show {endpoint_id}")
+    responses.calls.reset()
+
+    for args in (["endpoint", "show"], ["collection", "delete"]):
+        assert _complete(args, "") == [(endpoint_id, "myserver")]
+        assert _complete(args, endpoint_id[:8]) == [(endpoint_id, "myserver")]
+        assert _complete(args, "ffff") == []
+    # completion makes no requests
+    assert len(responses.calls) == 0
+
+
+def test_endpoint_ids_are_completed_by_name(run_line, endpoint_id):
+    run_line(f"globus endpoint show {endpoint_id}")
+
+    assert _complete(["endpoint", "show"], "MySe") == [(endpoint_id, "myserver")]
+    assert _complete(["endpoint", "show"], "yours") == []
+
+
+def test_endpoint_plus_path_prefixes_are_completed(run_line, endpoint_id):
+    run_line(f"globus endpoint show {endpoint_id}")
+
+    assert _complete(["ls"], "") == [(f"{endpoint_id}:", "myserver")]
+    assert _complete(["ls"], "my") == [(f"{endpoint_id}:", "myserver")]
+
+
+def test_bookmarks_are_completed_after_bookmark_list(run_line):
+    load_response_set("cli.bookmark_list")
+    run_line("globus bookmark list")
+    responses.calls.reset()
+
+    assert _complete(["transfer"], "bm") == [
+        ("1405823f-0597-4a16-b296-46d4f0ae4b15:/home/", "bookmark: bm1"),
+        ("7b123e08-6638-11eb-8282-0275e0cda761:/scratch/projects/foo", "bookmark: bm2"),
+    ]
+    # the endpoints of bookmarks were fetched for their names, so are indexed too
+    assert ("1405823f-0597-4a16-b296-46d4f0ae4b15:", "myserver") in _complete(
+        ["transfer"], ""
+    )
+    assert len(responses.calls) == 0
+
+
+def test_completion_index_can_be_disabled(run_line, endpoint_id, monkeypatch):
+    run_line(f"globus endpoint show {endpoint_id}")
+
+    monkeypatch.setenv("GLOBUS_CLI_DISABLE_CACHE", "1")
+    assert _complete(["endpoint", "show"], "") == []
@@ -1,5 +1,6 @@
 import datetime
 import re
+import threading
 import typing as t
 import uuid
 from unittest import mock
@@ -48,6 +49,8 @@ def patched_tokenstorage(test_token_storage):
                 "a.globus.org": 1,
                 "b.globus.org": 1,
             }
+        elif config_name == "auth_client_data":
+            return {"client_id": "fake_client_id", "client_secret": "fake_secret"}
         else:
             raise NotImplementedError
 
@@ -126,6 +129,30 @@ def test_requires_login_multi_server_success(
     assert dummy_command()
 
 
+def test_requires_login_uses_shared_manager(
+    patch_scope_requirements, patched_tokenstorage, test_click_context
+):
+    @LoginManager.requires_login("a")
+    def dummy_command(login_manager):
+        login_manager.add_requirement("a", ["scopeA3"])
+        return login_manager
+
+    with LoginManager.shared() as shared_manager:
+        assert LoginManager.is_shared()
+        assert dummy_command() is shared_manager
+        assert dict(shared_manager.login_requirements)["a"] == ["scopeA3"]
+
+        # the command's state is discarded when it ends, not the manager
+        click.get_current_context().close()
+        assert "a" not in shared_manager._nonstatic_requirements
+        with pytest.raises(RuntimeError):
+            with LoginManager.shared():
+                pass
+
+    assert not LoginManager.is_shared()
+    assert dummy_command() is not shared_manager
+
+
 def test_requires_login_single_server_fail(
     patch_scope_requirements, patched_tokenstorage, test_click_context
 ):
@@ -304,6 +331,71 @@ def test_client_login_gcs(client_login, add_gcs_login, test_click_context):
         assert dummy_command(collection_id=gcs_id)
 
 
+def test_client_login_gets_all_tokens_in_one_grant(
+    client_login, test_token_storage, mock_login_token_response
+):
+    for rs_name in mock_login_token_response.by_resource_server:
+        test_token_storage.remove_tokens_for_resource_server(rs_name)
+
+    confidential_client = mock.Mock()
+    confidential_client.oauth2_client_credentials_tokens.return_value = (
+        mock_login_token_response
+    )
+    with mock.patch(
+        "globus_cli.login_manager.manager.get_client_login",
+        return_value=confidential_client,
+    ):
+        manager = LoginManager()
+        manager.get_transfer_client()
+        manager.get_auth_client()
+        manager.get_groups_client()
+
+    confidential_client.oauth2_client_credentials_tokens.assert_called_once()
+    requested_scopes = {
+        str(scope)
+        for scope in confidential_client.oauth2_client_credentials_tokens.call_args[1][
+            "requested_scopes"
+        ]
+    }
+    assert {
+        "openid",
+        "urn:globus:auth:scope:transfer.api.globus.org:all",
+        "urn:globus:auth:scope:groups.api.globus.org:all",
+    } <= requested_scopes
+    # the tokens were stored for later use
+    for rs_name in mock_login_token_response.by_resource_server:
+        assert test_token_storage.get_token_data(rs_name) is not None
+
+
+def test_client_login_falls_back_to_separate_grants_on_error(
+    client_login, test_token_storage, mock_login_token_response
+):
+    for rs_name in mock_login_token_response.by_resource_server:
+        test_token_storage.remove_tokens_for_resource_server(rs_name)
+
+    error_response = mock.MagicMock()
+    error_response.status_code = 400
+    error_response.json.return_value = {"error": "invalid_scope"}
+    error_response.headers = {"Content-Type": "application/json"}
+    confidential_client = mock.Mock()
+    transfer_tokens = mock_login_token_response.by_resource_server[
+        "transfer.api.globus.org"
+    ]
+    confidential_client.oauth2_client_credentials_tokens.side_effect = [
+        globus_sdk.AuthAPIError(error_response),
+        mock.Mock(by_resource_server={"transfer.api.globus.org": transfer_tokens}),
+    ]
+    with mock.patch(
+        "globus_cli.login_manager.manager.get_client_login",
+        return_value=confidential_client,
+    ):
+        authorizer = LoginManager()._get_client_authorizer("transfer.api.globus.org")
+
+    assert isinstance(authorizer, globus_sdk.ClientCredentialsAuthorizer)
+    assert authorizer.access_token == "transferAT"
+    assert confidential_client.oauth2_client_credentials_tokens.call_count == 2
+
+
 def test_compute_timer_scope_no_data_access():
     transfer_scope = globus_sdk.scopes.TransferScopes.all
 
@@ -460,3 +552,241 @@ def test_login_manager_closes_created_clients_after_context_exit(test_token_stor
 
     spy1.assert_called_once()
     spy2.assert_called_once()
+
+
+def test_has_login_caches_positive_token_validation(
+    patch_scope_requirements,
+    patched_tokenstorage,
+    disable_login_manager_validate_token,
+):
+    validate = mock.Mock(return_value=True)
+    disable_login_manager_validate_token.setattr(
+        LoginManager, "_validate_token", validate
+    )
+
+    assert LoginManager().has_login("a.globus.org")
+    assert LoginManager().has_login("a.globus.org")
+    validate.assert_called_once_with("fake_a_refresh_token")
+
+    # a different token is validated separately
+    assert LoginManager().has_login("b.globus.org")
+    assert validate.call_count == 2
+
+
+def test_has_login_does_not_cache_failed_token_validation(
+    patch_scope_requirements,
+    patched_tokenstorage,
+    disable_login_manager_validate_token,
+):
+    validate = mock.Mock(return_value=False)
+    disable_login_manager_validate_token.setattr(
+        LoginManager, "_validate_token", validate
+    )
+
+    assert not LoginManager().has_login("a.globus.org")
+    assert not LoginManager().has_login("a.globus.org")
+    assert validate.call_count == 2
+
+
+def test_token_validation_cache_can_be_disabled_with_zero_ttl(
+    patch_scope_requirements,
+    patched_tokenstorage,
+    monkeypatch,
+    disable_login_manager_validate_token,
+):
+    monkeypatch.setenv("GLOBUS_CLI_TOKEN_VALIDATION_TTL", "0")
+    validate = mock.Mock(return_value=True)
+    disable_login_manager_validate_token.setattr(
+        LoginManager, "_validate_token", validate
+    )
+
+    assert LoginManager().has_login("a.globus.org")
+    assert LoginManager().has_login("a.globus.org")
+    assert validate.call_count == 2
+
+
+def test_storing_new_tokens_invalidates_cached_token_validation(
+    test_token_storage, mock_login_token_response, disable_login_manager_validate_token
+):
+    validate = mock.Mock(return_value=True)
+    disable_login_manager_validate_token.setattr(
+        LoginManager, "_validate_token", validate
+    )
+
+    manager = LoginManager()
+    assert manager.has_login("transfer.api.globus.org")
+    assert manager.has_login("transfer.api.globus.org")
+    assert validate.call_count == 1
+
+    manager.storage.store(mock_login_token_response)
+    assert manager.has_login("transfer.api.globus.org")
+    assert validate.call_count == 2
+
+
+def test_assert_logins_validates_tokens_concurrently(
+    patch_scope_requirements,
+    patched_tokenstorage,
+    disable_login_manager_validate_token,
+):
+    # each validation waits for the other, so serial validation would time out
+    barrier = threading.Barrier(2, timeout=5)
+
+    def validate(self, token):
+        barrier.wait()
+        return True
+
+    disable_login_manager_validate_token.setattr(
+        LoginManager, "_validate_token", validate
+    )
+
+    LoginManager().assert_logins("a.globus.org", "b.globus.org")
+
+
+def test_assert_logins_concurrent_validation_reports_invalid_tokens(
+    patch_scope_requirements,
+    patched_tokenstorage,
+    disable_login_manager_validate_token,
+):
+    validate = mock.Mock(side_effect=lambda token: token == "fake_a_refresh_token")
+    disable_login_manager_validate_token.setattr(
+        LoginManager, "_validate_token", validate
+    )
+
+    with pytest.raises(MissingLoginError) as excinfo:
+        LoginManager().assert_logins("a.globus.org", "b.globus.org", "c.globus.org")
+    assert sorted(excinfo.value.missing_servers) == ["b.globus.org", "c.globus.org"]
+    assert validate.call_count == 2
+
+    # only the valid token was cached
+    validate.reset_mock()
+    with pytest.raises(MissingLoginError):
+        LoginManager().assert_logins("a.globus.org", "b.globus.org")
+    validate.assert_called_once_with("fake_b_refresh_token")
+
+
+def test_assert_logins_fetches_consents_concurrently_with_validation(
+    patch_scope_requirements,
+    patched_tokenstorage,
+    disable_login_manager_validate_token,
+    monkeypatch,
+):
+    barrier = threading.Barrier(2, timeout=5)
+
+    def validate(self, token):
+        barrier.wait()
+        return True
+
+    def get_consents(identity_id):
+        barrier.wait()
+        return [_make_consent(1, "scopeA1", [1]), _make_consent(2, "dep", [1, 2])]
+
+    disable_login_manager_validate_token.setattr(
+        LoginManager, "_validate_token", validate
+    )
+    auth_client = mock.Mock()
+    auth_client.get_consents.side_effect = get_consents
+    monkeypatch.setattr(LoginManager, "get_auth_client", lambda self: auth_client)
+    monkeypatch.setattr(
+        LoginManager, "get_current_identity_id", lambda self: "fake_identity_id"
+    )
+
+    manager = LoginManager()
+    manager.add_requirement(
+        "a.globus.org",
+        [
+            globus_sdk.scopes.Scope("scopeA1").with_dependency(
+                globus_sdk.scopes.Scope("dep")
+            )
+        ],
+    )
+    manager.assert_logins("a.globus.org")
+    auth_client.get_consents.assert_called_once_with("fake_identity_id")
+
+
+def _make_consent(consent_id, scope_name, dependency_path):
+    return {
+        "id": consent_id,
+        "scope_name": scope_name,
+        "scope": str(uuid.uuid1()),
+        "dependency_path": dependency_path,
+        "client": str(uuid.uuid1()),
+        "effective_identity": str(uuid.uuid1()),
+        "allows_refresh": True,
+        "atomically_revocable": False,
+        "auto_approved": False,
+        "created": "1970-01-01T00:00:00.000000+00:00",
+        "last_used": "1970-01-01T00:00:00.000000+00:00",
+        "status": "approved",
+        "updated": "1970-01-01T00:00:00.000000+00:00",
+    }
+
+
+@pytest.fixture
+def mock_consents_client(monkeypatch):
+    auth_client = mock.Mock()
+    auth_client.get_consents.return_value = [
+        _make_consent(1, "scopeA1", [1]),
+        _make_consent(2, "dep", [1, 2]),
+    ]
+    monkeypatch.setattr(LoginManager, "get_auth_client", lambda self: auth_client)
+    return auth_client
+
+
+def _add_dependent_requirement(manager):
+    manager.add_requirement(
+        "a.globus.org",
+        [
+            globus_sdk.scopes.Scope("scopeA1").with_dependency(
+                globus_sdk.scopes.Scope("dep")
+            )
+        ],
+    )
+
+
+def test_consent_forest_is_cached_between_invocations(
+    patch_scope_requirements,
+    patched_tokenstorage,
+    mock_consents_client,
+    logged_in_user_id,
+    monkeypatch,
+):
+    monkeypatch.setattr(
+        LoginManager, "get_current_identity_id", lambda self: logged_in_user_id
+    )
+    for _ in range(2):
+        manager = LoginManager()
+        _add_dependent_requirement(manager)
+        assert manager.has_login("a.globus.org")
+    mock_consents_client.get_consents.assert_called_once_with(logged_in_user_id)
+
+
+def test_exchange_code_and_store_clears_cached_consents(
+    patch_scope_requirements,
+    patched_tokenstorage,
+    mock_consents_client,
+    mock_login_token_response,
+    logged_in_user_id,
+    monkeypatch,
+):
+    monkeypatch.setattr(
+        LoginManager, "get_current_identity_id", lambda self: logged_in_user_id
+    )
+    manager = LoginManager()
+    _add_dependent_requirement(manager)
+    assert manager.has_login("a.globus.org")
+
+    mock_login_token_response.decode_id_token.return_value = {"sub": logged_in_user_id}
+    mock_auth_client = mock.MagicMock(spec=globus_sdk.NativeAppAuthClient)
+    mock_auth_client.oauth2_exchange_code_for_tokens.return_value = (
+        mock_login_token_response
+    )
+    with mock.patch(
+        "globus_cli.login_manager.storage.CLIStorage.read_well_known_config",
+        lambda self, name: {"sub": logged_in_user_id},
+    ):
+        exchange_code_and_store(manager.storage, mock_auth_client, "bogus_code")
+
+    manager = LoginManager()
+    _add_dependent_requirement(manager)
+    assert manager.has_login("a.globus.org")
+    assert mock_consents_client.get_consents.call_count == 2
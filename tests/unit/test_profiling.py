@@ -0,0 +1,133 @@
+import http.server
+import threading
+
+import pytest
+import requests
+import responses
+
+from globus_cli import profiling
+from globus_cli.login_manager.connection_pool import SharedConnectionPool
+
+
+class _JSONHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"foo": "bar"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _JSONHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address
+    base_url = f"http://{host}:{port}"
+    responses.add_passthru(base_url)
+    yield base_url
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def profile():
+    with profiling.invocation() as profile:
+        yield profile
+
+
+def _send(transport, url):
+    # send the request as an SDK transport does, without environment settings
+    response = transport.session.send(
+        requests.Request("GET", url).prepare(), verify=True
+    )
+    response.raise_for_status()
+    return response
+
+
+def test_phases_are_recorded_in_the_current_profile(profile):
+    @profiling.timed("do stuff")
+    def do_stuff():
+        return 1
+
+    assert do_stuff() == 1
+    with profiling.get_profile().phase("other stuff"):
+        pass
+
+    assert [phase.name for phase in profile.phases] == ["do stuff", "other stuff"]
+    assert all(phase.duration >= 0 for phase in profile.phases)
+
+
+def test_startup_phases_are_included_in_the_next_profile_only(profile):
+    profiling.record_startup(profile.start)
+
+    with profiling.invocation() as first:
+        assert "import commands" in [phase.name for phase in first.phases]
+    with profiling.invocation() as second:
+        assert second.phases == []
+
+
+def test_concurrent_invocations_have_their_own_profiles():
+    barrier = threading.Barrier(4)
+    profiles = {}
+
+    def invoke(name):
+        with profiling.invocation() as profile:
+            profiles[name] = profile
+            # all of the invocations are running when their phases are recorded
+            barrier.wait(timeout=5)
+            with profiling.get_profile().phase(name):
+                pass
+            barrier.wait(timeout=5)
+
+    threads = [threading.Thread(target=invoke, args=(f"phase {i}",)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(profile) for profile in profiles.values()}) == 4
+    for name, profile in profiles.items():
+        assert [phase.name for phase in profile.phases] == [name]
+
+
+def test_timings_outside_of_an_invocation_are_discarded():
+    with profiling.get_profile().phase("do stuff"):
+        pass
+    assert profiling.get_profile().phases == []
+
+
+def test_requests_are_not_timed_unless_enabled(profile, local_server):
+    pool = SharedConnectionPool()
+    _send(pool.make_transport(), local_server)
+    pool.close()
+
+    assert profile.requests == []
+
+
+def test_requests_and_new_connections_are_timed(profile, local_server):
+    profile.enabled = True
+    pool = SharedConnectionPool()
+    transport = pool.make_transport()
+    for _ in range(2):
+        response = _send(transport, f"{local_server}/foo?bar=baz")
+        assert transport.json_provider.decode_body(response) == {"foo": "bar"}
+    pool.close()
+
+    host = local_server.partition("://")[2]
+    first, second = profile.requests
+    assert (first.method, first.status, first.url) == ("GET", 200, f"{host}/foo")
+    # the connection is opened for the first request, and then reused
+    assert first.connect > 0
+    assert second.connect == 0
+    assert first.tls == second.tls == 0
+    for timing in (first, second):
+        assert timing.json_parse > 0
+        assert timing.duration >= timing.connect + timing.wait + timing.download
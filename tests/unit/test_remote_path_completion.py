@@ -0,0 +1,105 @@
+import uuid
+
+import pytest
+import responses
+from click.shell_completion import ShellComplete
+
+from globus_cli.commands import main
+
+ENDPOINT_ID = str(uuid.UUID(int=1))
+LS_URL = f"https://transfer.api.globus.org/v0.10/operation/endpoint/{ENDPOINT_ID}/ls"
+
+
+def _complete(incomplete):
+    completer = ShellComplete(main, {}, "globus", "_GLOBUS_COMPLETE")
+    return [c.value for c in completer.get_completions(["ls"], incomplete)]
+
+
+@pytest.fixture
+def listing():
+    responses.add(
+        responses.GET,
+        LS_URL,
+        json={
+            "DATA_TYPE": "file_list",
+            "path": "/~/",
+            "DATA": [
+                {"DATA_TYPE": "file", "name": "home", "type": "dir"},
+                {"DATA_TYPE": "file", "name": "hello.txt", "type": "file"},
+                {"DATA_TYPE": "file", "name": ".hidden", "type": "file"},
+                {"DATA_TYPE": "file", "name": "other", "type": "file"},
+            ],
+        },
+    )
+
+
+def _ls_calls():
+    return [c for c in responses.calls if c.request.url.startswith(LS_URL)]
+
+
+def test_completes_paths_in_directory(listing):
+    assert _complete(f"{ENDPOINT_ID}:/data/h") == [
+        f"{ENDPOINT_ID}:/data/hello.txt",
+        f"{ENDPOINT_ID}:/data/home/",
+    ]
+    assert _ls_calls()[0].request.params["path"] == "/data/"
+
+
+def test_hidden_files_only_when_asked_for(listing):
+    assert _complete(f"{ENDPOINT_ID}:/data/.") == [f"{ENDPOINT_ID}:/data/.hidden"]
+
+
+def test_default_directory_is_completed_as_absolute_path(listing):
+    assert _complete(f"{ENDPOINT_ID}:") == [
+        f"{ENDPOINT_ID}:/~/hello.txt",
+        f"{ENDPOINT_ID}:/~/home/",
+        f"{ENDPOINT_ID}:/~/other",
+    ]
+    assert "path" not in _ls_calls()[0].request.params
+
+
+def test_listings_are_cached(listing):
+    _complete(f"{ENDPOINT_ID}:/data/h")
+    assert _complete(f"{ENDPOINT_ID}:/data/o") == [f"{ENDPOINT_ID}:/data/other"]
+    assert len(_ls_calls()) == 1
+
+    # a different directory needs another listing
+    _complete(f"{ENDPOINT_ID}:/data/home/")
+    assert len(_ls_calls()) == 2
+
+
+def test_listing_cache_can_be_disabled(listing, monkeypatch):
+    monkeypatch.setenv("GLOBUS_CLI_LISTING_CACHE_TTL", "0")
+    _complete(f"{ENDPOINT_ID}:/data/h")
+    _complete(f"{ENDPOINT_ID}:/data/h")
+    assert len(_ls_calls()) == 2
+
+
+@pytest.mark.parametrize(
+    "incomplete",
+    (ENDPOINT_ID, f"{ENDPOINT_ID}:relative", "not-a-uuid:/data/"),
+)
+def test_no_completion_without_an_absolute_path(listing, incomplete):
+    assert _complete(incomplete) == []
+    assert _ls_calls() == []
+
+
+def test_no_completion_on_errors():
+    responses.add(
+        responses.GET,
+        LS_URL,
+        status=403,
+        json={"code": "PermissionDenied", "message": "nope", "request_id": "x"},
+    )
+    assert _complete(f"{ENDPOINT_ID}:/data/") == []
+
+
+def test_no_completion_when_offline():
+    # with no registered response, the request fails to connect
+    assert _complete(f"{ENDPOINT_ID}:/data/") == []
+
+
+def test_no_completion_when_not_logged_in(listing, test_token_storage):
+    test_token_storage.remove_tokens_for_resource_server("transfer.api.globus.org")
+    assert _complete(f"{ENDPOINT_ID}:/data/") == []
+    assert _ls_calls() == []
@@ -0,0 +1,112 @@
+import time
+from unittest import mock
+
+import pytest
+
+from globus_cli.login_manager.storage import CLIStorage
+from globus_cli.login_manager.token_refresh import (
+    SingleFlightRefreshTokenAuthorizer,
+    _get_lock_filename,
+    file_lock,
+)
+
+RESOURCE_SERVER = "transfer.api.globus.org"
+
+
+@pytest.fixture
+def storage():
+    storage = CLIStorage()
+    yield storage
+    storage.close()
+
+
+def _token_data(access_token, expires_in, refresh_token="transferRT"):
+    return {
+        "resource_server": RESOURCE_SERVER,
+        "access_token": access_token,
+        "refresh_token": refresh_token,
+        "expires_at_seconds": int(time.time()) + expires_in,
+        "scope": "urn:globus:auth:scope:transfer.api.globus.org:all",
+        "token_type": "Bearer",
+    }
+
+
+def _make_authorizer(storage, auth_client, access_token="oldAT"):
+    return SingleFlightRefreshTokenAuthorizer(
+        "transferRT",
+        auth_client,
+        storage=storage,
+        resource_server=RESOURCE_SERVER,
+        access_token=access_token,
+        expires_at=int(time.time()) - 1,
+        on_refresh=storage.store,
+    )
+
+
+def _mock_auth_client(access_token="refreshedAT"):
+    auth_client = mock.Mock()
+    auth_client.oauth2_refresh_token.return_value = mock.Mock(
+        by_resource_server={RESOURCE_SERVER: _token_data(access_token, 3600)}
+    )
+    return auth_client
+
+
+def test_file_lock_is_exclusive(tmp_path):
+    filename = str(tmp_path / "test.lock")
+    with file_lock(filename, timeout=1) as acquired:
+        assert acquired
+        with file_lock(filename, timeout=0.1) as acquired_again:
+            assert not acquired_again
+    with file_lock(filename, timeout=0.1) as acquired:
+        assert acquired
+
+
+def test_refresh_uses_token_stored_by_another_process(storage):
+    storage.store(
+        mock.Mock(by_resource_server={RESOURCE_SERVER: _token_data("newAT", 3600)})
+    )
+    auth_client = _mock_auth_client()
+
+    authorizer = _make_authorizer(storage, auth_client)
+    assert authorizer.get_authorization_header() == "Bearer newAT"
+    auth_client.oauth2_refresh_token.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "stored_tokens",
+    (
+        # the stored token is the one which needs to be replaced
+        _token_data("oldAT", 3600),
+        # the stored token has expired
+        _token_data("newAT", 30),
+        # the stored token belongs to a different login
+        _token_data("newAT", 3600, refresh_token="otherRT"),
+    ),
+)
+def test_refresh_ignores_unusable_stored_tokens(storage, stored_tokens):
+    storage.store(mock.Mock(by_resource_server={RESOURCE_SERVER: stored_tokens}))
+    auth_client = _mock_auth_client()
+
+    authorizer = _make_authorizer(storage, auth_client)
+    assert authorizer.get_authorization_header() == "Bearer refreshedAT"
+    auth_client.oauth2_refresh_token.assert_called_once_with("transferRT")
+    assert storage.adapter.get_token_data(RESOURCE_SERVER)["access_token"] == (
+        "refreshedAT"
+    )
+
+
+def test_refresh_proceeds_when_the_lock_is_not_released(storage, monkeypatch):
+    monkeypatch.setattr(
+        "globus_cli.login_manager.token_refresh.REFRESH_LOCK_TIMEOUT", 0.1
+    )
+    storage.store(
+        mock.Mock(by_resource_server={RESOURCE_SERVER: _token_data("oldAT", 3600)})
+    )
+    auth_client = _mock_auth_client()
+    authorizer = _make_authorizer(storage, auth_client)
+
+    lock_filename = _get_lock_filename(storage.adapter.namespace, RESOURCE_SERVER)
+    with file_lock(lock_filename, timeout=1) as acquired:
+        assert acquired
+        assert authorizer.get_authorization_header() == "Bearer refreshedAT"
+    auth_client.oauth2_refresh_token.assert_called_once()
@@ -1,9 +1,18 @@
+import sqlite3
 import uuid
+from unittest import mock
 
 import globus_sdk
+import pytest
 from globus_sdk.testing import RegisteredResponse, get_last_request
+from globus_sdk.token_storage.legacy import SQLiteAdapter
 
-from globus_cli.login_manager.storage import CLIStorage, _resolve_namespace
+from globus_cli.login_manager.concurrent_adapter import ConcurrentSQLiteAdapter
+from globus_cli.login_manager.storage import (
+    CLIStorage,
+    _get_storage_mode,
+    _resolve_namespace,
+)
 
 
 def test_default_namespace():
@@ -79,3 +88,86 @@ def test_storage_creates_fresh_client_after_delete():
     last_req = get_last_request()
     assert last_req.method == "POST"
     assert last_req.url.endswith("/v2/api/clients")
+
+
+@pytest.fixture
+def storage_file(tmp_path):
+    filename = str(tmp_path / "storage.db")
+    adapter = SQLiteAdapter(filename, namespace="ns")
+    adapter.store(
+        mock.Mock(
+            by_resource_server={
+                "a.globus.org": {"refresh_token": "aRT"},
+                "b.globus.org": {"refresh_token": "bRT"},
+            }
+        )
+    )
+    adapter.store_config("some_config", {"x": 1})
+    adapter.close()
+    return filename
+
+
+def test_storage_mode(monkeypatch):
+    assert _get_storage_mode() == "default"
+    monkeypatch.setenv("GLOBUS_CLI_STORAGE_MODE", "Concurrent")
+    assert _get_storage_mode() == "concurrent"
+    monkeypatch.setenv("GLOBUS_CLI_STORAGE_MODE", "bogus")
+    with pytest.raises(ValueError, match="GLOBUS_CLI_STORAGE_MODE"):
+        _get_storage_mode()
+
+
+def test_concurrent_adapter_reads_existing_storage_read_only(storage_file):
+    adapter = ConcurrentSQLiteAdapter(storage_file, namespace="ns")
+    queries = []
+    adapter._connection.set_trace_callback(queries.append)
+
+    assert adapter.get_token_data("a.globus.org") == {"refresh_token": "aRT"}
+    assert adapter.get_token_data("b.globus.org") == {"refresh_token": "bRT"}
+    assert adapter.get_token_data("c.globus.org") is None
+    assert adapter.read_config("some_config") == {"x": 1}
+    assert adapter.read_config("other_config") is None
+    # all of the data was read at once
+    assert len(queries) == 1
+
+    with pytest.raises(sqlite3.OperationalError, match="readonly"):
+        adapter._connection.execute("DELETE FROM token_storage")
+    adapter.close()
+
+
+def test_concurrent_adapter_returns_new_dicts(storage_file):
+    adapter = ConcurrentSQLiteAdapter(storage_file, namespace="ns")
+    adapter.read_config("some_config")["x"] = 2
+    assert adapter.read_config("some_config") == {"x": 1}
+    adapter.close()
+
+
+def test_concurrent_adapter_writes_use_wal_journaling(storage_file):
+    adapter = ConcurrentSQLiteAdapter(storage_file, namespace="ns")
+    assert adapter.read_config("some_config") == {"x": 1}
+
+    adapter.store_config("some_config", {"x": 2})
+    assert adapter.read_config("some_config") == {"x": 2}
+    adapter.store(
+        mock.Mock(by_resource_server={"c.globus.org": {"refresh_token": "cRT"}})
+    )
+    assert adapter.get_token_data("c.globus.org") == {"refresh_token": "cRT"}
+    assert adapter.remove_tokens_for_resource_server("a.globus.org")
+    assert adapter.get_token_data("a.globus.org") is None
+
+    (journal_mode,) = adapter._connection.execute("PRAGMA journal_mode").fetchone()
+    assert journal_mode == "wal"
+    adapter.close()
+
+    # the data is visible to the SDK's adapter
+    adapter = SQLiteAdapter(storage_file, namespace="ns")
+    assert adapter.read_config("some_config") == {"x": 2}
+    assert adapter.get_token_data("c.globus.org") == {"refresh_token": "cRT"}
+    adapter.close()
+
+
+def test_concurrent_adapter_creates_new_storage(tmp_path):
+    adapter = ConcurrentSQLiteAdapter(str(tmp_path / "storage.db"), namespace="ns")
+    assert adapter.get_token_data("a.globus.org") is None
+    adapter.store_config("some_config", {"x": 1})
+    assert adapter.read_config("some_config") == {"x": 1}
+    adapter.close()